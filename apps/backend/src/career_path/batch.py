@@ -0,0 +1,152 @@
+"""Batch roadmap generation with a bounded worker pool."""
+
+import asyncio
+import logging
+from typing import Any, AsyncIterator, Awaitable, Callable, Iterable, TypeVar
+
+from .graph.checkpoint import run_workflow
+from .graph.nodes import job_parser_node
+from .graph.workflow import FAST
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+async def run_bounded(
+    items: Iterable[T],
+    worker: Callable[[int, T], Awaitable[R]],
+    concurrency: int
+) -> AsyncIterator[tuple[int, R | Exception]]:
+    """Run ``worker`` over items with at most ``concurrency`` in flight.
+
+    Results are yielded as soon as each item finishes (not in input order),
+    so callers can stream them without holding the whole batch in memory.
+
+    Args:
+        items: Items to process
+        worker: Coroutine function taking (index, item)
+        concurrency: Maximum number of items processed at once
+
+    Yields:
+        Tuples of (index, result), where result is the exception on failure
+    """
+    iterator = iter(enumerate(items))
+    pending: dict[asyncio.Task, int] = {}
+
+    def start_next() -> bool:
+        try:
+            index, item = next(iterator)
+        except StopIteration:
+            return False
+        pending[asyncio.ensure_future(worker(index, item))] = index
+        return True
+
+    try:
+        while len(pending) < concurrency and start_next():
+            pass
+
+        while pending:
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                index = pending.pop(task)
+                try:
+                    yield index, task.result()
+                except Exception as e:
+                    yield index, e
+                start_next()
+    finally:
+        # Client went away or caller stopped early
+        for task in pending:
+            task.cancel()
+
+
+class JobRequirementsMemo:
+    """Parse each (job title, description, focus) once per batch."""
+
+    def __init__(self):
+        self._parsed: dict[tuple, asyncio.Future] = {}
+        self.calls = 0
+
+    async def get(
+        self,
+        job_title: str,
+        job_description: str | None,
+        specialty_info: str | None
+    ) -> tuple[list[str], list[str]]:
+        """Get (required, nice_to_have) skills for a job, parsing on first use."""
+        key = (job_title, job_description, specialty_info)
+        future = self._parsed.get(key)
+        if future is None:
+            future = asyncio.get_running_loop().create_future()
+            self._parsed[key] = future
+            self.calls += 1
+            try:
+                result = await asyncio.to_thread(job_parser_node, {
+                    "target_jobs": [job_title],
+                    "job_description": job_description,
+                    "specialty_info": specialty_info
+                })
+                future.set_result((
+                    result["required_skills"].get(job_title, []),
+                    result["nice_to_have_skills"].get(job_title, [])
+                ))
+            except asyncio.CancelledError:
+                future.cancel()
+                del self._parsed[key]
+                raise
+            except Exception as e:
+                future.set_exception(e)
+        return await asyncio.shield(future)
+
+    async def prefill(self, state: dict[str, Any]) -> dict[str, Any]:
+        """Fill a workflow state's job requirements from the memo."""
+        parsed = await asyncio.gather(*(
+            self.get(job, state.get("job_description"), state.get("specialty_info"))
+            for job in state["target_jobs"]
+        ))
+        state["required_skills"] = {
+            job: required for job, (required, _) in zip(state["target_jobs"], parsed)
+        }
+        state["nice_to_have_skills"] = {
+            job: nice for job, (_, nice) in zip(state["target_jobs"], parsed)
+        }
+        return state
+
+
+async def generate_batch(
+    states: Iterable[dict[str, Any]],
+    workflow,
+    concurrency: int,
+    execute: Callable[[dict[str, Any]], Awaitable[dict]] | None = None
+) -> AsyncIterator[tuple[int, dict | Exception]]:
+    """Run the workflow over many initial states.
+
+    Job titles shared across the batch are parsed once; the workflow's job
+    parser then reuses the prefilled requirements. Fast-mode items are not
+    prefilled, since their fused call infers the requirements anyway.
+
+    Args:
+        states: Initial workflow states
+        workflow: Compiled workflow
+        concurrency: Maximum concurrent workflow runs
+        execute: Coroutine running one state (default: invoke in a thread)
+
+    Yields:
+        Tuples of (index, final state or exception)
+    """
+    memo = JobRequirementsMemo()
+    if execute is None:
+        async def execute(state: dict[str, Any]) -> dict:
+            return await asyncio.to_thread(run_workflow, workflow, state)
+
+    async def run(index: int, state: dict[str, Any]) -> dict:
+        if state.get("mode") != FAST:  # The fused call infers requirements itself
+            state = await memo.prefill(state)
+        return await execute(state)
+
+    async for index, result in run_bounded(states, run, concurrency):
+        yield index, result
+
+    logger.info(f"Batch finished with {memo.calls} job parsing calls")
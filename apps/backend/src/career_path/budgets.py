@@ -0,0 +1,94 @@
+"""Adaptive per-node output token budgets."""
+
+import math
+import threading
+from collections import deque
+from typing import Any, Deque, Dict
+
+from .constants import (
+    MAX_TOKENS,
+    NODE_MAX_TOKENS,
+    OUTPUT_BUDGET_FLOOR,
+    OUTPUT_BUDGET_HEADROOM,
+    OUTPUT_BUDGET_MIN_SAMPLES,
+    OUTPUT_BUDGET_WINDOW,
+)
+
+
+class OutputBudget:
+    """Tracks output lengths per node and derives each node's max_tokens.
+
+    Until a node has ``min_samples`` observations its configured default is
+    used. After that the budget is the 95th percentile of the recent output
+    lengths times ``headroom``, kept between ``floor`` and ``ceiling``.
+    """
+
+    def __init__(
+        self,
+        defaults: Dict[str, int] | None = None,
+        window: int = OUTPUT_BUDGET_WINDOW,
+        min_samples: int = OUTPUT_BUDGET_MIN_SAMPLES,
+        headroom: float = OUTPUT_BUDGET_HEADROOM,
+        floor: int = OUTPUT_BUDGET_FLOOR,
+        ceiling: int = MAX_TOKENS
+    ):
+        """Initialize the budgets.
+
+        Args:
+            defaults: Node -> budget used before enough samples (else ceiling)
+            window: Number of recent outputs kept per node
+            min_samples: Observations needed before adapting
+            headroom: Multiplier applied to the observed p95
+            floor: Smallest budget ever returned
+            ceiling: Largest budget ever returned (also the continuation budget)
+        """
+        self._defaults = defaults or {}
+        self._window = window
+        self._min_samples = min_samples
+        self._headroom = headroom
+        self._floor = floor
+        self.ceiling = ceiling
+        self._samples: Dict[str, Deque[int]] = {}
+        self._truncations: Dict[str, int] = {}
+        self._lock = threading.Lock()
+
+    def max_tokens(self, node: str) -> int:
+        """Current output budget for a node."""
+        with self._lock:
+            samples = sorted(self._samples.get(node, ()))
+        if len(samples) < self._min_samples:
+            return min(self._defaults.get(node, self.ceiling), self.ceiling)
+        p95 = samples[min(len(samples) - 1, math.ceil(0.95 * len(samples)) - 1)]
+        return max(self._floor, min(self.ceiling, math.ceil(p95 * self._headroom)))
+
+    def record(self, node: str, tokens: int, truncated: bool = False) -> None:
+        """Record the output length of a completed call.
+
+        Args:
+            node: Node name
+            tokens: Output tokens of the full answer (including any continuation)
+            truncated: Whether the first call hit its budget
+        """
+        with self._lock:
+            self._samples.setdefault(node, deque(maxlen=self._window)).append(tokens)
+            if truncated:
+                self._truncations[node] = self._truncations.get(node, 0) + 1
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Current budget, sample count and truncations per node."""
+        with self._lock:
+            nodes = sorted(self._samples)
+            counts = {node: len(self._samples[node]) for node in nodes}
+            truncations = dict(self._truncations)
+        return {
+            node: {
+                "max_tokens": self.max_tokens(node),
+                "samples": counts[node],
+                "truncations": truncations.get(node, 0)
+            }
+            for node in nodes
+        }
+
+
+# Global output budget tracker
+output_budget = OutputBudget(NODE_MAX_TOKENS)
@@ -1,29 +1,36 @@
 """Simple caching for LLM responses."""
 
 import hashlib
-import json
-from typing import Optional, Dict, Any
-from datetime import datetime, timedelta, UTC
+from collections import OrderedDict
+from datetime import UTC, datetime, timedelta
+from typing import Any, Dict, Optional
 
 
 class ResponseCache:
-    """In-memory cache for LLM responses."""
+    """In-memory cache for LLM responses.
     
-    def __init__(self, ttl_minutes: int = 60):
+    Also used as the backend for other short-lived stores (idempotency
+    records, extraction results); ``model`` then acts as a namespace.
+    """
+    
+    def __init__(self, ttl_minutes: int = 60, max_entries: Optional[int] = None):
         """Initialize cache with TTL.
         
         Args:
             ttl_minutes: Time to live in minutes
+            max_entries: Optional size bound; least recently used entries are evicted
         """
-        self._cache: Dict[str, Dict[str, Any]] = {}
+        self._cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
         self._ttl = timedelta(minutes=ttl_minutes)
+        self._max_entries = max_entries
+        self._evictions = 0
     
     def _generate_key(self, prompt: str, model: str = "default") -> str:
         """Generate cache key from prompt and model."""
         content = f"{model}:{prompt}"
         return hashlib.sha256(content.encode()).hexdigest()
     
-    def get(self, prompt: str, model: str = "default") -> Optional[str]:
+    def get(self, prompt: str, model: str = "default") -> Optional[Any]:
         """Get cached response if available and not expired.
         
         Args:
@@ -46,9 +53,10 @@ class ResponseCache:
             return None
         
         entry["hits"] += 1
+        self._cache.move_to_end(key)
         return entry["response"]
     
-    def set(self, prompt: str, response: str, model: str = "default") -> None:
+    def set(self, prompt: str, response: Any, model: str = "default") -> None:
         """Cache a response.
         
         Args:
@@ -62,6 +70,16 @@ class ResponseCache:
             "timestamp": datetime.now(UTC),
             "hits": 0
         }
+        self._cache.move_to_end(key)
+        
+        if self._max_entries is not None:
+            while len(self._cache) > self._max_entries:
+                self._cache.popitem(last=False)
+                self._evictions += 1
+    
+    def delete(self, prompt: str, model: str = "default") -> None:
+        """Remove a cached response if present."""
+        self._cache.pop(self._generate_key(prompt, model), None)
     
     def clear(self) -> None:
         """Clear all cached entries."""
@@ -85,7 +103,9 @@ class ResponseCache:
             "total_entries": len(self._cache),
             "active_entries": active_entries,
             "total_hits": total_hits,
-            "ttl_minutes": self._ttl.total_seconds() / 60
+            "ttl_minutes": self._ttl.total_seconds() / 60,
+            "max_entries": self._max_entries,
+            "evictions": self._evictions
         }
     
     def cleanup_expired(self) -> int:
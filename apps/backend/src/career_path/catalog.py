@@ -0,0 +1,58 @@
+"""Static learning-resources catalog indexed by canonical skill."""
+
+import json
+import logging
+import os
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+from .skills import canonical_skill
+
+logger = logging.getLogger(__name__)
+
+# Curated catalog shipped with the package
+CATALOG_PATH = Path(__file__).parent / "data" / "learning_catalog.json"
+
+# Recommendation lists kept per skill
+CATALOG_FIELDS = ("courses", "projects", "certifications")
+
+
+class LearningCatalog:
+    """In-memory index of courses, projects and certifications per skill.
+
+    Each entry is reachable by its skill name and any of its aliases, so
+    "K8s" and "kubernetes" resolve to the same entry.
+    """
+
+    def __init__(self, entries: Dict[str, Dict[str, Any]]):
+        """Build the index.
+
+        Args:
+            entries: Skill name -> entry with recommendation lists and optional ``aliases``
+        """
+        self._index: Dict[str, Dict[str, list]] = {}
+        for skill, entry in entries.items():
+            recommendations = {field: entry.get(field, []) for field in CATALOG_FIELDS}
+            for name in [skill, *entry.get("aliases", [])]:
+                self._index[canonical_skill(name)] = recommendations
+
+    @classmethod
+    def load(cls, path: Path | str) -> "LearningCatalog":
+        """Load a catalog from a JSON file (empty if missing or invalid)."""
+        try:
+            with open(path) as f:
+                return cls(json.load(f))
+        except (OSError, ValueError) as e:
+            logger.warning(f"Learning catalog unavailable at {path}: {e}")
+            return cls({})
+
+    def get(self, skill: str) -> Optional[Dict[str, list]]:
+        """Get catalog recommendations for a skill, if covered."""
+        return self._index.get(canonical_skill(skill))
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+
+# Global catalog instance, loaded once at import
+learning_catalog = LearningCatalog.load(os.getenv("LEARNING_CATALOG_PATH", CATALOG_PATH))
@@ -0,0 +1,240 @@
+"""Offline batch runner for the career path workflow.
+
+Usage:
+    career-path-batch resumes/ --job "Cloud Architect" --output results.jsonl
+    career-path-batch inputs.jsonl --output results.jsonl --workers 8
+
+Inputs are streamed from a directory of resume files (``*.txt``/``*.md``) or
+a JSONL file with one ``{"id", "resume_text", "target_jobs", ...}`` object per
+line. Each finished roadmap is appended to the output JSONL and its input id
+to a checkpoint file, so re-running the same command after a crash skips
+inputs that already finished. Failed inputs (including workflow runs that end
+with an ``error`` and malformed JSONL lines) are written to the output but
+not checkpointed, so they are retried on the next run.
+"""
+
+import argparse
+import json
+import logging
+import sys
+from concurrent.futures import FIRST_COMPLETED, Executor, Future, ProcessPoolExecutor, wait
+from pathlib import Path
+from typing import Callable, Iterator
+
+from .graph.state import create_initial_state
+from .graph.workflow import create_workflow
+
+logger = logging.getLogger(__name__)
+
+RESUME_SUFFIXES = {".txt", ".md"}
+
+# Final state fields written for each roadmap (mirrors RoadmapResponse)
+RESULT_FIELDS = (
+    "nodes", "edges", "milestones", "skill_gaps", "courses", "projects",
+    "certifications", "fit_score", "job_fit_scores", "matched_skills", "critical_review", "error",
+)
+
+# Workflow instance for the current worker process
+_worker_workflow = None
+
+
+def iter_inputs(
+    source: Path,
+    target_jobs: list[str],
+    job_description: str | None = None,
+    specialty_info: str | None = None
+) -> Iterator[dict]:
+    """Stream input items from a directory of resumes or a JSONL file.
+
+    Args:
+        source: Directory of resume files or a ``.jsonl`` file
+        target_jobs: Default target jobs for items that don't set their own
+        job_description: Default job posting text
+        specialty_info: Default career focus
+
+    Yields:
+        Dicts with ``id``, ``resume_text``, ``target_jobs`` and optional fields;
+        a malformed JSONL line yields ``{"id", "input_error"}`` instead
+    """
+    defaults = {
+        "target_jobs": target_jobs,
+        "job_description": job_description,
+        "specialty_info": specialty_info,
+        "user_id": "batch",
+    }
+    if source.is_dir():
+        for path in sorted(source.rglob("*")):
+            if path.is_file() and path.suffix.lower() in RESUME_SUFFIXES:
+                yield {
+                    **defaults,
+                    "id": str(path.relative_to(source)),
+                    "resume_text": path.read_text(encoding="utf-8"),
+                }
+        return
+
+    with source.open(encoding="utf-8") as f:
+        for line_number, line in enumerate(f, start=1):
+            if not line.strip():
+                continue
+            try:
+                record = json.loads(line)
+                if not isinstance(record, dict):
+                    raise ValueError("expected a JSON object")
+            except ValueError as e:  # JSONDecodeError is a ValueError
+                yield {"id": str(line_number), "input_error": f"Invalid input on line {line_number}: {e}"}
+                continue
+            item = {**defaults, **{k: v for k, v in record.items() if v is not None}}
+            item.setdefault("id", str(line_number))
+            item["id"] = str(item["id"])
+            yield item
+
+
+def load_checkpoint(path: Path) -> set[str]:
+    """Read the ids of inputs that already finished."""
+    if not path.exists():
+        return set()
+    with path.open(encoding="utf-8") as f:
+        return {line.rstrip("\n") for line in f if line.strip()}
+
+
+def _init_worker() -> None:
+    """Create one workflow per worker process."""
+    global _worker_workflow
+    logging.basicConfig(level=logging.WARNING)
+    _worker_workflow = create_workflow()
+
+
+def _run_one(item: dict) -> dict:
+    """Run the workflow for one input item inside a worker."""
+    if not item.get("target_jobs"):
+        raise ValueError("No target jobs given")
+    state = create_initial_state(
+        resume_text=item["resume_text"].strip(),
+        target_jobs=item["target_jobs"],
+        job_description=item.get("job_description"),
+        specialty_info=item.get("specialty_info"),
+        user_id=item.get("user_id", "batch"),
+    )
+    result = _worker_workflow.invoke(state)
+    return {field: result.get(field) for field in RESULT_FIELDS}
+
+
+def run_batch(
+    items: Iterator[dict],
+    output_path: Path,
+    checkpoint_path: Path,
+    workers: int,
+    executor_factory: Callable[..., Executor] = ProcessPoolExecutor
+) -> dict[str, int]:
+    """Run the workflow over all pending items.
+
+    At most ``2 * workers`` items are in flight, so memory stays flat for
+    arbitrarily large inputs.
+
+    Args:
+        items: Input items (see ``iter_inputs``)
+        output_path: JSONL file results are appended to
+        checkpoint_path: File finished input ids are appended to
+        workers: Number of worker processes
+        executor_factory: Executor class, overridable for tests
+
+    Returns:
+        Counts of completed, failed and skipped items
+    """
+    done = load_checkpoint(checkpoint_path)
+    stats = {"completed": 0, "failed": 0, "skipped": 0}
+    max_in_flight = workers * 2
+
+    with executor_factory(max_workers=workers, initializer=_init_worker) as executor, \
+            output_path.open("a", encoding="utf-8") as output, \
+            checkpoint_path.open("a", encoding="utf-8") as checkpoint:
+        pending: dict[Future, str] = {}
+
+        def write(record: dict) -> None:
+            output.write(json.dumps(record) + "\n")
+            output.flush()
+            if record["status"] == "ok":
+                checkpoint.write(record["id"] + "\n")
+                checkpoint.flush()
+                stats["completed"] += 1
+            else:
+                stats["failed"] += 1
+
+        def drain(block_until: int) -> None:
+            while len(pending) > block_until:
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                for future in finished:
+                    item_id = pending.pop(future)
+                    try:
+                        roadmap = future.result()
+                    except Exception as e:
+                        logger.error(f"Input {item_id} failed: {e}")
+                        write({"id": item_id, "status": "error", "error": str(e)})
+                        continue
+                    if roadmap.get("error"):  # Nodes record LLM failures instead of raising
+                        logger.error(f"Input {item_id} failed: {roadmap['error']}")
+                        write({"id": item_id, "status": "error", "error": roadmap["error"],
+                               "roadmap": roadmap})
+                    else:
+                        write({"id": item_id, "status": "ok", "roadmap": roadmap})
+
+        for item in items:
+            if "input_error" in item:
+                logger.error(item["input_error"])
+                write({"id": item["id"], "status": "error", "error": item["input_error"]})
+                continue
+            if item["id"] in done:
+                stats["skipped"] += 1
+                continue
+            done.add(item["id"])  # Guard against duplicate ids in the input
+            pending[executor.submit(_run_one, item)] = item["id"]
+            drain(max_in_flight - 1)
+
+        drain(0)
+
+    return stats
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Command line entry point."""
+    parser = argparse.ArgumentParser(
+        prog="career-path-batch",
+        description="Generate career roadmaps for a directory or JSONL file of resumes."
+    )
+    parser.add_argument("input", type=Path, help="Directory of resume files or a .jsonl file")
+    parser.add_argument("--output", "-o", type=Path, required=True, help="Results JSONL file")
+    parser.add_argument("--checkpoint", type=Path, help="Checkpoint file (default: <output>.done)")
+    parser.add_argument("--job", dest="jobs", action="append", default=[],
+                        help="Target job title (repeatable); default for inputs without target_jobs")
+    parser.add_argument("--job-description", type=Path, help="File with job posting text")
+    parser.add_argument("--specialty", help="Career focus/constraints")
+    parser.add_argument("--workers", type=int, default=4, help="Worker processes (default: 4)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(
+        level=logging.INFO,
+        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+    )
+
+    if not args.input.exists():
+        parser.error(f"Input not found: {args.input}")
+    if args.input.is_dir() and not args.jobs:
+        parser.error("--job is required when reading a directory of resumes")
+    if args.workers < 1:
+        parser.error("--workers must be at least 1")
+
+    job_description = args.job_description.read_text(encoding="utf-8") if args.job_description else None
+    checkpoint = args.checkpoint or args.output.with_name(args.output.name + ".done")
+
+    items = iter_inputs(args.input, args.jobs, job_description, args.specialty)
+    stats = run_batch(items, args.output, checkpoint, args.workers)
+
+    logger.info(
+        f"Batch complete: {stats['completed']} completed, {stats['failed']} failed, "
+        f"{stats['skipped']} skipped (already done)"
+    )
+    return 1 if stats["failed"] else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
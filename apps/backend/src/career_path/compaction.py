@@ -0,0 +1,172 @@
+"""Token-budgeted resume compaction for the resume analyzer prompt."""
+
+import math
+import re
+from typing import Any, Dict, List
+
+from .constants import RESUME_TOKEN_BUDGET
+from .extractor import skill_extractor
+
+# Known section headings -> section kind
+SECTION_HEADINGS = {
+    "summary": "summary", "profile": "summary", "objective": "summary", "about": "summary",
+    "about me": "summary", "professional summary": "summary",
+    "skills": "skills", "technical skills": "skills", "core skills": "skills",
+    "technologies": "skills", "tools": "skills", "core competencies": "skills",
+    "experience": "experience", "work experience": "experience",
+    "professional experience": "experience", "employment": "experience",
+    "employment history": "experience", "work history": "experience",
+    "projects": "projects", "personal projects": "projects", "selected projects": "projects",
+    "certifications": "certifications", "certificates": "certifications", "licenses": "certifications",
+    "education": "education",
+    "publications": "other", "awards": "other", "volunteering": "other",
+    "interests": "filler", "hobbies": "filler", "references": "filler",
+    "contact": "filler", "personal details": "filler",
+}
+
+# Base value of a line by section (before skill mentions)
+SECTION_WEIGHTS = {
+    "skills": 3.0, "experience": 2.0, "projects": 2.0, "certifications": 2.0,
+    "summary": 1.0, "education": 0.5, "other": 0.5, "header": 0.25,
+}
+
+# Lines that never carry skill information
+_FILLER = re.compile(
+    r"references (are )?available|available upon request|curriculum vitae|^page \d+"
+    r"|@[\w-]+\.\w|https?://|linkedin\.com|github\.com/"
+    r"|(\+\d{1,3}[\s.-]?)?\(?\d{3}\)?[\s.-]\d{3}[\s.-]\d{4}",
+    re.IGNORECASE
+)
+_BULLET = re.compile(r"^[\s\-*•·▪◦>]+")
+_SENTENCE_END = re.compile(r"(?<=[.;!?])\s+|\s+[•·▪◦|]\s+")
+
+# Longer lines (e.g. a resume pasted as one paragraph) are split into
+# sentences, and sentences into word runs of at most this size
+MAX_PIECE_TOKENS = 60
+_YEARS = re.compile(r"\b(19|20)\d{2}\b|\b\d+\+?\s*(years?|yrs?)\b", re.IGNORECASE)
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (about four characters per token)."""
+    return math.ceil(len(text) / 4)
+
+
+def _heading(line: str) -> str | None:
+    """Section kind if the line is a heading."""
+    key = line.strip().rstrip(":").strip().lower()
+    return SECTION_HEADINGS.get(key) if len(key) <= 40 else None
+
+
+def _pieces(line: str) -> List[str]:
+    """Split an overlong line into sentences and bounded word runs."""
+    if estimate_tokens(line) <= MAX_PIECE_TOKENS:
+        return [line]
+    pieces = []
+    for sentence in _SENTENCE_END.split(line):
+        words = sentence.split()
+        run: List[str] = []
+        for word in words:
+            if run and estimate_tokens(" ".join(run + [word])) > MAX_PIECE_TOKENS:
+                pieces.append(" ".join(run))
+                run = []
+            run.append(word)
+        if run:
+            pieces.append(" ".join(run))
+    return pieces
+
+
+def _lines(text: str) -> List[Dict[str, Any]]:
+    """Split into cleaned, de-duplicated lines tagged with their section."""
+    lines = []
+    seen = set()
+    section = "header"
+    for raw in text.splitlines():
+        line = " ".join(_BULLET.sub("", raw).split())
+        if not line:
+            continue
+        kind = _heading(line)
+        if kind:
+            section = kind
+            continue
+        if section == "filler":
+            continue
+        for piece in _pieces(line):
+            key = piece.lower()
+            if key in seen or _FILLER.search(piece):
+                continue
+            seen.add(key)
+            lines.append({"text": piece, "section": section, "skills": skill_extractor.extract(piece)})
+    return lines
+
+
+def compact_resume(text: str, budget: int = RESUME_TOKEN_BUDGET) -> Dict[str, Any]:
+    """Fit a resume into a token budget, keeping its most skill-dense content.
+
+    Section headings, filler sections (references, interests) and contact
+    lines are dropped and repeated lines removed. Overlong lines, such as a
+    resume pasted as a single paragraph, are split into sentences first. Lines are then packed by
+    value per token: every taxonomy skill gets at least one line, then the
+    remaining budget goes to the densest skills/experience lines. Skills
+    whose lines did not fit are listed on a final line, so no known skill
+    is lost. Resumes already within budget are returned unchanged.
+
+    Args:
+        text: Resume text
+        budget: Target size in estimated tokens
+
+    Returns:
+        Dict with ``text``, ``original_tokens``, ``compacted_tokens`` and ``tokens_saved``
+    """
+    original_tokens = estimate_tokens(text)
+    if original_tokens <= budget:
+        return {
+            "text": text,
+            "original_tokens": original_tokens,
+            "compacted_tokens": original_tokens,
+            "tokens_saved": 0
+        }
+
+    lines = _lines(text)
+    for line in lines:
+        line["tokens"] = estimate_tokens(line["text"]) + 1  # Newline
+        value = SECTION_WEIGHTS.get(line["section"], 0.5) + 2 * len(line["skills"])
+        if _YEARS.search(line["text"]):
+            value += 1  # Dates and durations feed the experience estimate
+        line["density"] = value / line["tokens"]
+
+    kept = set()
+    used = 0
+    covered = set()
+    # First cover each skill with its densest line, then fill by density
+    by_density = sorted(range(len(lines)), key=lambda i: -lines[i]["density"])
+    for i in by_density:
+        new_skills = set(lines[i]["skills"]) - covered
+        if new_skills and used + lines[i]["tokens"] <= budget:
+            kept.add(i)
+            used += lines[i]["tokens"]
+            covered |= new_skills
+    for i in by_density:
+        if i not in kept and used + lines[i]["tokens"] <= budget:
+            kept.add(i)
+            used += lines[i]["tokens"]
+            covered |= set(lines[i]["skills"])
+
+    out = [lines[i]["text"] for i in sorted(kept)]
+    if not out:
+        # Nothing could be packed: keep the start, as plain truncation would
+        out = [" ".join(text.split())[:budget * 4]]
+        covered = set(skill_extractor.extract(out[0]))
+    missing = []
+    for line in lines:
+        missing.extend(skill for skill in line["skills"] if skill not in covered and skill not in missing)
+    if missing:
+        out.append(f"Additional skills: {', '.join(missing)}")
+
+    compacted = "\n".join(out)
+    compacted_tokens = estimate_tokens(compacted)
+    return {
+        "text": compacted,
+        "original_tokens": original_tokens,
+        "compacted_tokens": compacted_tokens,
+        "tokens_saved": max(0, original_tokens - compacted_tokens)
+    }
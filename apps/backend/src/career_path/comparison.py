@@ -1,6 +1,9 @@
 """Career path comparison utilities."""
 
-from typing import List, Dict, Set
+from typing import Dict, List, Set
+
+from .gap_engine import iter_skill_ids, to_bitset
+from .skills import SkillTable, skill_vocabulary
 
 
 def compare_career_paths(
@@ -22,9 +25,12 @@ def compare_career_paths(
     Returns:
         Comparison data including gaps, overlaps, and recommendations
     """
-    current = {s.lower().strip() for s in current_skills}
-    path1 = {s.lower().strip() for s in path1_skills}
-    path2 = {s.lower().strip() for s in path2_skills}
+    # Work on vocabulary IDs, plus overflow IDs scoped to this comparison;
+    # names are only materialized for the result
+    skill_table = SkillTable(skill_vocabulary)
+    current = set(skill_table.intern_many(current_skills))
+    path1 = set(skill_table.intern_many(path1_skills))
+    path2 = set(skill_table.intern_many(path2_skills))
     
     # Calculate gaps
     path1_gaps = path1 - current
@@ -50,6 +56,11 @@ def compare_career_paths(
     if len(path1_gaps) == len(path2_gaps):
         easier_path = "Equal difficulty"
     
+    def names(skill_ids: Set[int]) -> List[str]:
+        return sorted(skill_table.materialize(skill_ids))
+    
+    common_gap_names = names(common_gaps)
+    
     return {
         "paths": {
             path1_name: {
@@ -57,23 +68,103 @@ def compare_career_paths(
                 "current_skills": len(path1_overlap),
                 "missing_skills": len(path1_gaps),
                 "readiness_percentage": round(path1_readiness, 1),
-                "gaps": sorted(list(path1_gaps)),
-                "unique_gaps": sorted(list(path1_unique))
+                "gaps": names(path1_gaps),
+                "unique_gaps": names(path1_unique)
             },
             path2_name: {
                 "total_skills": len(path2),
                 "current_skills": len(path2_overlap),
                 "missing_skills": len(path2_gaps),
                 "readiness_percentage": round(path2_readiness, 1),
-                "gaps": sorted(list(path2_gaps)),
-                "unique_gaps": sorted(list(path2_unique))
+                "gaps": names(path2_gaps),
+                "unique_gaps": names(path2_unique)
             }
         },
-        "common_gaps": sorted(list(common_gaps)),
+        "common_gaps": common_gap_names,
         "recommendation": {
             "easier_path": easier_path,
             "gap_difference": abs(len(path1_gaps) - len(path2_gaps)),
-            "should_learn_first": sorted(list(common_gaps))[:5] if common_gaps else []
+            "should_learn_first": common_gap_names[:5]
+        }
+    }
+
+
+def compare_multiple_paths(
+    current_skills: List[str],
+    paths: Dict[str, List[str]]
+) -> Dict:
+    """Compare any number of career paths in one pass.
+    
+    Each path is encoded once as a skill bitset, so readiness, gaps and the
+    pairwise shared-gap matrix all come from bitset operations. Gap lists
+    appear once per path; pairwise data is counts only.
+    
+    Args:
+        current_skills: Skills the user currently has
+        paths: Required skills keyed by path name
+    
+    Returns:
+        Comparison data with per-path gaps, pairwise matrices and recommendations
+    """
+    names = list(paths)
+    skill_table = SkillTable(skill_vocabulary)  # Overflow IDs scoped to this comparison
+    current = to_bitset(skill_table.intern_many(current_skills))
+    required = [to_bitset(skill_table.intern_many(paths[name])) for name in names]
+    gaps = [bits & ~current for bits in required]
+    gap_counts = [g.bit_count() for g in gaps]
+    
+    # How many paths need each missing skill
+    all_gaps = 0
+    for g in gaps:
+        all_gaps |= g
+    demand = {
+        skill_id: sum(g >> skill_id & 1 for g in gaps)
+        for skill_id in iter_skill_ids(all_gaps)
+    }
+    
+    def skill_names(bits: int) -> List[str]:
+        return sorted(skill_table.materialize(iter_skill_ids(bits)))
+    
+    path_results = {}
+    for i, name in enumerate(names):
+        total = required[i].bit_count()
+        overlap = (required[i] & current).bit_count()
+        others = 0
+        for j, g in enumerate(gaps):
+            if j != i:
+                others |= g
+        path_results[name] = {
+            "total_skills": total,
+            "current_skills": overlap,
+            "missing_skills": gap_counts[i],
+            "readiness_percentage": round(overlap / total * 100, 1) if total else 0,
+            "gaps": skill_names(gaps[i]),
+            "unique_gaps": skill_names(gaps[i] & ~others)
+        }
+    
+    common = all_gaps
+    for g in gaps:
+        common &= g
+    
+    fewest = min(gap_counts) if gap_counts else 0
+    easiest = [name for name, count in zip(names, gap_counts) if count == fewest]
+    
+    shared = sorted(
+        (skill_id for skill_id, count in demand.items() if count > 1),
+        key=lambda skill_id: (-demand[skill_id], skill_table.lookup(skill_id))
+    )
+    
+    return {
+        "paths": path_results,
+        "pairwise": {
+            "order": names,
+            "shared_gaps": [[(a & b).bit_count() for b in gaps] for a in gaps],
+            "gap_difference": [[abs(a - b) for b in gap_counts] for a in gap_counts]
+        },
+        "common_gaps": skill_names(common),
+        "recommendation": {
+            "easier_path": easiest[0] if len(easiest) == 1 else "Equal difficulty",
+            "should_learn_first": skill_table.materialize(shared[:5])
         }
     }
 
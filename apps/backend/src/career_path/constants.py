@@ -4,11 +4,72 @@
 MAX_TOKENS = 2000
 TEMPERATURE = 0.3
 
+# Per-node output budgets (max_tokens) before enough outputs are observed
+NODE_MAX_TOKENS = {
+    "job_parser": 500,
+    "job_parser_batch": 1500,
+    "resume_analyzer": 800,
+    "learning_path": 2000,
+    "critical_review": 1200,
+    "fused_analysis": 2000,
+}
+OUTPUT_BUDGET_WINDOW = 200
+OUTPUT_BUDGET_MIN_SAMPLES = 20
+OUTPUT_BUDGET_HEADROOM = 1.25
+OUTPUT_BUDGET_FLOOR = 256
+
+# Model families that accept Bedrock prompt-cache checkpoints, with the
+# smallest prefix (tokens) each will cache. Shorter prefixes are sent without
+# a checkpoint. More specific families come first.
+PROMPT_CACHE_MODELS = {
+    "claude-3-5-haiku": 2048,
+    "claude-3-7-sonnet": 1024,
+    "claude-haiku-4-5": 4096,
+    "claude-sonnet-4": 1024,
+    "claude-opus-4-5": 4096,
+    "claude-opus-4": 1024,
+}
+
 # Limits
 MAX_RESUME_LENGTH = 2000
+RESUME_TOKEN_BUDGET = 500  # About MAX_RESUME_LENGTH characters
 MAX_SKILL_GAPS = 5
 MAX_TARGET_JOBS = 5
 
+# Batch processing
+RANKING_CONCURRENCY = 4
+MAX_RANKING_CANDIDATES = 200
+MAX_RANKING_JOBS = 20
+BATCH_CONCURRENCY = 4
+MAX_BATCH_ITEMS = 500
+
+# Idempotency-Key storage
+IDEMPOTENCY_TTL_MINUTES = 24 * 60
+IDEMPOTENCY_MAX_ENTRIES = 10000
+
+# Generated roadmap storage
+ROADMAP_STORE_TTL_MINUTES = 7 * 24 * 60
+ROADMAP_STORE_MAX_ENTRIES = 10000
+
+# Async job storage (only finished jobs expire or are evicted)
+JOB_STORE_TTL_MINUTES = 24 * 60
+JOB_STORE_MAX_ENTRIES = 10000
+
+# Failed runs whose checkpoints are kept for a retry (oldest dropped first)
+CHECKPOINT_MAX_FAILED_RUNS = 1000
+
+# Resume profile storage
+PROFILE_STORE_TTL_MINUTES = 30 * 24 * 60
+PROFILE_STORE_MAX_ENTRIES = 10000
+
+# Deferred critical review storage
+REVIEW_STORE_TTL_MINUTES = 24 * 60
+REVIEW_STORE_MAX_ENTRIES = 10000
+
+# Job parser micro-batching (window 0 = disabled)
+JOB_PARSER_BATCH_WINDOW_MS = 0
+JOB_PARSER_BATCH_MAX = 16
+
 # Timeouts (seconds)
 LLM_TIMEOUT = 30
 WORKFLOW_TIMEOUT = 120
@@ -0,0 +1,115 @@
+"""Deterministic local skill extraction with an Aho-Corasick automaton."""
+
+import json
+import logging
+import os
+import string
+from collections import deque
+from pathlib import Path
+from typing import Dict, List
+
+logger = logging.getLogger(__name__)
+
+# Skill taxonomy shipped with the package: skill -> aliases
+TAXONOMY_PATH = Path(__file__).parent / "data" / "skill_taxonomy.json"
+
+# Token characters, as in validation.extract_keywords; a match must not be
+# preceded or followed by one of these ("Java" must not match "JavaScript")
+_WORD_CHARS = frozenset(string.ascii_letters + string.digits + "+#")
+
+# Extraction modes for the resume analyzer
+LLM = "llm"
+FAST = "fast"
+HYBRID = "hybrid"
+EXTRACTION_MODES = (LLM, FAST, HYBRID)
+
+
+class SkillExtractor:
+    """Finds taxonomy skills and their aliases in text in a single pass.
+
+    The automaton is built once over all lowercased patterns; scanning is
+    linear in the text length regardless of the taxonomy size.
+    """
+
+    def __init__(self, taxonomy: Dict[str, List[str]]):
+        """Build the automaton.
+
+        Args:
+            taxonomy: Skill name -> aliases (the name itself is also matched)
+        """
+        self._goto: List[Dict[str, int]] = [{}]
+        self._fail: List[int] = [0]
+        self._out: List[List[tuple[int, str]]] = [[]]  # (pattern length, skill)
+        self._skills = len(taxonomy)
+
+        for skill, aliases in taxonomy.items():
+            for pattern in {skill.lower(), *(alias.lower() for alias in aliases)}:
+                self._add(pattern, skill)
+        self._link()
+
+    def _add(self, pattern: str, skill: str) -> None:
+        state = 0
+        for char in pattern:
+            state = self._goto[state].setdefault(char, len(self._goto))
+            if state == len(self._goto):
+                self._goto.append({})
+                self._fail.append(0)
+                self._out.append([])
+        self._out[state].append((len(pattern), skill))
+
+    def _link(self) -> None:
+        # Breadth-first so every state's failure target is finished first
+        queue = deque(self._goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in self._goto[state].items():
+                queue.append(child)
+                fail = self._fail[state]
+                while fail and char not in self._goto[fail]:
+                    fail = self._fail[fail]
+                self._fail[child] = self._goto[fail].get(char, 0)
+                self._out[child] = self._out[child] + self._out[self._fail[child]]
+
+    def extract(self, text: str) -> List[str]:
+        """Skills mentioned in the text, in order of first mention.
+
+        Args:
+            text: Resume or other free text
+
+        Returns:
+            Taxonomy skill names, without duplicates
+        """
+        text = text.lower()
+        found: Dict[str, int] = {}  # skill -> start of first mention
+        state = 0
+        for end, char in enumerate(text, 1):
+            while state and char not in self._goto[state]:
+                state = self._fail[state]
+            state = self._goto[state].get(char, 0)
+            for length, skill in self._out[state]:
+                start = end - length
+                if skill in found and found[skill] <= start:
+                    continue
+                if start > 0 and text[start - 1] in _WORD_CHARS:
+                    continue
+                if end < len(text) and text[end] in _WORD_CHARS:
+                    continue
+                found[skill] = start
+        return sorted(found, key=found.get)
+
+    def __len__(self) -> int:
+        return self._skills
+
+
+def load_taxonomy(path: Path | str) -> Dict[str, List[str]]:
+    """Load a skill taxonomy from a JSON file (empty if missing or invalid)."""
+    try:
+        with open(path) as f:
+            return json.load(f)
+    except (OSError, ValueError) as e:
+        logger.warning(f"Skill taxonomy unavailable at {path}: {e}")
+        return {}
+
+
+# Global extractor instance, built once at import
+skill_extractor = SkillExtractor(load_taxonomy(os.getenv("SKILL_TAXONOMY_PATH", TAXONOMY_PATH)))
@@ -0,0 +1,91 @@
+"""Bitset gap analysis over interned skill IDs.
+
+Skill sets are encoded as Python ints where bit ``i`` is set when skill ID
+``i`` (see ``skills.SkillTable``) is present. Set algebra then becomes a
+handful of big-int operations regardless of how many jobs or skills are
+involved, and popcounts give the fit scores directly.
+"""
+
+from typing import Iterable, Iterator
+
+
+def to_bitset(skill_ids: Iterable[int]) -> int:
+    """Encode skill IDs as a bitset.
+
+    Args:
+        skill_ids: Interned skill IDs (duplicates allowed)
+
+    Returns:
+        Integer with one bit set per distinct skill ID
+    """
+    skill_ids = list(skill_ids)
+    if not skill_ids:
+        return 0
+    buf = bytearray((max(skill_ids) >> 3) + 1)
+    for skill_id in skill_ids:
+        buf[skill_id >> 3] |= 1 << (skill_id & 7)
+    return int.from_bytes(buf, "little")
+
+
+def iter_skill_ids(bits: int) -> Iterator[int]:
+    """Yield the skill IDs set in a bitset, lowest first."""
+    while bits:
+        low = bits & -bits
+        yield low.bit_length() - 1
+        bits ^= low
+
+
+def fit_percentage(matched: int, required: int) -> int:
+    """Percentage of required skills covered, truncated like the gap node."""
+    total = required.bit_count()
+    if total == 0:
+        return 0
+    return int(matched.bit_count() / total * 100)
+
+
+def analyze_gaps(current_ids: Iterable[int], required_ids: dict[str, list[int]]) -> dict:
+    """Compute matched/missing skills and fit scores for one candidate.
+
+    Args:
+        current_ids: Skill IDs the candidate has
+        required_ids: Required skill IDs per job title
+
+    Returns:
+        Dict with ``matched`` and ``missing`` bitsets, ``job_fit`` per job
+        title and the overall ``fit_score``
+    """
+    current = to_bitset(current_ids)
+    all_required = 0
+    job_fit = {}
+    for job_title, ids in required_ids.items():
+        job_bits = to_bitset(ids)
+        all_required |= job_bits
+        job_fit[job_title] = fit_percentage(job_bits & current, job_bits)
+
+    matched = all_required & current
+    return {
+        "matched": matched,
+        "missing": all_required & ~current,
+        "job_fit": job_fit,
+        "fit_score": fit_percentage(matched, all_required),
+    }
+
+
+def fit_matrix(candidates: list[int], jobs: list[int]) -> list[list[int]]:
+    """Score every candidate against every job.
+
+    Args:
+        candidates: Current-skill bitsets, one per candidate
+        jobs: Required-skill bitsets, one per job
+
+    Returns:
+        N x M matrix of fit percentages (rows are candidates)
+    """
+    totals = [job.bit_count() for job in jobs]
+    return [
+        [
+            int((candidate & job).bit_count() / total * 100) if total else 0
+            for job, total in zip(jobs, totals)
+        ]
+        for candidate in candidates
+    ]
@@ -0,0 +1,150 @@
+"""Workflow checkpointing so failed runs resume from the last completed node."""
+
+import logging
+import sqlite3
+import threading
+import uuid
+from collections import OrderedDict
+from typing import Any, Optional
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.checkpoint.memory import InMemorySaver
+
+from ..constants import CHECKPOINT_MAX_FAILED_RUNS
+
+logger = logging.getLogger(__name__)
+
+
+class WorkflowRunError(Exception):
+    """A resumable run finished with a node error; its checkpoints are kept."""
+
+    def __init__(self, run_id: str, error: str, state: dict[str, Any]):
+        super().__init__(error)
+        self.run_id = run_id
+        self.state = state
+
+
+class _FailedRuns:
+    """Bounded record of failed runs whose checkpoints are kept.
+
+    Once more than ``max_runs`` are kept, the oldest run's checkpoints are
+    deleted, so runs that are never retried don't accumulate.
+    """
+
+    def __init__(self, max_runs: int = CHECKPOINT_MAX_FAILED_RUNS):
+        self._max_runs = max_runs
+        self._runs: OrderedDict[tuple[int, str], BaseCheckpointSaver] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def keep(self, checkpointer: BaseCheckpointSaver, run_id: str) -> None:
+        with self._lock:
+            self._runs[(id(checkpointer), run_id)] = checkpointer
+            self._runs.move_to_end((id(checkpointer), run_id))
+            evicted = []
+            while len(self._runs) > self._max_runs:
+                (_, old_id), old_checkpointer = self._runs.popitem(last=False)
+                evicted.append((old_checkpointer, old_id))
+        for old_checkpointer, old_id in evicted:
+            logger.info(f"Dropping checkpoints of failed run {old_id}")
+            old_checkpointer.delete_thread(old_id)
+
+    def discard(self, checkpointer: BaseCheckpointSaver, run_id: str) -> None:
+        with self._lock:
+            self._runs.pop((id(checkpointer), run_id), None)
+
+
+# Failed runs kept for retry in this process
+_failed_runs = _FailedRuns()
+
+
+def create_checkpointer(
+    backend: str = "none",
+    path: str = "checkpoints.db"
+) -> Optional[BaseCheckpointSaver]:
+    """Create a checkpointer for the configured backend.
+
+    Args:
+        backend: ``none``, ``memory`` or ``sqlite``
+        path: Database file for the SQLite backend
+
+    Returns:
+        Checkpointer, or None when checkpointing is disabled
+    """
+    if backend == "sqlite":
+        try:
+            from langgraph.checkpoint.sqlite import SqliteSaver
+        except ImportError:
+            logger.warning("langgraph-checkpoint-sqlite not installed, using in-memory checkpoints")
+            return InMemorySaver()
+        return SqliteSaver(sqlite3.connect(path, check_same_thread=False))
+    if backend == "memory":
+        return InMemorySaver()
+    if backend != "none":
+        logger.warning(f"Unknown checkpoint backend: {backend}, checkpointing disabled")
+    return None
+
+
+def _before_first_error(workflow, config: dict):
+    """Checkpoint just before the node that first reported an error, if any."""
+    history = list(workflow.get_state_history(config))[::-1]  # Oldest first
+    for previous, snapshot in zip(history, history[1:]):
+        if snapshot.values.get("error"):
+            return previous
+    return None
+
+
+def run_workflow(workflow, state: Optional[dict], run_id: Optional[str] = None) -> dict[str, Any]:
+    """Run a workflow, resuming ``run_id`` if an earlier attempt stopped midway.
+
+    Without a checkpointer this is a plain ``invoke``. With one, every
+    completed node is checkpointed under ``run_id``; calling again with the
+    same id after a failure continues from the node that failed. A run
+    counts as failed if a node raised or returned an ``error`` (nodes catch
+    LLM errors themselves). A failed run with a ``run_id`` raises
+    ``WorkflowRunError`` so callers don't store it as a result, and keeps
+    its checkpoints (up to ``CHECKPOINT_MAX_FAILED_RUNS`` runs). Runs
+    without a ``run_id`` return their partial state, since nothing can
+    resume them, and their checkpoints are deleted like those of
+    successful runs.
+
+    Args:
+        workflow: Compiled workflow
+        state: Initial state for a new run
+        run_id: Run identifier (checkpoints are kept only when given)
+
+    Returns:
+        Final workflow state
+
+    Raises:
+        WorkflowRunError: If a run with a ``run_id`` ended with a node error
+    """
+    checkpointer = getattr(workflow, "checkpointer", None)
+    if not isinstance(checkpointer, BaseCheckpointSaver):
+        return workflow.invoke(state)
+
+    resumable = run_id is not None
+    run_id = run_id or uuid.uuid4().hex
+    config = {"configurable": {"thread_id": run_id}}
+    failed = True
+    try:
+        snapshot = workflow.get_state(config)
+        retry_from = _before_first_error(workflow, config) if snapshot.values.get("error") else None
+        if snapshot.next:
+            logger.info(f"Resuming run {run_id} at {', '.join(snapshot.next)}")
+            result = workflow.invoke(None, config)
+        elif retry_from is not None:
+            logger.info(f"Retrying run {run_id} at {', '.join(retry_from.next)}")
+            result = workflow.invoke(None, retry_from.config)
+        else:
+            result = workflow.invoke(state, config)
+        failed = bool(result.get("error"))
+        if failed and resumable:
+            logger.warning(f"Run {run_id} finished with an error, keeping checkpoints for retry")
+            raise WorkflowRunError(run_id, result["error"], result)
+        return result
+    finally:
+        if failed and resumable:
+            _failed_runs.keep(checkpointer, run_id)
+        else:
+            _failed_runs.discard(checkpointer, run_id)
+            checkpointer.delete_thread(run_id)
@@ -3,17 +3,47 @@
 import json
 import logging
 import os
-import re
 from functools import lru_cache
+from pathlib import Path
 from typing import Any
 
 import boto3
 from langchain_aws import ChatBedrock
-
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessage, HumanMessage
+from langgraph.config import get_stream_writer
+from pydantic import BaseModel
+
+from ..budgets import output_budget
+from ..cache import response_cache
+from ..catalog import CATALOG_FIELDS, learning_catalog
+from ..compaction import compact_resume, estimate_tokens
+from ..constants import (
+    JOB_PARSER_BATCH_MAX,
+    JOB_PARSER_BATCH_WINDOW_MS,
+    LLM_TIMEOUT,
+    MAX_SKILL_GAPS,
+    MAX_TOKENS,
+    TEMPERATURE,
+)
+from ..extractor import FAST, HYBRID, LLM, skill_extractor
+from ..gap_engine import analyze_gaps, iter_skill_ids
+from ..graph.schemas import (
+    CriticalReview,
+    FusedAnalysis,
+    JobRequirements,
+    JobRequirementsByTitle,
+    LearningRecommendations,
+    ResumeAnalysis,
+)
 from ..graph.state import CareerPathState
-from ..constants import MAX_TOKENS, TEMPERATURE, MAX_RESUME_LENGTH, MAX_SKILL_GAPS
-from ..utils import deduplicate_skills, calculate_priority, estimate_learning_time
+from ..jsonstream import JSONStreamParser, extract_json
+from ..microbatch import MicroBatcher
 from ..model_config import get_model_config
+from ..profile_store import profile_store
+from ..prompt_cache import prompt_cache_min_tokens, prompt_cache_stats, system_prompt
+from ..skills import SkillTable, canonical_skill, skill_vocabulary
+from ..utils import calculate_priority, deduplicate_skills, estimate_learning_time
 
 logger = logging.getLogger(__name__)
 
@@ -36,15 +66,15 @@ def _get_bedrock_client():
     return _bedrock_client
 
 
-def _get_llm(agent_name: str):
+def _get_llm(agent_name: str, max_tokens: int = MAX_TOKENS):
     """Get configured LLM instance for specific agent."""
     model_id = getattr(MODEL_CONFIG, agent_name)
-    logger.info(f"Using model {model_id} for {agent_name}")
+    logger.info(f"Using model {model_id} for {agent_name} (max_tokens={max_tokens})")
     return ChatBedrock(
         model_id=model_id,
         client=_get_bedrock_client(),
         model_kwargs={
-            "max_tokens": MAX_TOKENS,
+            "max_tokens": max_tokens,
             "temperature": TEMPERATURE,
         }
     )
@@ -52,19 +82,270 @@ def _get_llm(agent_name: str):
 
 def _extract_json(text: str) -> dict:
     """Extract JSON from LLM response, handling markdown code blocks."""
+    return extract_json(text)
+
+
+def _stream_writer():
+    """LangGraph custom stream writer, or a no-op outside a graph run."""
     try:
-        # Try direct parse first
-        return json.loads(text)
-    except json.JSONDecodeError:
-        # Try to extract from markdown code block
-        match = re.search(r'```(?:json)?\s*(\{[^`]*\})\s*```', text, re.DOTALL)
-        if match:
-            return json.loads(match.group(1))
-        # Try to find any JSON object
-        match = re.search(r'\{[^{}]*(?:\{[^{}]*\}[^{}]*)*\}', text, re.DOTALL)
-        if match:
-            return json.loads(match.group(0))
+        return get_stream_writer()
+    except RuntimeError:
+        return lambda chunk: None
+
+
+def _tool_spec(schema: type[BaseModel]) -> dict:
+    """Tool definition that makes the model answer in the schema's shape."""
+    return {
+        "name": schema.__name__,
+        "description": (schema.__doc__ or schema.__name__).strip(),
+        "input_schema": schema.model_json_schema()
+    }
+
+
+def _chunk_text(chunk) -> str:
+    """JSON text carried by a streamed chunk (tool call arguments or content)."""
+    if getattr(chunk, "tool_call_chunks", None):
+        return "".join(call.get("args") or "" for call in chunk.tool_call_chunks)
+    return chunk.content if isinstance(chunk.content, str) else ""
+
+
+def _generate_json(
+    llm,
+    messages,
+    parser: JSONStreamParser,
+    on_field,
+    schema=None,
+    drain: bool = False
+) -> tuple[str, dict | None]:
+    """Run the model into the parser, stopping once the JSON object closes.
+    
+    With ``drain``, the rest of the stream is read instead, since Bedrock
+    only reports usage (including cache reads) in its final event.
+    
+    Returns:
+        Output text and the call's usage metadata, if reported
+    """
+    if not isinstance(llm, BaseChatModel):
+        # Not a streaming chat model: take the whole answer
+        response = llm.invoke(messages)
+        text = response.content
+        for key, value in parser.feed(text):
+            on_field(key, value)
+        usage = getattr(response, "usage_metadata", None)
+        return (text if parser.end < 0 else text[:parser.end]), usage if isinstance(usage, dict) else None
+    
+    if schema is not None:
+        llm = llm.bind_tools([_tool_spec(schema)], tool_choice=schema.__name__)
+    
+    parts = []
+    usage = None
+    for chunk in llm.stream(messages):
+        usage = chunk.usage_metadata or usage
+        if parser.done:
+            continue  # Draining for usage metrics
+        content = _chunk_text(chunk)
+        for key, value in parser.feed(content):
+            on_field(key, value)
+        if parser.done:
+            parts.append(content[:parser.end])
+            if not drain:
+                break  # Closing the stream stops generation
+        else:
+            parts.append(content)
+    return "".join(parts), usage
+
+
+def _use_prompt_cache(llm, system: str, schema=None) -> bool:
+    """Whether a system prompt (with the tool schema ahead of it) is long enough to cache."""
+    if not system or not isinstance(llm, BaseChatModel):
+        return False
+    min_tokens = prompt_cache_min_tokens(getattr(llm, "model_id", ""))
+    if min_tokens is None:
+        return False
+    tokens = estimate_tokens(system)
+    if schema is not None:
+        tokens += estimate_tokens(json.dumps(_tool_spec(schema)))
+    return tokens >= min_tokens
+
+
+def _generate_within_budget(
+    agent_name: str,
+    prompt: str,
+    node: str,
+    schema=None,
+    system: str = ""
+) -> tuple[dict | None, str]:
+    """Generate one JSON answer, continuing it once if it was truncated."""
+    writer = _stream_writer()
+    
+    def on_field(key, value):
+        writer({"node": node, "field": key, "value": value})
+    
+    llm = _get_llm(agent_name, output_budget.max_tokens(node))
+    cache = _use_prompt_cache(llm, system, schema)
+    messages = system_prompt(system, prompt, cache) if system else prompt
+    
+    parser = JSONStreamParser()
+    text, usage = _generate_json(llm, messages, parser, on_field, schema, drain=cache)
+    if cache:
+        prompt_cache_stats.record(node, usage)
+    truncated = parser.started and not parser.done
+    if truncated:
+        logger.warning(f"{node} output truncated at {estimate_tokens(text)} tokens, continuing")
+        history = messages if system else [HumanMessage(content=messages)]
+        continued, _ = _generate_json(
+            _get_llm(agent_name, output_budget.ceiling),
+            [*history, AIMessage(content=text)],
+            parser,
+            on_field
+        )
+        text += continued
+    output_budget.record(node, estimate_tokens(text), truncated)
+    return parser.result, text
+
+
+def _validate(schema: type[BaseModel], result: dict | None, text: str, context: dict | None) -> dict:
+    """Validate parsed output against a node schema."""
+    if result is None:
         raise ValueError(f"No valid JSON found in response: {text[:200]}")
+    return schema.model_validate(result, context=context).model_dump(exclude_unset=True)
+
+
+def _invoke_json(
+    agent_name: str,
+    prompt: str,
+    node: str | None = None,
+    schema: type[BaseModel] | None = None,
+    context: dict | None = None,
+    system: str = ""
+) -> dict:
+    """Call a node's model with an adaptive output budget and parse its JSON.
+    
+    The budget comes from the node's observed output lengths. Output is
+    streamed into an incremental parser and cut off once the top-level JSON
+    object closes; each top-level field is sent to the graph's custom
+    stream as soon as it completes. If the budget ran out mid-object, one
+    continuation call picks up where the output stopped instead of
+    regenerating the whole answer.
+    
+    With a schema, the model is asked to answer through a tool whose input
+    is that schema. An answer that still fails validation gets one short
+    repair call with the errors, rather than being dropped or regenerated.
+    
+    A stable ``system`` prompt (guidance and output format) is sent as the
+    system message. It gets a prompt-cache checkpoint on models that
+    support caching once it reaches their minimum cacheable size.
+    
+    Args:
+        agent_name: Model config entry to use
+        prompt: Prompt text
+        node: Budget key (defaults to agent_name)
+        schema: Pydantic schema the answer must match
+        context: Validation context passed to the schema
+        system: Static system prompt that is identical on every call
+    
+    Returns:
+        Parsed (and validated) JSON object
+    """
+    node = node or agent_name
+    result, text = _generate_within_budget(agent_name, prompt, node, schema, system)
+    if schema is None:
+        if result is None:
+            raise ValueError(f"No valid JSON found in response: {text[:200]}")
+        return result
+    
+    try:
+        return _validate(schema, result, text, context)
+    except ValueError as e:
+        logger.warning(f"{node} output failed validation, repairing: {e}")
+        repair_prompt = f"""Fix this JSON so it matches the schema. Return only the corrected JSON.
+
+Schema:
+{json.dumps(schema.model_json_schema())}
+
+Errors:
+{e}
+
+JSON:
+{text}"""
+        result, text = _generate_within_budget(agent_name, repair_prompt, f"{node}_repair")
+        return _validate(schema, result, text, context)
+
+
+# Advisor guidance shared by the learning path and critical review prompts
+ADVISOR_GUIDE = (Path(__file__).parent.parent / "data" / "advisor_guide.md").read_text()
+
+# Static system prompts, sent ahead of the per-request data. With the forced
+# tool schema they exceed the minimum cacheable size of the Sonnet and Opus
+# models these nodes use outside TESTING mode.
+LEARNING_PATH_SYSTEM = ADVISOR_GUIDE + """
+## Task
+
+For each skill in the user message, recommend courses, projects, and certifications.
+
+Return JSON keyed by skill:
+{"<skill>": {"courses": [{"name": "...", "provider": "...", "url": "...", "duration": "..."}], "projects": [{"name": "...", "description": "...", "skills": ["..."]}], "certifications": [{"name": "...", "provider": "...", "url": "..."}]}}
+"""
+
+CRITICAL_REVIEW_SYSTEM = ADVISOR_GUIDE + """
+## Task
+
+Provide brutally honest feedback on the career transition readiness of the profile in the user message.
+
+Provide critical analysis in JSON:
+{
+  "overallRating": <1-10 score>,
+  "readinessLevel": "<not ready|somewhat ready|ready|highly ready>",
+  "strengths": [<what works well>],
+  "weaknesses": [<what needs improvement>],
+  "redFlags": [<potential concerns>],
+  "competitivePosition": "<how you compare to typical candidates>",
+  "actionableSteps": [<specific improvements>],
+  "timelineRealism": "<honest assessment of timeline>",
+  "summary": "<2-3 sentence honest assessment>"
+}
+
+Be direct and constructive. Return ONLY valid JSON.
+"""
+
+
+def _with_skill_ids(state: CareerPathState, update: dict[str, Any]) -> dict[str, Any]:
+    """Add vocabulary IDs for the skills a node produced.
+    
+    Skills are normalized here, once; later nodes work on the IDs. IDs
+    already in state from another vocabulary version (a run checkpointed
+    before the taxonomy changed) are re-encoded too, so every ID in state
+    belongs to ``skill_vocabulary``.
+    """
+    stale = state.get("skill_vocabulary") != skill_vocabulary.version
+    if "current_skills" in update or stale and state.get("current_skills"):
+        skills = update.get("current_skills", state.get("current_skills"))
+        update["current_skill_ids"] = skill_vocabulary.encode(skills)
+    if "required_skills" in update or stale and state.get("required_skills"):
+        required = update.get("required_skills", state.get("required_skills"))
+        update["required_skill_ids"] = {
+            job_title: skill_vocabulary.encode(skills) for job_title, skills in required.items()
+        }
+    update["skill_vocabulary"] = skill_vocabulary.version
+    return update
+
+
+def profile_lookup_node(state: CareerPathState) -> dict[str, Any]:
+    """Load a stored profile for an unchanged resume."""
+    
+    profile = profile_store.get(state["resume_text"], state.get("user_id") or "default")
+    if profile is None:
+        logger.info("No stored profile for resume")
+        return {"profile_cache_hit": False}
+    
+    logger.info("Using stored profile for resume")
+    return _with_skill_ids(state, {
+        "current_skills": profile["current_skills"],
+        "experience_years": profile["experience_years"],
+        "strengths": profile["strengths"],
+        "profile_cache_hit": True,
+        "workflow_status": "resume_analyzed"
+    })
 
 
 def resume_analyzer_node(state: CareerPathState) -> dict[str, Any]:
@@ -72,40 +353,82 @@ def resume_analyzer_node(state: CareerPathState) -> dict[str, Any]:
     
     logger.info("Starting resume analysis")
     
-    prompt = f"""Extract from this resume:
+    mode = state.get("extraction_mode") or LLM
+    if mode == FAST:
+        # Taxonomy skills only, no LLM call
+        skills = skill_extractor.extract(state["resume_text"])
+        logger.info(f"Extracted {len(skills)} skills locally")
+        return _with_skill_ids(state, {
+            "current_skills": skills,
+            "experience_years": {},
+            "strengths": [],
+            "workflow_status": "resume_analyzed"
+        })
+    
+    compacted = compact_resume(state["resume_text"])
+    logger.info(
+        f"Resume compacted from {compacted['original_tokens']} to "
+        f"{compacted['compacted_tokens']} tokens ({compacted['tokens_saved']} saved)"
+    )
+    
+    if mode == HYBRID:
+        # Skills come from the local extractor; the LLM only adds the rest
+        local_skills = skill_extractor.extract(state["resume_text"])
+        prompt = f"""Extract from this resume:
+1. Years of experience per category
+2. Key strengths
+
+Resume:
+{compacted['text']}
+
+Return JSON:
+{{"experience": {{"category": years}}, "strengths": ["..."]}}"""
+    else:
+        prompt = f"""Extract from this resume:
 1. Technical skills
 2. Years of experience per category
 3. Key strengths
 
-Resume (first {MAX_RESUME_LENGTH} chars):
-{state['resume_text'][:MAX_RESUME_LENGTH]}
+Resume:
+{compacted['text']}
 
 Return JSON:
 {{"skills": ["..."], "experience": {{"category": years}}, "strengths": ["..."]}}"""
     
     try:
-        response = _get_llm("resume_analyzer").invoke(prompt)
-        result = _extract_json(response.content)
+        result = _invoke_json("resume_analyzer", prompt, schema=ResumeAnalysis)
         
-        logger.info(f"Extracted {len(result.get('skills', []))} skills")
+        if mode == HYBRID:
+            skills = local_skills
+        else:
+            skills = deduplicate_skills(result.get("skills", []))
         
-        skills = deduplicate_skills(result.get("skills", []))
+        logger.info(f"Extracted {len(skills)} skills")
         
-        return {
+        profile = {
             "current_skills": skills,
             "experience_years": result.get("experience", {}),
             "strengths": result.get("strengths", []),
-            "workflow_status": "resume_analyzed"
         }
+        if mode == LLM:
+            # Only full LLM analyses are stored, so they are never
+            # replaced by a taxonomy-limited profile
+            profile_store.save(state["resume_text"], state.get("user_id") or "default", profile)
+        
+        return _with_skill_ids(state, {
+            **profile,
+            "resume_tokens_saved": compacted["tokens_saved"],
+            "workflow_status": "resume_analyzed"
+        })
     except Exception as e:
         logger.error(f"Resume analysis failed: {e}")
-        return {
+        return _with_skill_ids(state, {
             "current_skills": [],
             "experience_years": {},
             "strengths": [],
             "workflow_status": "resume_analyzed",
             "error": str(e)
-        }
+        })
 
 
 def job_parser_node(state: CareerPathState) -> dict[str, Any]:
@@ -116,7 +439,23 @@ def job_parser_node(state: CareerPathState) -> dict[str, Any]:
     required_skills = {}
     nice_to_have = {}
     
+    # Jobs already parsed by the caller (e.g. shared across a batch) are reused
+    parsed = state.get("required_skills") or {}
+    parsed_nice_to_have = state.get("nice_to_have_skills") or {}
+    
+    # Title-only prompts go through the cross-request micro-batcher if enabled
+    batched = {}
+    if _job_parser_batcher is not None and not state.get("job_description"):
+        titles = [title for title in state["target_jobs"] if title not in parsed]
+        futures = _job_parser_batcher.submit_many(state.get("specialty_info") or "", titles)
+        batched = dict(zip(titles, futures))
+    
     for job_title in state["target_jobs"]:
+        if job_title in parsed:
+            required_skills[job_title] = parsed[job_title]
+            nice_to_have[job_title] = parsed_nice_to_have.get(job_title, [])
+            continue
+        
         # Use job description if provided, otherwise infer from title
         if state.get("job_description"):
             prompt = f"""Analyze this job posting for "{job_title}":
@@ -136,8 +475,10 @@ Return JSON:
 {{"required": ["..."], "nice_to_have": ["..."]}}"""
         
         try:
-            response = _get_llm("job_parser").invoke(prompt)
-            result = _extract_json(response.content)
+            if job_title in batched:
+                result = batched[job_title].result(timeout=LLM_TIMEOUT * 2)
+            else:
+                result = _invoke_json("job_parser", prompt, schema=JobRequirements)
             
             required_skills[job_title] = result.get("required", [])
             nice_to_have[job_title] = result.get("nice_to_have", [])
@@ -146,32 +487,83 @@ Return JSON:
             required_skills[job_title] = []
             nice_to_have[job_title] = []
     
-    return {
+    return _with_skill_ids(state, {
         "required_skills": required_skills,
         "nice_to_have_skills": nice_to_have,
         "workflow_status": "jobs_parsed"
+    })
+
+
+def _parse_job_titles(specialty_info: str, titles: list[str]) -> dict[str, dict]:
+    """Parse several title-only jobs in one prompt (micro-batch handler)."""
+    focus = f"Focus on: {specialty_info}\n" if specialty_info else ""
+    job_list = "\n".join(f"- {title}" for title in titles)
+    prompt = f"""For each job title, list required and nice-to-have technical skills.
+{focus}
+Job titles:
+{job_list}
+
+Return JSON keyed by job title:
+{{"<job title>": {{"required": ["..."], "nice_to_have": ["..."]}}}}"""
+    
+    result = _invoke_json("job_parser", prompt, node="job_parser_batch", schema=JobRequirementsByTitle)
+    by_title = {canonical_skill(title): value for title, value in result.items() if isinstance(value, dict)}
+    return {
+        title: by_title[canonical_skill(title)]
+        for title in titles if canonical_skill(title) in by_title
     }
 
 
+def _create_job_parser_batcher() -> MicroBatcher | None:
+    """Micro-batcher for title-only job parsing, if enabled by env."""
+    window_ms = float(os.getenv("JOB_PARSER_BATCH_WINDOW_MS", JOB_PARSER_BATCH_WINDOW_MS))
+    if window_ms <= 0:
+        return None
+    return MicroBatcher(
+        _parse_job_titles,
+        window_ms=window_ms,
+        max_batch=int(os.getenv("JOB_PARSER_BATCH_MAX", JOB_PARSER_BATCH_MAX))
+    )
+
+
+# Opt-in cross-request batching of job_parser prompts
+_job_parser_batcher = _create_job_parser_batcher()
+
+
 def gap_analysis_node(state: CareerPathState) -> dict[str, Any]:
     """Identify and prioritize skill gaps with fit score."""
     
     logger.info("Analyzing skill gaps")
     
-    current = set(s.lower() for s in state["current_skills"])
-    gaps = []
-    matched = []
-    seen_skills = set()  # Track skills we've already added
+    # Vocabulary IDs come from state; only skills outside the vocabulary
+    # are normalized here, into overflow IDs scoped to this analysis
+    skill_table = SkillTable(skill_vocabulary)
+    if state.get("skill_vocabulary") == skill_vocabulary.version:
+        current_ids = skill_table.intern_encoded(state["current_skills"], state.get("current_skill_ids", []))
+        required_ids = {
+            job_title: skill_table.intern_encoded(required, state.get("required_skill_ids", {}).get(job_title, []))
+            for job_title, required in state["required_skills"].items()
+        }
+    else:
+        current_ids = skill_table.intern_many(state["current_skills"])
+        required_ids = {
+            job_title: skill_table.intern_many(required)
+            for job_title, required in state["required_skills"].items()
+        }
+    
+    # Matched/missing sets and fit scores in one bitset pass
+    analysis = analyze_gaps(current_ids, required_ids)
+    missing = set(iter_skill_ids(analysis["missing"]))
+    matched_bits = analysis["matched"]
     
-    # Calculate matched and missing skills
-    all_required = []
+    # Walk jobs in order only to keep job attribution, priority and the
+    # skill names as written in each job
+    gaps = []
+    matched = {}  # skill ID -> skill name as written in the job
     for job_title, required in state["required_skills"].items():
-        all_required.extend(required)
-        for skill in required:
-            if skill.lower() in current:
-                matched.append(skill)
-            elif skill.lower() not in seen_skills:  # Only add if not seen
-                seen_skills.add(skill.lower())
+        for skill, skill_id in zip(required, required_ids[job_title]):
+            if skill_id in missing:
+                missing.discard(skill_id)  # Only add the first occurrence
                 priority = calculate_priority(len(gaps) + 1, len(required))
                 time_months = estimate_learning_time(skill)
                 gaps.append({
@@ -181,11 +573,10 @@ def gap_analysis_node(state: CareerPathState) -> dict[str, Any]:
                     "difficulty": "medium",
                     "time_months": time_months
                 })
+            elif matched_bits >> skill_id & 1:
+                matched.setdefault(skill_id, skill)
     
-    # Calculate fit score
-    total_skills = len(set(s.lower() for s in all_required))
-    matched_count = len(set(s.lower() for s in matched))
-    fit_score = int((matched_count / total_skills * 100)) if total_skills > 0 else 0
+    fit_score = analysis["fit_score"]
     
     # Sort by priority then skill name
     gaps.sort(key=lambda x: (x["priority"] != "high", x["skill"]))
@@ -195,7 +586,8 @@ def gap_analysis_node(state: CareerPathState) -> dict[str, Any]:
     return {
         "skill_gaps": gaps,
         "fit_score": fit_score,
-        "matched_skills": list(set(matched)),
+        "job_fit_scores": analysis["job_fit"],
+        "matched_skills": list(matched.values()),
         "workflow_status": "gaps_analyzed"
     }
 
@@ -205,6 +597,15 @@ def learning_path_node(state: CareerPathState) -> dict[str, Any]:
     
     logger.info("Generating learning path")
     
+    if state.get("lazy_recommendations"):
+        logger.info("Lazy recommendations requested, deferring to per-skill expansion")
+        return {
+            "courses": [],
+            "projects": [],
+            "certifications": [],
+            "workflow_status": "learning_path_deferred"
+        }
+    
     if not state["skill_gaps"]:
         logger.info("No skill gaps found, returning empty recommendations")
         return {
@@ -216,25 +617,8 @@ def learning_path_node(state: CareerPathState) -> dict[str, Any]:
     
     skills_needed = [gap["skill"] for gap in state["skill_gaps"][:MAX_SKILL_GAPS]]
     
-    prompt = f"""For skills: {', '.join(skills_needed)}
-
-Recommend courses, projects, and certifications.
-
-Return JSON:
-{{"courses": [{{"name": "...", "provider": "...", "url": "...", "duration": "..."}}], "projects": [{{"name": "...", "description": "...", "skills": ["..."]}}], "certifications": [{{"name": "...", "provider": "...", "url": "..."}}]}}"""
-    
     try:
-        response = _get_llm("learning_path").invoke(prompt)
-        result = _extract_json(response.content)
-        
-        logger.info(f"Generated {len(result.get('courses', []))} course recommendations")
-        
-        return {
-            "courses": result.get("courses", []),
-            "projects": result.get("projects", []),
-            "certifications": result.get("certifications", []),
-            "workflow_status": "learning_path_generated"
-        }
+        recommendations, hits = learning_recommendations(skills_needed)
     except Exception as e:
         logger.error(f"Learning path generation failed: {e}")
         return {
@@ -244,6 +628,104 @@ Return JSON:
             "workflow_status": "learning_path_generated",
             "error": str(e)
         }
+    
+    logger.info(f"Learning recommendations: {hits}/{len(skills_needed)} skills cached")
+    
+    merged = _merge_recommendations(skills_needed, recommendations)
+    
+    logger.info(f"Generated {len(merged['courses'])} course recommendations")
+    
+    return {**merged, "workflow_status": "learning_path_generated"}
+
+
+def _merge_recommendations(
+    skills: list[str],
+    recommendations: dict[str, dict[str, list]]
+) -> dict[str, list]:
+    """Merge per-skill results in gap priority order, dropping repeats."""
+    merged = {field: [] for field in CATALOG_FIELDS}
+    seen = set()
+    for skill in skills:
+        for field in CATALOG_FIELDS:
+            for item in recommendations.get(skill, {}).get(field, []):
+                key = (field, item.get("name") if isinstance(item, dict) else str(item))
+                if key not in seen:
+                    seen.add(key)
+                    merged[field].append(item)
+    return merged
+
+
+def learning_recommendations(skills: list[str]) -> tuple[dict[str, dict[str, list]], int]:
+    """Get learning recommendations per skill, asking the LLM only for uncached skills.
+    
+    Skills covered by the static catalog are served from it. Other skills
+    are cached per canonical skill, so overlapping skill sets share entries
+    instead of needing an exact repeat of the whole list.
+    
+    Args:
+        skills: Skills to recommend learning resources for
+    
+    Returns:
+        Tuple of (recommendations keyed by the given skill names, skills served without the LLM)
+    
+    Raises:
+        ValueError: If the model response contains no JSON
+    """
+    recommendations = {}
+    uncached = {}  # canonical skill -> skill name as given
+    for skill in skills:
+        key = canonical_skill(skill)
+        cached = learning_catalog.get(key) or response_cache.get(key, model="learning_path")
+        if cached is not None:
+            recommendations[skill] = cached
+        elif key not in uncached:
+            uncached[key] = skill
+    hits = len(recommendations)
+    
+    if uncached:
+        prompt = f"Skills: {', '.join(uncached.values())}"
+        
+        result = _invoke_json(
+            "learning_path",
+            prompt,
+            schema=LearningRecommendations,
+            context={"skills": list(uncached.values())},
+            system=LEARNING_PATH_SYSTEM
+        )
+        
+        by_skill = {canonical_skill(name): value for name, value in result.items()}
+        
+        for key, skill in uncached.items():
+            entry = by_skill.get(key)
+            if entry is None:
+                logger.warning(f"No recommendations returned for {skill}")
+                recommendations[skill] = {field: [] for field in CATALOG_FIELDS}
+                continue
+            recommendations[skill] = {field: entry.get(field, []) for field in CATALOG_FIELDS}
+            response_cache.set(key, recommendations[skill], model="learning_path")
+    
+    # Skills that differ from a cached/requested one only by casing
+    for skill in skills:
+        if skill not in recommendations:
+            recommendations[skill] = recommendations[uncached[canonical_skill(skill)]]
+    
+    return recommendations, hits
+
+
+def skill_recommendations(skill: str) -> tuple[dict[str, list], bool]:
+    """Get courses, projects and certifications for one skill, cached per skill.
+    
+    Args:
+        skill: Skill to recommend learning resources for
+    
+    Returns:
+        Tuple of (recommendations, cache hit)
+    
+    Raises:
+        ValueError: If the model response contains no JSON
+    """
+    recommendations, hits = learning_recommendations([skill])
+    return recommendations[skill], hits == 1
 
 
 def critical_review_node(state: CareerPathState) -> dict[str, Any]:
@@ -251,9 +733,14 @@ def critical_review_node(state: CareerPathState) -> dict[str, Any]:
     
     logger.info("Performing critical review")
     
-    prompt = f"""Provide brutally honest feedback on this career transition readiness.
-
-CURRENT PROFILE:
+    if state.get("defer_review"):
+        logger.info("Critical review deferred to background")
+        return {
+            "critical_review": {},
+            "workflow_status": "review_deferred"
+        }
+    
+    prompt = f"""CURRENT PROFILE:
 - Skills: {', '.join(state['current_skills'][:20])}
 - Experience: {state.get('experience_years', {})}
 - Strengths: {', '.join(state.get('strengths', [])[:5])}
@@ -261,26 +748,10 @@ CURRENT PROFILE:
 TARGET ROLE: {', '.join(state['target_jobs'])}
 
 FIT SCORE: {state.get('fit_score', 0)}%
-SKILL GAPS: {len(state.get('skill_gaps', []))} missing skills
-
-Provide critical analysis in JSON:
-{{
-  "overallRating": <1-10 score>,
-  "readinessLevel": "<not ready|somewhat ready|ready|highly ready>",
-  "strengths": [<what works well>],
-  "weaknesses": [<what needs improvement>],
-  "redFlags": [<potential concerns>],
-  "competitivePosition": "<how you compare to typical candidates>",
-  "actionableSteps": [<specific improvements>],
-  "timelineRealism": "<honest assessment of timeline>",
-  "summary": "<2-3 sentence honest assessment>"
-}}
-
-Be direct and constructive. Return ONLY valid JSON."""
+SKILL GAPS: {len(state.get('skill_gaps', []))} missing skills"""
     
     try:
-        response = _get_llm("critical_review").invoke(prompt)
-        result = _extract_json(response.content)
+        result = _invoke_json("critical_review", prompt, schema=CriticalReview, system=CRITICAL_REVIEW_SYSTEM)
         
         logger.info(f"Critical review complete: {result.get('overallRating', 0)}/10")
         
@@ -303,6 +774,113 @@ Be direct and constructive. Return ONLY valid JSON."""
         }
 
 
+def fused_analysis_node(state: CareerPathState) -> dict[str, Any]:
+    """Analyze resume, job requirements and draft learning in one LLM call (fast mode).
+    
+    A stored profile for the resume replaces the resume analysis part of the
+    prompt; otherwise the extracted profile is stored like in full mode.
+    """
+    
+    logger.info(f"Running fused analysis for {len(state['target_jobs'])} target jobs")
+    
+    user_id = state.get("user_id") or "default"
+    profile = profile_store.get(state["resume_text"], user_id)
+    context = ""
+    if state.get("job_description"):
+        context += f"\nJob posting:\n{state['job_description'][:2000]}\n"
+    if state.get("specialty_info"):
+        context += f"\nFocus on: {state['specialty_info']}\n"
+    
+    if profile is None:
+        compacted = compact_resume(state["resume_text"])
+        candidate = f"Resume:\n{compacted['text']}"
+        tasks = ["Extract the candidate's technical skills, years of experience per category and key strengths"]
+        answer = '"skills": ["..."], "experience": {"category": years}, "strengths": ["..."], '
+    else:
+        logger.info("Using stored profile for resume")
+        compacted = {"tokens_saved": 0}
+        candidate = f"Candidate skills: {', '.join(profile['current_skills'])}"
+        tasks = []
+        answer = ""
+    tasks += [
+        "For each target job, list required and nice-to-have technical skills",
+        f"For up to {MAX_SKILL_GAPS} required skills the candidate lacks, recommend courses, projects and certifications",
+    ]
+    steps = "\n".join(f"{i}. {task}" for i, task in enumerate(tasks, start=1))
+    
+    prompt = f"""Analyze this candidate against the target jobs.
+
+{candidate}
+
+Target jobs: {', '.join(state['target_jobs'])}
+{context}
+{steps}
+
+Return JSON:
+{{{answer}"jobs": {{"<job title>": {{"required": ["..."], "nice_to_have": ["..."]}}}}, "learning": {{"<skill>": {{"courses": [{{"name": "...", "provider": "...", "url": "...", "duration": "..."}}], "projects": [{{"name": "...", "description": "...", "skills": ["..."]}}], "certifications": [{{"name": "...", "provider": "...", "url": "..."}}]}}}}}}"""
+    
+    try:
+        result = _invoke_json("resume_analyzer", prompt, node="fused_analysis", schema=FusedAnalysis)
+    except Exception as e:
+        logger.error(f"Fused analysis failed: {e}")
+        result = {"error": str(e)}
+    
+    profile_cache_hit = profile is not None
+    if profile is None:
+        profile = {
+            "current_skills": deduplicate_skills(result.get("skills", [])),
+            "experience_years": result.get("experience", {}),
+            "strengths": result.get("strengths", []),
+        }
+        if "error" not in result and (state.get("extraction_mode") or LLM) == LLM:
+            profile_store.save(state["resume_text"], user_id, profile)
+    
+    jobs = {
+        canonical_skill(title): value
+        for title, value in (result.get("jobs") or {}).items() if isinstance(value, dict)
+    }
+    required_skills = {}
+    nice_to_have = {}
+    for job_title in state["target_jobs"]:
+        job = jobs.get(canonical_skill(job_title), {})
+        required_skills[job_title] = job.get("required", [])
+        nice_to_have[job_title] = job.get("nice_to_have", [])
+    
+    update = {
+        "current_skills": profile["current_skills"],
+        "experience_years": profile["experience_years"],
+        "strengths": profile["strengths"],
+        "profile_cache_hit": profile_cache_hit,
+        "required_skills": required_skills,
+        "nice_to_have_skills": nice_to_have,
+        "draft_learning": {
+            canonical_skill(skill): value
+            for skill, value in (result.get("learning") or {}).items() if isinstance(value, dict)
+        },
+        "resume_tokens_saved": compacted["tokens_saved"],
+        "workflow_status": "jobs_parsed"
+    }
+    if "error" in result:
+        update["error"] = result["error"]
+    return _with_skill_ids(state, update)
+
+
+def draft_learning_node(state: CareerPathState) -> dict[str, Any]:
+    """Attach catalog or drafted recommendations to the computed gaps (fast mode)."""
+    
+    skills_needed = [gap["skill"] for gap in state["skill_gaps"][:MAX_SKILL_GAPS]]
+    drafts = state.get("draft_learning") or {}
+    recommendations = {}
+    for skill in skills_needed:
+        entry = learning_catalog.get(skill) or drafts.get(canonical_skill(skill)) or {}
+        recommendations[skill] = {field: entry.get(field, []) for field in CATALOG_FIELDS}
+    
+    return {
+        **_merge_recommendations(skills_needed, recommendations),
+        "workflow_status": "learning_path_generated"
+    }
+
+
 def roadmap_generator_node(state: CareerPathState) -> dict[str, Any]:
     """Generate visual roadmap nodes and edges."""
     
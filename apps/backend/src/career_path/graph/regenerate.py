@@ -0,0 +1,121 @@
+"""Partial regeneration: re-run only the nodes affected by changed inputs."""
+
+import logging
+from typing import Any, Callable
+
+from .nodes import (
+    critical_review_node,
+    gap_analysis_node,
+    job_parser_node,
+    learning_path_node,
+    profile_lookup_node,
+    resume_analyzer_node,
+    roadmap_generator_node,
+)
+from .state import CareerPathState
+
+logger = logging.getLogger(__name__)
+
+# Inputs a regeneration patch may change
+PATCHABLE_FIELDS = ("resume_text", "target_jobs", "job_description", "specialty_info")
+
+# Job parser inputs that change every job's requirements (a target_jobs
+# change alone only needs the new titles parsed)
+JOB_CONTEXT_FIELDS = {"job_description", "specialty_info"}
+
+
+def _analyze_resume(state: CareerPathState) -> dict[str, Any]:
+    """Stored profile if the new resume has one, else a fresh analysis."""
+    result = profile_lookup_node(state)
+    if result["profile_cache_hit"]:
+        return result
+    return {**result, **resume_analyzer_node({**state, **result})}
+
+
+# Workflow nodes in execution order with the state fields each reads and writes
+NODE_DEPENDENCIES: list[tuple[str, Callable, set[str], set[str]]] = [
+    (
+        "resume_analyzer", _analyze_resume,
+        {"resume_text", "user_id"},
+        {"current_skills", "current_skill_ids", "skill_vocabulary", "experience_years", "strengths"}
+    ),
+    (
+        "job_parser", job_parser_node,
+        {"target_jobs", "job_description", "specialty_info"},
+        {"required_skills", "required_skill_ids", "skill_vocabulary", "nice_to_have_skills"}
+    ),
+    (
+        "gap_analysis", gap_analysis_node,
+        {"current_skills", "required_skills"},
+        {"skill_gaps", "fit_score", "job_fit_scores", "matched_skills"}
+    ),
+    (
+        "learning_path", learning_path_node,
+        {"skill_gaps"},
+        {"courses", "projects", "certifications"}
+    ),
+    (
+        "critical_review", critical_review_node,
+        {"current_skills", "experience_years", "strengths", "target_jobs", "fit_score", "skill_gaps"},
+        {"critical_review"}
+    ),
+    (
+        "roadmap_generator", roadmap_generator_node,
+        {"current_skills", "skill_gaps", "target_jobs"},
+        {"nodes", "edges", "milestones"}
+    ),
+]
+
+
+def plan_regeneration(changed: set[str]) -> list[str]:
+    """Work out which nodes must re-run for a set of changed state fields.
+
+    Args:
+        changed: State fields that differ from the previous run
+
+    Returns:
+        Node names in execution order
+    """
+    dirty = set(changed)
+    plan = []
+    for name, _, reads, writes in NODE_DEPENDENCIES:
+        if reads & dirty:
+            plan.append(name)
+            dirty |= writes
+    return plan
+
+
+def regenerate(
+    previous: CareerPathState,
+    patch: dict[str, Any]
+) -> tuple[CareerPathState, list[str]]:
+    """Apply an input patch to a finished run and recompute what it affects.
+
+    Args:
+        previous: Final state of the earlier run
+        patch: New values for fields in ``PATCHABLE_FIELDS``
+
+    Returns:
+        Tuple of (new final state, names of nodes that were re-run)
+    """
+    changed = {
+        field for field, value in patch.items()
+        if field in PATCHABLE_FIELDS and previous.get(field) != value
+    }
+    state = {**previous, **{field: patch[field] for field in changed}, "error": None}
+
+    if changed & JOB_CONTEXT_FIELDS:
+        # Every job's requirements depend on these, so re-parse all jobs
+        state["required_skills"] = {}
+        state["nice_to_have_skills"] = {}
+
+    plan = plan_regeneration(changed)
+    if "resume_analyzer" not in plan:
+        state["profile_cache_hit"] = True  # Earlier analysis is reused
+
+    nodes = {name: node for name, node, _, _ in NODE_DEPENDENCIES}
+    for name in plan:
+        state.update(nodes[name](state))
+
+    logger.info(f"Regenerated {', '.join(plan) or 'nothing'} for {sorted(changed)}")
+    return state, plan
@@ -0,0 +1,87 @@
+"""Pydantic schemas for the structured output of each LLM node."""
+
+from typing import Any, Dict, List, Optional
+
+from pydantic import BaseModel, RootModel, ValidationInfo, model_validator
+
+from ..catalog import CATALOG_FIELDS
+
+
+class ResumeAnalysis(BaseModel):
+    """Skills, experience and strengths extracted from a resume."""
+    skills: List[str] = []
+    experience: Dict[str, float] = {}
+    strengths: List[str] = []
+
+
+class JobRequirements(BaseModel):
+    """Required and nice-to-have technical skills for one job."""
+    required: List[str] = []
+    nice_to_have: List[str] = []
+
+
+class JobRequirementsByTitle(RootModel[Dict[str, JobRequirements]]):
+    """Job requirements keyed by job title."""
+
+
+class Course(BaseModel):
+    """Recommended course."""
+    name: str
+    provider: Optional[str] = None
+    url: Optional[str] = None
+    duration: Optional[str] = None
+
+
+class Project(BaseModel):
+    """Recommended hands-on project."""
+    name: str
+    description: Optional[str] = None
+    skills: List[str] = []
+
+
+class Certification(BaseModel):
+    """Recommended certification."""
+    name: str
+    provider: Optional[str] = None
+    url: Optional[str] = None
+
+
+class SkillResources(BaseModel):
+    """Courses, projects and certifications for one skill."""
+    courses: List[Course] = []
+    projects: List[Project] = []
+    certifications: List[Certification] = []
+
+
+class LearningRecommendations(RootModel[Dict[str, SkillResources]]):
+    """Learning resources keyed by skill."""
+
+    @model_validator(mode="before")
+    @classmethod
+    def key_single_skill(cls, data: Any, info: ValidationInfo) -> Any:
+        """Key an unwrapped answer under the skill when only one was asked for."""
+        skills = (info.context or {}).get("skills", [])
+        if len(skills) == 1 and isinstance(data, dict) and any(
+            isinstance(data.get(field), list) for field in CATALOG_FIELDS
+        ):
+            return {skills[0]: data}
+        return data
+
+
+class CriticalReview(BaseModel):
+    """Honest assessment of a candidate's readiness."""
+    overallRating: float = 0
+    readinessLevel: str = ""
+    strengths: List[str] = []
+    weaknesses: List[str] = []
+    redFlags: List[str] = []
+    competitivePosition: str = ""
+    actionableSteps: List[str] = []
+    timelineRealism: str = ""
+    summary: str = ""
+
+
+class FusedAnalysis(ResumeAnalysis):
+    """Resume analysis, job requirements and draft learning in one answer."""
+    jobs: Dict[str, JobRequirements] = {}
+    learning: Dict[str, SkillResources] = {}
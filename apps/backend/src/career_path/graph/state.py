@@ -13,23 +13,34 @@ class CareerPathState(TypedDict):
     job_description: str | None
     specialty_info: str | None
     user_id: str
+    lazy_recommendations: bool
+    defer_review: bool
+    extraction_mode: str
+    mode: str
     
     # Resume Analysis
     current_skills: list[str]
+    current_skill_ids: list[int]  # skills.skill_vocabulary IDs (-1 outside it)
     experience_years: dict[str, int]
     strengths: list[str]
+    profile_cache_hit: bool
+    resume_tokens_saved: int
     
     # Job Analysis
     required_skills: dict[str, list[str]]
+    required_skill_ids: dict[str, list[int]]
+    skill_vocabulary: str  # Version of the vocabulary the IDs belong to
     nice_to_have_skills: dict[str, list[str]]
     
     # Gap Analysis
     skill_gaps: list[dict]
     estimated_time: dict[str, int]
     fit_score: int
+    job_fit_scores: dict[str, int]
     matched_skills: list[str]
     
     # Learning Path
+    draft_learning: dict[str, dict]
     courses: list[dict]
     projects: list[dict]
     certifications: list[dict]
@@ -45,3 +56,54 @@ class CareerPathState(TypedDict):
     # Metadata
     workflow_status: str
     error: str | None
+
+
+def create_initial_state(
+    resume_text: str,
+    target_jobs: list[str],
+    job_description: str | None = None,
+    specialty_info: str | None = None,
+    user_id: str = "default",
+    lazy_recommendations: bool = False,
+    defer_review: bool = False,
+    extraction_mode: str = "llm",
+    mode: str = "full",
+) -> CareerPathState:
+    """Build the starting state for a workflow run."""
+    return {
+        "messages": [],
+        "resume_text": resume_text,
+        "target_jobs": target_jobs,
+        "job_description": job_description,
+        "specialty_info": specialty_info,
+        "user_id": user_id,
+        "lazy_recommendations": lazy_recommendations,
+        "defer_review": defer_review,
+        "extraction_mode": extraction_mode,
+        "mode": mode,
+        "current_skills": [],
+        "current_skill_ids": [],
+        "experience_years": {},
+        "strengths": [],
+        "profile_cache_hit": False,
+        "resume_tokens_saved": 0,
+        "required_skills": {},
+        "required_skill_ids": {},
+        "skill_vocabulary": "",
+        "nice_to_have_skills": {},
+        "skill_gaps": [],
+        "estimated_time": {},
+        "fit_score": 0,
+        "job_fit_scores": {},
+        "matched_skills": [],
+        "draft_learning": {},
+        "courses": [],
+        "projects": [],
+        "certifications": [],
+        "critical_review": {},
+        "nodes": [],
+        "edges": [],
+        "milestones": [],
+        "workflow_status": "started",
+        "error": None
+    }
@@ -1,24 +1,52 @@
 """LangGraph workflow definition."""
 
-from langgraph.graph import StateGraph, END
+from typing import Optional
+
+from langgraph.checkpoint.base import BaseCheckpointSaver
+from langgraph.graph import END, StateGraph
 
-from .state import CareerPathState
 from .nodes import (
-    resume_analyzer_node,
-    job_parser_node,
+    critical_review_node,
+    draft_learning_node,
+    fused_analysis_node,
     gap_analysis_node,
+    job_parser_node,
     learning_path_node,
-    critical_review_node,
+    profile_lookup_node,
+    resume_analyzer_node,
     roadmap_generator_node,
 )
+from .state import CareerPathState
+
+# Workflow modes
+FULL = "full"
+FAST = "fast"
+
+
+def _after_profile_lookup(state: CareerPathState) -> str:
+    """Skip resume analysis when a stored profile was found."""
+    return "job_parser" if state.get("profile_cache_hit") else "resume_analyzer"
 
 
-def create_workflow() -> StateGraph:
-    """Create the career path analysis workflow."""
+def create_workflow(
+    checkpointer: Optional[BaseCheckpointSaver] = None,
+    mode: str = FULL
+) -> StateGraph:
+    """Create the career path analysis workflow.
+    
+    Args:
+        checkpointer: Optional checkpointer; runs then go through ``run_workflow``
+        mode: ``full`` (one LLM call per agent) or ``fast`` (one fused LLM call)
+    """
+    if mode == FAST:
+        return _create_fast_workflow(checkpointer)
+    if mode != FULL:
+        raise ValueError(f"Unknown workflow mode: {mode}")
     
     workflow = StateGraph(CareerPathState)
     
     # Add nodes
+    workflow.add_node("profile_lookup", profile_lookup_node)
     workflow.add_node("resume_analyzer", resume_analyzer_node)
     workflow.add_node("job_parser", job_parser_node)
     workflow.add_node("gap_analysis", gap_analysis_node)
@@ -27,7 +55,12 @@ def create_workflow() -> StateGraph:
     workflow.add_node("roadmap_generator", roadmap_generator_node)
     
     # Define edges
-    workflow.set_entry_point("resume_analyzer")
+    workflow.set_entry_point("profile_lookup")
+    workflow.add_conditional_edges(
+        "profile_lookup",
+        _after_profile_lookup,
+        ["job_parser", "resume_analyzer"]
+    )
     workflow.add_edge("resume_analyzer", "job_parser")
     workflow.add_edge("job_parser", "gap_analysis")
     workflow.add_edge("gap_analysis", "learning_path")
@@ -35,4 +68,26 @@ def create_workflow() -> StateGraph:
     workflow.add_edge("critical_review", "roadmap_generator")
     workflow.add_edge("roadmap_generator", END)
     
-    return workflow.compile()
+    return workflow.compile(checkpointer=checkpointer)
+
+
+def _create_fast_workflow(checkpointer: Optional[BaseCheckpointSaver] = None) -> StateGraph:
+    """Fused workflow: one LLM call, then local gap analysis and layout.
+    
+    There is no critical review in this mode.
+    """
+    
+    workflow = StateGraph(CareerPathState)
+    
+    workflow.add_node("fused_analysis", fused_analysis_node)
+    workflow.add_node("gap_analysis", gap_analysis_node)
+    workflow.add_node("draft_learning", draft_learning_node)
+    workflow.add_node("roadmap_generator", roadmap_generator_node)
+    
+    workflow.set_entry_point("fused_analysis")
+    workflow.add_edge("fused_analysis", "gap_analysis")
+    workflow.add_edge("gap_analysis", "draft_learning")
+    workflow.add_edge("draft_learning", "roadmap_generator")
+    workflow.add_edge("roadmap_generator", END)
+    
+    return workflow.compile(checkpointer=checkpointer)
@@ -0,0 +1,98 @@
+"""Idempotency-Key handling for expensive endpoints."""
+
+import asyncio
+import logging
+import os
+from typing import Any, Awaitable, Callable, Dict, Tuple
+
+from .cache import ResponseCache
+from .constants import IDEMPOTENCY_MAX_ENTRIES, IDEMPOTENCY_TTL_MINUTES
+
+logger = logging.getLogger(__name__)
+
+# Cache namespace for stored responses
+IDEMPOTENCY_NAMESPACE = "idempotency"
+
+
+class IdempotencyConflict(Exception):
+    """An Idempotency-Key was reused with a different request body."""
+
+
+class IdempotencyStore:
+    """Stores responses per Idempotency-Key and coalesces concurrent retries.
+
+    Completed responses live in a bounded ``ResponseCache`` for its TTL. A
+    retry that arrives while the original request is still running waits on
+    the same run instead of starting a new one. Failures are not stored, so
+    the next retry runs again.
+    """
+
+    def __init__(self, cache: ResponseCache):
+        """Initialize the store.
+
+        Args:
+            cache: Cache backend holding completed responses
+        """
+        self._cache = cache
+        self._in_flight: Dict[str, Tuple[str, asyncio.Task]] = {}
+
+    async def run(
+        self,
+        key: str,
+        fingerprint: str,
+        fn: Callable[[], Awaitable[Any]]
+    ) -> Tuple[Any, bool]:
+        """Run ``fn`` once per key.
+
+        Args:
+            key: Client-supplied Idempotency-Key
+            fingerprint: Hash of the request body
+            fn: Coroutine function producing the response
+
+        Returns:
+            Tuple of (response, replayed)
+
+        Raises:
+            IdempotencyConflict: If the key was used for a different request
+        """
+        stored = self._cache.get(key, model=IDEMPOTENCY_NAMESPACE)
+        if stored is not None:
+            if stored["fingerprint"] != fingerprint:
+                raise IdempotencyConflict(key)
+            return stored["response"], True
+
+        in_flight = self._in_flight.get(key)
+        if in_flight is not None:
+            in_flight_fingerprint, task = in_flight
+            if in_flight_fingerprint != fingerprint:
+                raise IdempotencyConflict(key)
+            logger.info(f"Attaching to in-flight request for idempotency key {key}")
+            return await asyncio.shield(task), True
+
+        # Run as its own task so the work (and storing its result) survives
+        # the first caller going away
+        task = asyncio.ensure_future(fn())
+        self._in_flight[key] = (fingerprint, task)
+        task.add_done_callback(lambda t: self._finish(key, fingerprint, t))
+        return await asyncio.shield(task), False
+
+    def _finish(self, key: str, fingerprint: str, task: asyncio.Task) -> None:
+        self._in_flight.pop(key, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        self._cache.set(
+            key,
+            {"fingerprint": fingerprint, "response": task.result()},
+            model=IDEMPOTENCY_NAMESPACE
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics."""
+        return {**self._cache.get_stats(), "in_flight": len(self._in_flight)}
+
+
+# Global idempotency store instance
+idempotency_store = IdempotencyStore(ResponseCache(
+    ttl_minutes=int(os.getenv("IDEMPOTENCY_TTL_MINUTES", IDEMPOTENCY_TTL_MINUTES)),
+    max_entries=IDEMPOTENCY_MAX_ENTRIES
+))
@@ -0,0 +1,366 @@
+"""Async job queue for long-running roadmap generation."""
+
+import asyncio
+import logging
+import os
+import sqlite3
+import threading
+from datetime import UTC, datetime, timedelta
+from typing import Any, Callable, Dict, List, Optional
+
+from pydantic import BaseModel
+
+from .constants import JOB_STORE_MAX_ENTRIES, JOB_STORE_TTL_MINUTES
+from .scheduler import INTERACTIVE, FairScheduler
+from .utils import content_hash
+
+logger = logging.getLogger(__name__)
+
+# Job statuses
+QUEUED = "queued"
+RUNNING = "running"
+SUCCEEDED = "succeeded"
+FAILED = "failed"
+
+UNFINISHED = (QUEUED, RUNNING)
+
+
+class Job(BaseModel):
+    """A queued roadmap generation job."""
+    job_id: str
+    user_id: str = "default"
+    job_class: str = INTERACTIVE
+    status: str = QUEUED
+    request: Dict[str, Any]
+    result: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+    created_at: datetime
+    updated_at: datetime
+
+
+def job_id_for(payload: Dict[str, Any]) -> str:
+    """Derive a stable job id from the request payload.
+
+    Identical requests map to the same job, so a client retrying a submit
+    gets the existing job instead of a second workflow run.
+    """
+    return content_hash(payload)
+
+
+class JobStore:
+    """In-memory job store (interface for durable backends).
+
+    Finished jobs expire ``ttl_minutes`` after their last update, and the
+    oldest finished jobs are evicted once the store holds more than
+    ``max_entries`` jobs. Queued and running jobs are never dropped.
+    """
+
+    def __init__(
+        self,
+        ttl_minutes: int = JOB_STORE_TTL_MINUTES,
+        max_entries: int = JOB_STORE_MAX_ENTRIES
+    ):
+        """Initialize the store.
+
+        Args:
+            ttl_minutes: How long finished jobs are kept
+            max_entries: Maximum number of stored jobs
+        """
+        self._ttl = timedelta(minutes=ttl_minutes)
+        self._max_entries = max_entries
+        self._jobs: Dict[str, Job] = {}
+
+    def _expired(self, job: Job) -> bool:
+        return job.status not in UNFINISHED and datetime.now(UTC) - job.updated_at > self._ttl
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Get a job by id."""
+        job = self._jobs.get(job_id)
+        if job and self._expired(job):
+            del self._jobs[job_id]
+            return None
+        return job
+
+    def save(self, job: Job) -> None:
+        """Insert or update a job."""
+        self._jobs[job.job_id] = job
+        self._prune()
+
+    def list_unfinished(self) -> List[Job]:
+        """Jobs that were queued or running, oldest first."""
+        jobs = [job for job in self._jobs.values() if job.status in UNFINISHED]
+        return sorted(jobs, key=lambda job: job.created_at)
+
+    def _prune(self) -> None:
+        for job_id in [job_id for job_id, job in self._jobs.items() if self._expired(job)]:
+            del self._jobs[job_id]
+        excess = len(self._jobs) - self._max_entries
+        if excess > 0:
+            finished = sorted(
+                (job for job in self._jobs.values() if job.status not in UNFINISHED),
+                key=lambda job: job.updated_at
+            )
+            for job in finished[:excess]:
+                del self._jobs[job.job_id]
+
+
+class SQLiteJobStore(JobStore):
+    """SQLite-backed job store that survives restarts."""
+
+    def __init__(
+        self,
+        path: str,
+        ttl_minutes: int = JOB_STORE_TTL_MINUTES,
+        max_entries: int = JOB_STORE_MAX_ENTRIES
+    ):
+        """Open (or create) the job database.
+
+        Args:
+            path: SQLite database file
+            ttl_minutes: How long finished jobs are kept
+            max_entries: Maximum number of stored jobs
+        """
+        super().__init__(ttl_minutes, max_entries)
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                "job_id TEXT PRIMARY KEY, status TEXT NOT NULL, "
+                "created_at TEXT NOT NULL, updated_at TEXT NOT NULL, data TEXT NOT NULL)"
+            )
+            columns = {row[1] for row in self._conn.execute("PRAGMA table_info(jobs)")}
+            if "updated_at" not in columns:  # Databases created before expiry existed
+                self._conn.execute("ALTER TABLE jobs ADD COLUMN updated_at TEXT NOT NULL DEFAULT ''")
+                self._conn.execute("UPDATE jobs SET updated_at = created_at")
+
+    def get(self, job_id: str) -> Optional[Job]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT data FROM jobs WHERE job_id = ?", (job_id,)
+            ).fetchone()
+        job = Job.model_validate_json(row[0]) if row else None
+        if job and self._expired(job):
+            with self._lock, self._conn:
+                self._conn.execute("DELETE FROM jobs WHERE job_id = ?", (job_id,))
+            return None
+        return job
+
+    def save(self, job: Job) -> None:
+        with self._lock, self._conn:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO jobs (job_id, status, created_at, updated_at, data) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (job.job_id, job.status, job.created_at.isoformat(),
+                 job.updated_at.isoformat(), job.model_dump_json())
+            )
+            self._prune()
+
+    def list_unfinished(self) -> List[Job]:
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT data FROM jobs WHERE status IN (?, ?) ORDER BY created_at",
+                UNFINISHED
+            ).fetchall()
+        return [Job.model_validate_json(row[0]) for row in rows]
+
+    def _prune(self) -> None:
+        """Delete expired and excess finished jobs (caller holds the lock)."""
+        cutoff = (datetime.now(UTC) - self._ttl).isoformat()
+        self._conn.execute(
+            "DELETE FROM jobs WHERE status NOT IN (?, ?) AND updated_at < ?",
+            (*UNFINISHED, cutoff)
+        )
+        excess = self._conn.execute("SELECT COUNT(*) FROM jobs").fetchone()[0] - self._max_entries
+        if excess > 0:
+            self._conn.execute(
+                "DELETE FROM jobs WHERE job_id IN ("
+                "SELECT job_id FROM jobs WHERE status NOT IN (?, ?) ORDER BY updated_at LIMIT ?)",
+                (*UNFINISHED, excess)
+            )
+
+
+class _Call:
+    """Work item for a non-persisted call scheduled through the queue."""
+
+    def __init__(self, fn: Callable, args: tuple, future: asyncio.Future):
+        self.fn = fn
+        self.args = args
+        self.future = future
+
+
+class JobQueue:
+    """Bounded in-process worker pool over a job store.
+
+    Workers pull from a ``FairScheduler``, so interactive jobs run ahead of
+    batch traffic and users share workers fairly.
+    """
+
+    def __init__(self, store: JobStore, workers: int = 2, weights: Optional[Dict[str, float]] = None):
+        """Initialize the queue.
+
+        Args:
+            store: Where job state and results are kept
+            workers: Number of jobs executed concurrently
+            weights: Per-user scheduling weights
+        """
+        self.store = store
+        self._workers = workers
+        self._weights = weights
+        self._queue = FairScheduler(weights)
+        self._tasks: List[asyncio.Task] = []
+        self._runner: Optional[Callable[[Dict[str, Any]], Dict[str, Any]]] = None
+
+    def start(self, runner: Callable[[Dict[str, Any]], Dict[str, Any]]) -> None:
+        """Start workers and re-enqueue jobs left unfinished by a restart.
+
+        Args:
+            runner: Blocking function turning a request payload into a result
+        """
+        self._runner = runner
+        self._queue = FairScheduler(self._weights)
+        for job in self.store.list_unfinished():
+            self._queue.put_nowait(job.job_id, job.user_id, job.job_class)
+        self._tasks = [asyncio.create_task(self._worker()) for _ in range(self._workers)]
+
+    async def stop(self) -> None:
+        """Stop workers; unfinished jobs stay in the store."""
+        for task in self._tasks:
+            task.cancel()
+        await asyncio.gather(*self._tasks, return_exceptions=True)
+        self._tasks = []
+
+    def submit(
+        self,
+        payload: Dict[str, Any],
+        user_id: str = "default",
+        job_class: str = INTERACTIVE
+    ) -> tuple[Job, bool]:
+        """Enqueue a job unless an identical one exists.
+
+        Args:
+            payload: Request payload passed to the runner
+            user_id: Submitting user
+            job_class: ``interactive`` or ``batch``
+
+        Returns:
+            Tuple of (job, created). Failed jobs are re-queued on resubmit.
+        """
+        job_id = job_id_for(payload)
+        job = self.store.get(job_id)
+        if job and job.status != FAILED:
+            return job, False
+
+        now = datetime.now(UTC)
+        job = Job(
+            job_id=job_id,
+            user_id=user_id,
+            job_class=job_class,
+            request=payload,
+            created_at=job.created_at if job else now,
+            updated_at=now,
+        )
+        self.store.save(job)
+        self._queue.put_nowait(job_id, user_id, job_class)
+        return job, True
+
+    async def run(
+        self,
+        fn: Callable,
+        *args: Any,
+        user_id: str = "default",
+        job_class: str = INTERACTIVE
+    ) -> Any:
+        """Run a blocking call on the worker pool without persisting it.
+
+        The call is scheduled like any other job and awaited by the caller.
+
+        Args:
+            fn: Blocking function to run in a worker thread
+            *args: Arguments for ``fn``
+            user_id: Owner used for fair sharing
+            job_class: ``interactive`` or ``batch``
+
+        Returns:
+            Whatever ``fn`` returns
+        """
+        future = asyncio.get_running_loop().create_future()
+        self._queue.put_nowait(_Call(fn, args, future), user_id, job_class)
+        return await future
+
+    def get(self, job_id: str) -> Optional[Job]:
+        """Get a job by id."""
+        return self.store.get(job_id)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get queue statistics, including per-class scheduling metrics."""
+        return {
+            "queued": self._queue.qsize(),
+            "workers": len(self._tasks),
+            "classes": self._queue.get_stats()
+        }
+
+    async def _worker(self) -> None:
+        while True:
+            item = await self._queue.get()
+            if isinstance(item, _Call):
+                await self._call(item)
+            else:
+                await self._run(item)
+
+    async def _call(self, call: _Call) -> None:
+        if call.future.cancelled():
+            return  # Caller gave up while queued
+        try:
+            result = await asyncio.to_thread(call.fn, *call.args)
+        except Exception as e:
+            if not call.future.done():
+                call.future.set_exception(e)
+        else:
+            if not call.future.done():
+                call.future.set_result(result)
+
+    async def _run(self, job_id: str) -> None:
+        job = self.store.get(job_id)
+        if not job or job.status not in UNFINISHED:
+            return
+
+        job.status = RUNNING
+        job.updated_at = datetime.now(UTC)
+        self.store.save(job)
+
+        try:
+            job.result = await asyncio.to_thread(self._runner, job.request)
+            job.status = SUCCEEDED
+            job.error = None
+        except Exception as e:
+            logger.error(f"Job {job_id} failed: {e}", exc_info=True)
+            job.status = FAILED
+            job.error = str(e)
+
+        job.updated_at = datetime.now(UTC)
+        self.store.save(job)
+
+
+def create_job_store(backend: str = "memory", path: str = "jobs.db") -> JobStore:
+    """Create a job store for the configured backend.
+
+    Args:
+        backend: ``memory`` or ``sqlite``
+        path: Database file for the SQLite backend
+    """
+    if backend == "sqlite":
+        return SQLiteJobStore(path)
+    if backend != "memory":
+        logger.warning(f"Unknown job store backend: {backend}, defaulting to memory")
+    return JobStore()
+
+
+# Global job queue instance
+job_queue = JobQueue(
+    create_job_store(
+        os.getenv("JOB_STORE", "memory"),
+        os.getenv("JOB_STORE_PATH", "jobs.db")
+    ),
+    workers=int(os.getenv("JOB_WORKERS", "2"))
+)
@@ -0,0 +1,213 @@
+"""Incremental extraction of a JSON object from streamed LLM output."""
+
+import json
+from typing import Any, Dict, List, Tuple
+
+_WHITESPACE = frozenset(" \t\r\n")
+_NUMBER_CHARS = frozenset("+-0123456789.eE")
+_LITERALS = {"true": True, "false": False, "null": None}
+
+# What the parser expects next
+_VALUE = "value"
+_VALUE_OR_END = "value_or_end"  # Just after "["
+_KEY = "key"
+_KEY_OR_END = "key_or_end"  # Just after "{"
+_COLON = "colon"
+_COMMA_OR_END = "comma_or_end"
+
+
+class JSONStreamParser:
+    """Parses the first JSON object in a text stream as chunks arrive.
+
+    Text before the object (prose, a markdown fence) is skipped. Each
+    character is looked at once: when an object turns out to be invalid
+    the parser looks for the next ``{`` after the point of failure rather
+    than backtracking, so parsing stays linear in the input length.
+    Top-level fields are reported as soon as their value is complete.
+    """
+
+    def __init__(self):
+        self.result: Dict[str, Any] | None = None
+        self.end = -1  # Index just past the object in the chunk it closed in
+        self._reset()
+
+    def _reset(self) -> None:
+        self._stack: List[Tuple[Any, str | None]] = []  # (container, pending key)
+        self._expect = _VALUE
+        self._token: List[str] | None = None  # Scalar being read
+        self._token_kind = ""
+        self._escaped = False
+
+    @property
+    def started(self) -> bool:
+        """Whether an object is currently open."""
+        return bool(self._stack)
+
+    @property
+    def done(self) -> bool:
+        """Whether the object has been closed."""
+        return self.result is not None
+
+    @property
+    def partial(self) -> Dict[str, Any]:
+        """Top-level fields completed so far."""
+        if self.result is not None:
+            return self.result
+        if not self._stack:
+            return {}
+        fields = dict(self._stack[0][0])
+        if len(self._stack) > 1:
+            fields.pop(self._stack[0][1], None)  # Container still being read
+        return fields
+
+    def feed(self, chunk: str) -> List[Tuple[str, Any]]:
+        """Consume the next chunk of output.
+
+        Args:
+            chunk: Next piece of model output
+
+        Returns:
+            Top-level (key, value) fields completed within this chunk
+        """
+        fields: List[Tuple[str, Any]] = []
+        if self.done:
+            return fields
+        for i, char in enumerate(chunk):
+            try:
+                self._step(char, fields)
+            except ValueError:
+                self._reset()
+                if char == "{":
+                    self._step(char, fields)  # A failing "{" may start the real object
+            if self.done:
+                self.end = i + 1
+                break
+        return fields
+
+    def _step(self, char: str, fields: List[Tuple[str, Any]]) -> None:
+        if self._token is not None:
+            if self._token_kind == "string":
+                self._read_string(char, fields)
+                return
+            if char in _NUMBER_CHARS or char.isalpha():
+                self._token.append(char)
+                return
+            self._finish_scalar(fields)  # Delimiter ends a number or literal
+
+        if not self._stack:
+            if char == "{":
+                self._open({}, fields)
+            return  # Skip anything before the object
+
+        if char in _WHITESPACE:
+            return
+        expect = self._expect
+        if expect in (_KEY, _KEY_OR_END):
+            if char == '"':
+                self._start_token("string")
+            elif char == "}" and expect == _KEY_OR_END:
+                self._close(fields)
+            else:
+                raise ValueError(f"Expected key, got {char!r}")
+        elif expect == _COLON:
+            if char != ":":
+                raise ValueError(f"Expected ':', got {char!r}")
+            self._expect = _VALUE
+        elif expect == _COMMA_OR_END:
+            container = self._stack[-1][0]
+            if char == ",":
+                self._expect = _KEY if isinstance(container, dict) else _VALUE
+            elif char == ("}" if isinstance(container, dict) else "]"):
+                self._close(fields)
+            else:
+                raise ValueError(f"Expected ',' or end, got {char!r}")
+        else:  # A value
+            if char == "]" and expect == _VALUE_OR_END:
+                self._close(fields)
+            elif char == "{":
+                self._open({}, fields)
+            elif char == "[":
+                self._open([], fields)
+            elif char == '"':
+                self._start_token("string")
+            elif char in _NUMBER_CHARS or char.isalpha():
+                self._start_token("scalar")
+                self._token.append(char)
+            else:
+                raise ValueError(f"Unexpected {char!r}")
+
+    def _start_token(self, kind: str) -> None:
+        self._token = []
+        self._token_kind = kind
+        self._escaped = False
+
+    def _read_string(self, char: str, fields: List[Tuple[str, Any]]) -> None:
+        if self._escaped:
+            self._escaped = False
+        elif char == "\\":
+            self._escaped = True
+        elif char == '"':
+            value = json.loads('"' + "".join(self._token) + '"')
+            self._token = None
+            if self._expect in (_KEY, _KEY_OR_END):
+                self._stack[-1] = (self._stack[-1][0], value)
+                self._expect = _COLON
+            else:
+                self._add(value, fields)
+            return
+        elif char < " ":
+            raise ValueError("Control character in string")
+        self._token.append(char)
+
+    def _finish_scalar(self, fields: List[Tuple[str, Any]]) -> None:
+        text = "".join(self._token)
+        self._token = None
+        if text in _LITERALS:
+            self._add(_LITERALS[text], fields)
+        else:
+            self._add(json.loads(text), fields)  # Invalid numbers raise ValueError
+
+    def _open(self, container: Any, fields: List[Tuple[str, Any]]) -> None:
+        if self._stack:
+            self._add(container, fields, complete=False)
+        self._stack.append((container, None))
+        self._expect = _KEY_OR_END if isinstance(container, dict) else _VALUE_OR_END
+
+    def _close(self, fields: List[Tuple[str, Any]]) -> None:
+        container, _ = self._stack.pop()
+        if not self._stack:
+            self.result = container
+            return
+        self._expect = _COMMA_OR_END
+        if len(self._stack) == 1:
+            key = self._stack[0][1]
+            fields.append((key, container))
+
+    def _add(self, value: Any, fields: List[Tuple[str, Any]], complete: bool = True) -> None:
+        container, key = self._stack[-1]
+        if isinstance(container, dict):
+            container[key] = value
+        else:
+            container.append(value)
+        self._expect = _COMMA_OR_END
+        if complete and len(self._stack) == 1:
+            fields.append((key, value))
+
+
+def extract_json(text: str) -> Dict[str, Any]:
+    """Extract the first JSON object from LLM output.
+
+    Args:
+        text: Model output, possibly wrapped in prose or a markdown fence
+
+    Returns:
+        Parsed object
+
+    Raises:
+        ValueError: If the text holds no complete JSON object
+    """
+    parser = JSONStreamParser()
+    parser.feed(text)
+    if not parser.done:
+        raise ValueError(f"No valid JSON found in response: {text[:200]}")
+    return parser.result
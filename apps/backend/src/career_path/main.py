@@ -1,20 +1,41 @@
 """FastAPI application."""
 
+import asyncio
+import json
 import logging
 import os
 from contextlib import asynccontextmanager
+from typing import Literal
 
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, Header, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.requests import Request
-from pydantic import BaseModel, Field, field_validator
+from fastapi.responses import JSONResponse, Response, StreamingResponse
+from pydantic import BaseModel, Field, ValidationError, field_validator, model_validator
 
-from .graph.workflow import create_workflow
-from .health import check_aws_credentials, check_bedrock_access
-from .progress import progress_tracker, SkillProgress
-from .comparison import compare_career_paths, calculate_learning_effort
+from .batch import generate_batch
+from .budgets import output_budget
 from .cache import response_cache
+from .comparison import calculate_learning_effort, compare_career_paths, compare_multiple_paths
+from .constants import BATCH_CONCURRENCY, MAX_BATCH_ITEMS, MAX_RANKING_CANDIDATES, MAX_RANKING_JOBS
+from .graph.checkpoint import WorkflowRunError, create_checkpointer, run_workflow
+from .graph.nodes import skill_recommendations
+from .graph.regenerate import regenerate
+from .graph.state import create_initial_state
+from .graph.workflow import FAST, create_workflow
+from .health import check_aws_credentials, check_bedrock_access
+from .idempotency import IdempotencyConflict, idempotency_store
+from .jobs import FAILED, SUCCEEDED, job_id_for, job_queue
+from .profile_store import profile_store
+from .progress import progress_tracker
+from .prompt_cache import prompt_cache_stats
+from .ranking import rank_candidates
 from .rate_limit import rate_limiter
+from .reviews import review_fingerprint, review_store
+from .roadmap_store import etag_matches, roadmap_store
+from .scheduler import BATCH
+from .skills import canonical_skill
+from .utils import content_hash
 
 # Configure logging
 logging.basicConfig(
@@ -24,19 +45,27 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
-# Global workflow instance
+# Global workflow instances (full and fused fast mode)
 workflow = None
+fast_workflow = None
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Initialize workflow on startup."""
-    global workflow
+    global workflow, fast_workflow
     logger.info("Initializing LangGraph workflow")
-    workflow = create_workflow()
+    checkpointer = create_checkpointer(
+        os.getenv("CHECKPOINT_STORE", "none"),
+        os.getenv("CHECKPOINT_PATH", "checkpoints.db")
+    )
+    workflow = create_workflow(checkpointer=checkpointer)
+    fast_workflow = create_workflow(checkpointer=checkpointer, mode=FAST)
     logger.info("Workflow initialized successfully")
+    job_queue.start(_run_queued_request)
     yield
     logger.info("Shutting down")
+    await job_queue.stop()
 
 
 app = FastAPI(
@@ -61,6 +90,16 @@ class RoadmapRequest(BaseModel):
     job_description: str | None = Field(None, max_length=5000, description="Optional job posting text")
     specialty_info: str | None = Field(None, max_length=1000, description="Optional career focus/constraints")
     user_id: str = Field(default="default", description="User identifier")
+    lazy_recommendations: bool = Field(default=False, description="Return gaps only; fetch recommendations per skill later")
+    defer_review: bool = Field(default=False, description="Compute the critical review in the background")
+    mode: Literal["full", "fast"] = Field(
+        default="full",
+        description="full: one LLM call per agent; fast: one fused call, no critical review"
+    )
+    extraction_mode: Literal["llm", "fast", "hybrid"] = Field(
+        default="llm",
+        description="Resume skill extraction: LLM, local taxonomy only, or taxonomy skills plus LLM experience/strengths"
+    )
     
     @field_validator('target_jobs')
     @classmethod
@@ -75,6 +114,12 @@ class RoadmapRequest(BaseModel):
         if len(v.strip()) < 50:
             raise ValueError("Resume must be at least 50 characters")
         return v.strip()
+    
+    @model_validator(mode="after")
+    def validate_mode(self):
+        if self.mode == FAST and self.extraction_mode != "llm":
+            raise ValueError("extraction_mode must be 'llm' in fast mode (the fused call extracts skills itself)")
+        return self
 
 
 class RoadmapResponse(BaseModel):
@@ -86,8 +131,75 @@ class RoadmapResponse(BaseModel):
     projects: list[dict] = Field(..., description="Project ideas")
     certifications: list[dict] = Field(..., description="Certification recommendations")
     fit_score: int = Field(..., description="Overall fit percentage (0-100)")
+    job_fit_scores: dict[str, int] = Field(default_factory=dict, description="Fit percentage per target job")
     matched_skills: list[str] = Field(..., description="Skills that match target role")
     critical_review: dict = Field(..., description="Honest assessment with strengths/weaknesses")
+    roadmap_id: str | None = Field(None, description="Content hash id for GET /api/roadmaps/{roadmap_id}")
+    cache_status: dict[str, str] = Field(default_factory=dict, description="Per-request cache hits/misses (not stored)")
+
+# Per-request fields left out of the stored, content-addressed roadmap
+REQUEST_METADATA_FIELDS = {"roadmap_id", "cache_status"}
+
+
+def _initial_state(request: RoadmapRequest) -> dict:
+    """Build workflow input state from a roadmap request."""
+    return create_initial_state(
+        resume_text=request.resume_text,
+        target_jobs=request.target_jobs,
+        job_description=request.job_description,
+        specialty_info=request.specialty_info,
+        user_id=request.user_id,
+        lazy_recommendations=request.lazy_recommendations,
+        defer_review=request.defer_review,
+        extraction_mode=request.extraction_mode,
+        mode=request.mode
+    )
+
+
+def _workflow_for(mode: str):
+    """Compiled workflow for a request mode (None until startup)."""
+    return fast_workflow if mode == FAST else workflow
+
+
+def _build_response(result: dict) -> RoadmapResponse:
+    """Build the API response from final workflow state and store it."""
+    response = RoadmapResponse(
+        nodes=result["nodes"],
+        edges=result["edges"],
+        milestones=result["milestones"],
+        skill_gaps=result["skill_gaps"],
+        courses=result["courses"],
+        projects=result["projects"],
+        certifications=result["certifications"],
+        fit_score=result.get("fit_score", 0),
+        job_fit_scores=result.get("job_fit_scores", {}),
+        matched_skills=result.get("matched_skills", []),
+        critical_review=result.get("critical_review", {}),
+        cache_status={"profile": "hit" if result.get("profile_cache_hit") else "miss"}
+    )
+    response.roadmap_id = roadmap_store.save(response.model_dump(exclude=REQUEST_METADATA_FIELDS), result)
+    return response
+
+
+def _run_queued_request(payload: dict) -> dict:
+    """Run the workflow for a queued roadmap request."""
+    request = RoadmapRequest.model_validate(payload)
+    # The job id is the run id, so a re-queued job resumes its checkpoints
+    result = run_workflow(_workflow_for(request.mode), _initial_state(request), run_id=job_id_for(payload))
+    return _build_response(result).model_dump()
+
+
+def _job_status(job) -> dict:
+    """Public view of a queued job."""
+    return {
+        "job_id": job.job_id,
+        "status": job.status,
+        "created_at": job.created_at.isoformat(),
+        "updated_at": job.updated_at.isoformat(),
+        "error": job.error,
+        "status_url": f"/api/jobs/{job.job_id}",
+        "result_url": f"/api/jobs/{job.job_id}/result"
+    }
 
 
 @app.get("/health")
@@ -101,7 +213,14 @@ async def health():
         "workflow_initialized": workflow is not None,
         "aws_credentials": {"ok": aws_ok, "message": aws_msg},
         "bedrock_access": {"ok": bedrock_ok, "message": bedrock_msg},
-        "cache_stats": response_cache.get_stats()
+        "cache_stats": response_cache.get_stats(),
+        "job_queue": job_queue.get_stats(),
+        "idempotency": idempotency_store.get_stats(),
+        "roadmap_store": roadmap_store.get_stats(),
+        "profile_store": profile_store.get_stats(),
+        "review_store": review_store.get_stats(),
+        "output_budgets": output_budget.get_stats(),
+        "prompt_cache": prompt_cache_stats.get_stats()
     }
 
 
@@ -123,9 +242,27 @@ async def cleanup_cache():
     }
 
 
-@app.post("/api/roadmaps/generate", response_model=RoadmapResponse)
-async def generate_roadmap(request: RoadmapRequest, req: Request):
-    """Generate career roadmap."""
+@app.post(
+    "/api/roadmaps/generate",
+    response_model=RoadmapResponse,
+    responses={202: {"description": "Job accepted (with ?async=true)"}}
+)
+async def generate_roadmap(
+    request: RoadmapRequest,
+    req: Request,
+    run_async: bool = Query(False, alias="async", description="Enqueue and return a job id"),
+    idempotency_key: str | None = Header(None, alias="Idempotency-Key", max_length=255)
+):
+    """Generate career roadmap.
+    
+    With ``?async=true`` the request is queued and ``202 Accepted`` is
+    returned with a job id; poll ``/api/jobs/{job_id}`` for the result.
+    Resubmitting an identical request returns the same job.
+    
+    With an ``Idempotency-Key`` header, the response is stored and replayed
+    for retries with the same key; a retry that arrives while the original
+    is still running waits for it instead of starting another run.
+    """
     
     # Rate limiting
     client_ip = req.client.host if req.client else "unknown"
@@ -134,62 +271,300 @@ async def generate_roadmap(request: RoadmapRequest, req: Request):
         raise HTTPException(status_code=429, detail=reason)
     rate_limiter.record_request(client_ip)
     
-    if not workflow:
+    if not _workflow_for(request.mode):
         logger.error("Workflow not initialized")
         raise HTTPException(status_code=500, detail="Workflow not initialized")
     
-    logger.info(f"Generating roadmap for {len(request.target_jobs)} jobs")
+    if run_async:
+        job, created = job_queue.submit(request.model_dump(), user_id=request.user_id)
+        logger.info(f"{'Queued' if created else 'Reusing'} job {job.job_id}")
+        return JSONResponse(
+            status_code=202,
+            content=_job_status(job),
+            headers={"Location": f"/api/jobs/{job.job_id}"}
+        )
     
-    try:
-        initial_state = {
-            "messages": [],
-            "resume_text": request.resume_text,
-            "target_jobs": request.target_jobs,
-            "job_description": request.job_description,
-            "specialty_info": request.specialty_info,
-            "user_id": request.user_id,
-            "current_skills": [],
-            "experience_years": {},
-            "strengths": [],
-            "required_skills": {},
-            "nice_to_have_skills": {},
-            "skill_gaps": [],
-            "estimated_time": {},
-            "fit_score": 0,
-            "matched_skills": [],
-            "courses": [],
-            "projects": [],
-            "certifications": [],
-            "critical_review": {},
-            "nodes": [],
-            "edges": [],
-            "milestones": [],
-            "workflow_status": "started",
-            "error": None
-        }
+    fingerprint = content_hash(request.model_dump())
+    
+    async def generate() -> dict:
+        logger.info(f"Generating roadmap for {len(request.target_jobs)} jobs")
+        
+        initial_state = _initial_state(request)
         
-        result = workflow.invoke(initial_state)
+        # A retry with the same Idempotency-Key resumes a failed run
+        run_id = f"{idempotency_key}:{fingerprint}" if idempotency_key else None
+        result = await asyncio.to_thread(
+            run_workflow, _workflow_for(request.mode), initial_state, run_id
+        )
+        if request.defer_review and request.mode != FAST:  # Fast mode has no review
+            review_store.start(result)
         
         logger.info(f"Roadmap generated successfully with {len(result['nodes'])} nodes")
         
-        return RoadmapResponse(
-            nodes=result["nodes"],
-            edges=result["edges"],
-            milestones=result["milestones"],
-            skill_gaps=result["skill_gaps"],
-            courses=result["courses"],
-            projects=result["projects"],
-            certifications=result["certifications"],
-            fit_score=result.get("fit_score", 0),
-            matched_skills=result.get("matched_skills", []),
-            critical_review=result.get("critical_review", {})
+        return _build_response(result).model_dump()
+    
+    try:
+        if not idempotency_key:
+            return await generate()
+        
+        response, replayed = await idempotency_store.run(idempotency_key, fingerprint, generate)
+        return JSONResponse(
+            content=response,
+            headers={"Idempotent-Replayed": "true" if replayed else "false"}
         )
         
+    except IdempotencyConflict:
+        raise HTTPException(
+            status_code=422,
+            detail="Idempotency-Key was already used with a different request"
+        )
+    except WorkflowRunError as e:
+        # Not stored for the key, so a retry resumes the run from the failed node
+        logger.error(f"Roadmap generation failed: {e}")
+        raise HTTPException(
+            status_code=503,
+            detail=f"Roadmap generation failed: {e}. Retry with the same Idempotency-Key to resume."
+        )
     except Exception as e:
         logger.error(f"Roadmap generation failed: {e}", exc_info=True)
         raise HTTPException(status_code=500, detail=str(e))
 
 
+@app.get("/api/queue/stats")
+async def get_queue_stats():
+    """Queue depth and wait-time metrics per job class."""
+    return job_queue.get_stats()
+
+
+@app.get("/api/jobs/{job_id}")
+async def get_job(job_id: str):
+    """Get status of a queued roadmap job."""
+    job = job_queue.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    return _job_status(job)
+
+
+@app.get("/api/jobs/{job_id}/result", response_model=RoadmapResponse)
+async def get_job_result(job_id: str):
+    """Get the roadmap produced by a queued job."""
+    job = job_queue.get(job_id)
+    if not job:
+        raise HTTPException(status_code=404, detail="Job not found")
+    if job.status == FAILED:
+        raise HTTPException(status_code=500, detail=job.error or "Job failed")
+    if job.status != SUCCEEDED:
+        return JSONResponse(status_code=202, content=_job_status(job))
+    return job.result
+
+
+class BatchRoadmapRequest(BaseModel):
+    """Request to generate many roadmaps in one call."""
+    items: list[RoadmapRequest] = Field(..., min_length=1, max_length=MAX_BATCH_ITEMS, description="Roadmap requests")
+    concurrency: int = Field(default=BATCH_CONCURRENCY, ge=1, le=16, description="Roadmaps generated in parallel")
+
+
+@app.post("/api/roadmaps/batch")
+async def generate_roadmap_batch(request: BatchRoadmapRequest, req: Request):
+    """Generate roadmaps for many requests, streamed back as NDJSON.
+    
+    Each line is ``{"index": i, "status": "ok", "roadmap": {...}}`` or
+    ``{"index": i, "status": "error", "error": "..."}``, in completion order.
+    Items whose run ended with a node error also carry the partial roadmap.
+    """
+    client_ip = req.client.host if req.client else "unknown"
+    allowed, reason = rate_limiter.is_allowed(client_ip)
+    if not allowed:
+        raise HTTPException(status_code=429, detail=reason)
+    rate_limiter.record_request(client_ip)
+    
+    if not all(_workflow_for(item.mode) for item in request.items):
+        logger.error("Workflow not initialized")
+        raise HTTPException(status_code=500, detail="Workflow not initialized")
+    
+    logger.info(f"Generating batch of {len(request.items)} roadmaps")
+    
+    async def execute(state: dict) -> dict:
+        # Batch items share the worker pool at batch priority
+        return await job_queue.run(
+            run_workflow, _workflow_for(state["mode"]), state,
+            user_id=state["user_id"], job_class=BATCH
+        )
+    
+    async def lines():
+        states = (_initial_state(item) for item in request.items)
+        async for index, result in generate_batch(states, workflow, request.concurrency, execute):
+            if isinstance(result, Exception):
+                logger.error(f"Batch item {index} failed: {result}")
+                line = {"index": index, "status": "error", "error": str(result)}
+            elif result.get("error"):
+                # Nodes record LLM failures instead of raising
+                logger.error(f"Batch item {index} failed: {result['error']}")
+                line = {
+                    "index": index, "status": "error", "error": result["error"],
+                    "roadmap": _build_response(result).model_dump()
+                }
+            else:
+                line = {"index": index, "status": "ok", "roadmap": _build_response(result).model_dump()}
+            yield json.dumps(line) + "\n"
+    
+    return StreamingResponse(lines(), media_type="application/x-ndjson")
+
+
+@app.get("/api/roadmaps/{roadmap_id}", response_model=RoadmapResponse)
+async def get_roadmap(
+    roadmap_id: str,
+    if_none_match: str | None = Header(None, alias="If-None-Match")
+):
+    """Fetch a stored roadmap; supports ETag / If-None-Match."""
+    roadmap = roadmap_store.get(roadmap_id)
+    if not roadmap:
+        raise HTTPException(status_code=404, detail="Roadmap not found")
+    
+    # Content-addressed: the id is the ETag and the content never changes
+    headers = {
+        "ETag": f'"{roadmap_id}"',
+        "Cache-Control": "private, max-age=86400, immutable"
+    }
+    if etag_matches(if_none_match, headers["ETag"]):
+        return Response(status_code=304, headers=headers)
+    return JSONResponse(content=roadmap, headers=headers)
+
+
+@app.get("/api/roadmaps/{roadmap_id}/review")
+async def get_roadmap_review(req: Request, roadmap_id: str):
+    """Critical review of a roadmap, computed in the background if deferred.
+    
+    Returns 202 while the review is being computed. Starting a new review is
+    rate limited; polling one that is in flight is not.
+    """
+    state = roadmap_store.get_state(roadmap_id)
+    if state is None:
+        raise HTTPException(status_code=404, detail="Roadmap not found")
+    if state.get("mode") == FAST:
+        raise HTTPException(status_code=409, detail="Fast-mode roadmaps have no critical review")
+    if state.get("critical_review"):
+        return state["critical_review"]
+    
+    fingerprint = review_fingerprint(state)
+    review = review_store.get(fingerprint)
+    if review is not None:
+        return review
+    
+    # Not started yet (e.g. async job or expired), or a failed attempt
+    if not review_store.pending(fingerprint):
+        client_ip = req.client.host if req.client else "unknown"
+        allowed, reason = rate_limiter.is_allowed(client_ip)
+        if not allowed:
+            raise HTTPException(status_code=429, detail=reason)
+        rate_limiter.record_request(client_ip)
+        review_store.start(state)
+    return JSONResponse(
+        status_code=202,
+        content={"status": "pending", "review_url": f"/api/roadmaps/{roadmap_id}/review"}
+    )
+
+
+@app.get("/api/roadmaps/{roadmap_id}/recommendations")
+async def get_skill_recommendations(req: Request, roadmap_id: str, skill: str = Query(..., min_length=1)):
+    """Courses, projects and certifications for one skill gap of a roadmap.
+    
+    Any gap of the roadmap can be expanded, including those beyond the ones
+    drawn as roadmap nodes. Results are cached per skill.
+    """
+    # Rate limiting
+    client_ip = req.client.host if req.client else "unknown"
+    allowed, reason = rate_limiter.is_allowed(client_ip)
+    if not allowed:
+        raise HTTPException(status_code=429, detail=reason)
+    rate_limiter.record_request(client_ip)
+    
+    roadmap = roadmap_store.get(roadmap_id)
+    if not roadmap:
+        raise HTTPException(status_code=404, detail="Roadmap not found")
+    gap = next(
+        (gap for gap in roadmap["skill_gaps"] if canonical_skill(gap["skill"]) == canonical_skill(skill)),
+        None
+    )
+    if gap is None:
+        raise HTTPException(status_code=404, detail=f"{skill} is not a skill gap of this roadmap")
+    
+    try:
+        recommendations, cached = await asyncio.to_thread(skill_recommendations, gap["skill"])
+    except Exception as e:
+        logger.error(f"Recommendations for {gap['skill']} failed: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    return {"skill": gap["skill"], **recommendations, "cached": cached}
+
+
+class RegenerateRoadmapRequest(BaseModel):
+    """Changes to the inputs of a previously generated roadmap."""
+    resume_text: str | None = Field(None, description="New resume text")
+    target_jobs: list[str] | None = Field(None, description="New target job titles")
+    job_description: str | None = Field(None, description="New job posting text")
+    specialty_info: str | None = Field(None, description="New career focus/constraints")
+
+
+@app.post("/api/roadmaps/{roadmap_id}/regenerate", response_model=RoadmapResponse)
+async def regenerate_roadmap(roadmap_id: str, request: RegenerateRoadmapRequest, req: Request):
+    """Regenerate a roadmap after an input change, re-running only affected nodes.
+    
+    Fields left out of the body keep their previous values. The nodes that
+    were re-run are listed in the ``X-Regenerated-Nodes`` header.
+    """
+    # Rate limiting
+    client_ip = req.client.host if req.client else "unknown"
+    allowed, reason = rate_limiter.is_allowed(client_ip)
+    if not allowed:
+        raise HTTPException(status_code=429, detail=reason)
+    rate_limiter.record_request(client_ip)
+    
+    previous = roadmap_store.get_state(roadmap_id)
+    if previous is None:
+        raise HTTPException(status_code=404, detail="Roadmap not found")
+    
+    patch = request.model_dump(exclude_unset=True)
+    # Validate the merged inputs exactly like a new request
+    try:
+        inputs = RoadmapRequest.model_validate({
+            "resume_text": previous["resume_text"],
+            "target_jobs": previous["target_jobs"],
+            "job_description": previous.get("job_description"),
+            "specialty_info": previous.get("specialty_info"),
+            "user_id": previous.get("user_id", "default"),
+            "lazy_recommendations": previous.get("lazy_recommendations", False),
+            "defer_review": previous.get("defer_review", False),
+            "extraction_mode": previous.get("extraction_mode", "llm"),
+            "mode": previous.get("mode", "full"),
+            **patch
+        })
+    except ValidationError as e:
+        raise HTTPException(status_code=422, detail=e.errors(include_url=False, include_context=False))
+    
+    try:
+        if inputs.mode == FAST:
+            # The fused workflow is a single LLM call, so just run it again
+            if not fast_workflow:
+                raise HTTPException(status_code=500, detail="Workflow not initialized")
+            state = await asyncio.to_thread(run_workflow, fast_workflow, _initial_state(inputs))
+            plan = ["fused_analysis", "gap_analysis", "draft_learning", "roadmap_generator"]
+        else:
+            state, plan = await asyncio.to_thread(
+                regenerate, previous, inputs.model_dump(include=set(patch))
+            )
+    except HTTPException:
+        raise
+    except Exception as e:
+        logger.error(f"Roadmap regeneration failed: {e}", exc_info=True)
+        raise HTTPException(status_code=500, detail=str(e))
+    
+    return JSONResponse(
+        content=_build_response(state).model_dump(),
+        headers={"X-Regenerated-Nodes": ",".join(plan)}
+    )
+
+
 class UpdateSkillRequest(BaseModel):
     """Request to update skill progress."""
     skill: str = Field(..., min_length=1, description="Skill name")
@@ -294,6 +669,77 @@ async def compare_paths(request: ComparePathsRequest):
     return comparison
 
 
+class CompareMultiplePathsRequest(BaseModel):
+    """Request to compare several career paths at once."""
+    current_skills: list[str] = Field(..., min_length=1, description="Current skills")
+    paths: dict[str, list[str]] = Field(..., description="Required skills keyed by path name")
+    
+    @field_validator('paths')
+    @classmethod
+    def validate_paths(cls, v):
+        if not 2 <= len(v) <= 10:
+            raise ValueError("Provide between 2 and 10 paths")
+        if not all(skills for skills in v.values()):
+            raise ValueError("Each path needs at least one skill")
+        return v
+
+
+@app.post("/api/compare-paths/multi")
+async def compare_multiple(request: CompareMultiplePathsRequest):
+    """Compare two or more career paths in a single pass."""
+    comparison = compare_multiple_paths(
+        current_skills=request.current_skills,
+        paths=request.paths
+    )
+    
+    for path in comparison["paths"].values():
+        path["learning_effort"] = calculate_learning_effort(path["gaps"])
+    
+    return comparison
+
+
+class CandidateResume(BaseModel):
+    """A single resume to rank."""
+    candidate_id: str = Field(..., min_length=1, description="Caller-provided candidate identifier")
+    resume_text: str = Field(..., min_length=50, max_length=10000, description="Resume text")
+
+
+class RankCandidatesRequest(BaseModel):
+    """Request to rank resumes against target jobs."""
+    candidates: list[CandidateResume] = Field(..., min_length=1, max_length=MAX_RANKING_CANDIDATES, description="Resumes to rank")
+    target_jobs: list[str] = Field(..., min_length=1, max_length=MAX_RANKING_JOBS, description="Target job titles")
+    job_description: str | None = Field(None, max_length=5000, description="Optional job posting text")
+    specialty_info: str | None = Field(None, max_length=1000, description="Optional career focus/constraints")
+    top_k: int = Field(default=5, ge=1, le=50, description="Candidates to return per job")
+    
+    @field_validator('target_jobs')
+    @classmethod
+    def validate_jobs(cls, v):
+        if not all(len(job.strip()) > 0 for job in v):
+            raise ValueError("Job titles cannot be empty")
+        return list(dict.fromkeys(job.strip() for job in v))
+
+
+@app.post("/api/candidates/rank")
+async def rank_candidates_endpoint(request: RankCandidatesRequest, req: Request):
+    """Rank resumes against target jobs using resume extraction only."""
+    client_ip = req.client.host if req.client else "unknown"
+    allowed, reason = rate_limiter.is_allowed(client_ip)
+    if not allowed:
+        raise HTTPException(status_code=429, detail=reason)
+    rate_limiter.record_request(client_ip)
+    
+    logger.info(f"Ranking {len(request.candidates)} candidates for {len(request.target_jobs)} jobs")
+    
+    return await rank_candidates(
+        candidates=[c.model_dump() for c in request.candidates],
+        target_jobs=request.target_jobs,
+        job_description=request.job_description,
+        specialty_info=request.specialty_info,
+        top_k=request.top_k
+    )
+
+
 @app.get("/api/rate-limit/stats")
 async def get_rate_limit_stats(req: Request):
     """Get rate limit stats for current IP."""
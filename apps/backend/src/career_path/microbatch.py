@@ -0,0 +1,124 @@
+"""Cross-request micro-batching of small blocking LLM calls."""
+
+import logging
+import threading
+from concurrent.futures import Future
+from typing import Any, Callable, Dict, Hashable, List
+
+logger = logging.getLogger(__name__)
+
+
+class MicroBatcher:
+    """Collects items from concurrent callers and handles them in one call.
+
+    The first item for a key opens a batch that is flushed after
+    ``window_ms`` or as soon as it holds ``max_batch`` items, whichever comes
+    first. The flush calls ``handler(key, items)`` once and hands each
+    waiting caller its own result. Only items with the same key (e.g. the
+    same prompt context) share a batch.
+    """
+
+    def __init__(
+        self,
+        handler: Callable[[Hashable, List[Any]], Dict[Any, Any]],
+        window_ms: float = 10,
+        max_batch: int = 16,
+        timeout: float | None = None
+    ):
+        """Initialize the batcher.
+
+        Args:
+            handler: Blocking function mapping (key, items) to a result per item
+            window_ms: How long a batch stays open for more items
+            max_batch: Flush as soon as a batch has this many distinct items
+            timeout: Seconds a caller waits for its result (None = no limit)
+        """
+        self._handler = handler
+        self._window = window_ms / 1000
+        self._max_batch = max_batch
+        self._timeout = timeout
+        self._pending: Dict[Hashable, Dict[Any, Future]] = {}
+        self._lock = threading.Lock()
+        self.batches = 0
+        self.items = 0
+
+    def submit(self, key: Hashable, item: Any) -> Any:
+        """Add an item to the open batch for ``key`` and wait for its result.
+
+        Args:
+            key: Batch key; only items with equal keys are combined
+            item: Item to handle (must be hashable; duplicates share a result)
+
+        Returns:
+            The handler's result for ``item``
+
+        Raises:
+            Exception: Whatever the handler raised, or a missing-result error
+        """
+        return self._enqueue(key, [item])[0].result(timeout=self._timeout)
+
+    def submit_many(self, key: Hashable, items: List[Any]) -> List[Future]:
+        """Add several items at once without waiting.
+
+        Args:
+            key: Batch key
+            items: Items to handle
+
+        Returns:
+            One future per item
+        """
+        return self._enqueue(key, items)
+
+    def _enqueue(self, key: Hashable, items: List[Any]) -> List[Future]:
+        futures = []
+        flushes = []
+        with self._lock:
+            for item in items:
+                batch = self._pending.get(key)
+                if batch is None:
+                    batch = self._pending[key] = {}
+                    timer = threading.Timer(self._window, self._flush_if_open, args=(key, batch))
+                    timer.daemon = True
+                    timer.start()
+                future = batch.get(item)
+                if future is None:
+                    future = batch[item] = Future()
+                futures.append(future)
+                if len(batch) >= self._max_batch:
+                    flushes.append(self._pending.pop(key))
+        for batch in flushes:
+            self._run(key, batch)
+        return futures
+
+    def _flush_if_open(self, key: Hashable, batch: Dict[Any, Future]) -> None:
+        with self._lock:
+            if self._pending.get(key) is not batch:
+                return  # Already flushed because it filled up
+            del self._pending[key]
+        self._run(key, batch)
+
+    def _run(self, key: Hashable, batch: Dict[Any, Future]) -> None:
+        items = list(batch)
+        with self._lock:
+            self.batches += 1
+            self.items += len(items)
+        logger.info(f"Flushing micro-batch of {len(items)} items")
+        try:
+            results = self._handler(key, items)
+        except Exception as e:
+            for future in batch.values():
+                future.set_exception(e)
+            return
+        for item, future in batch.items():
+            if item in results:
+                future.set_result(results[item])
+            else:
+                future.set_exception(ValueError(f"No result for {item!r} in batch"))
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Number of flushed batches and items."""
+        return {
+            "batches": self.batches,
+            "items": self.items,
+            "avg_batch_size": round(self.items / self.batches, 2) if self.batches else 0.0
+        }
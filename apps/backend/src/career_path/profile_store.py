@@ -0,0 +1,82 @@
+"""Resume profile store keyed by normalized resume hash."""
+
+import threading
+from typing import Any, Dict, Optional
+
+from .cache import ResponseCache
+from .constants import PROFILE_STORE_MAX_ENTRIES, PROFILE_STORE_TTL_MINUTES
+from .utils import content_hash
+
+# Cache namespace for stored profiles
+PROFILE_NAMESPACE = "profile"
+
+# Resume analysis fields kept in a profile
+PROFILE_FIELDS = ("current_skills", "experience_years", "strengths")
+
+
+def normalize_resume(resume_text: str) -> str:
+    """Normalize resume text so whitespace/casing edits don't change the hash."""
+    return " ".join(resume_text.lower().split())
+
+
+def profile_key(resume_text: str, user_id: str) -> str:
+    """Key for a user's profile of a given resume."""
+    return content_hash({"user_id": user_id, "resume": normalize_resume(resume_text)})
+
+
+class ProfileStore:
+    """Stores resume analysis results so unchanged resumes skip the LLM."""
+
+    def __init__(self, cache: ResponseCache):
+        """Initialize the store.
+
+        Args:
+            cache: Cache backend holding profiles
+        """
+        self._cache = cache
+        self._lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+
+    def get(self, resume_text: str, user_id: str = "default") -> Optional[Dict[str, Any]]:
+        """Get the stored profile for a resume, if any.
+
+        Args:
+            resume_text: Resume text
+            user_id: Owner of the resume
+
+        Returns:
+            Dict with ``current_skills``, ``experience_years`` and ``strengths``
+        """
+        profile = self._cache.get(profile_key(resume_text, user_id), model=PROFILE_NAMESPACE)
+        with self._lock:
+            if profile is None:
+                self._misses += 1
+            else:
+                self._hits += 1
+        return profile
+
+    def save(self, resume_text: str, user_id: str, profile: Dict[str, Any]) -> None:
+        """Store the analysis result for a resume.
+
+        Args:
+            resume_text: Resume text
+            user_id: Owner of the resume
+            profile: Resume analysis result
+        """
+        self._cache.set(
+            profile_key(resume_text, user_id),
+            {field: profile.get(field) for field in PROFILE_FIELDS},
+            model=PROFILE_NAMESPACE
+        )
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics including hit/miss counts."""
+        return {**self._cache.get_stats(), "hits": self._hits, "misses": self._misses}
+
+
+# Global profile store instance
+profile_store = ProfileStore(ResponseCache(
+    ttl_minutes=PROFILE_STORE_TTL_MINUTES,
+    max_entries=PROFILE_STORE_MAX_ENTRIES
+))
@@ -0,0 +1,76 @@
+"""Bedrock prompt caching for the static system prompt of node calls."""
+
+import threading
+from typing import Any, Dict, List
+
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+
+from .constants import PROMPT_CACHE_MODELS
+
+
+def prompt_cache_min_tokens(model_id: str) -> int | None:
+    """Smallest cacheable prefix for a Bedrock model, or None without cache support."""
+    for family, min_tokens in PROMPT_CACHE_MODELS.items():
+        if family in model_id:
+            return min_tokens
+    return None
+
+
+def system_prompt(system: str, prompt: str, cache: bool = False) -> List[BaseMessage]:
+    """System message with the stable instructions, then the per-request prompt.
+
+    With ``cache``, the system block carries a cache checkpoint. Bedrock
+    caches everything up to it, including the tool definitions that are
+    sent ahead of the system prompt.
+
+    Args:
+        system: Instructions and guidance, identical on every call
+        prompt: Per-request data
+        cache: Whether to mark the system block for caching
+
+    Returns:
+        Messages for the chat model
+    """
+    block = {"type": "text", "text": system}
+    if cache:
+        block["cache_control"] = {"type": "ephemeral"}
+    return [SystemMessage(content=[block]), HumanMessage(content=prompt)]
+
+
+class PromptCacheStats:
+    """Input, cache-read and cache-write token counts per node."""
+
+    def __init__(self):
+        self._nodes: Dict[str, Dict[str, int]] = {}
+        self._lock = threading.Lock()
+
+    def record(self, node: str, usage: Dict[str, Any] | None) -> None:
+        """Record the usage metadata of one call.
+
+        Args:
+            node: Node name
+            usage: LangChain usage metadata (``input_token_details`` holds cache counts)
+        """
+        details = (usage or {}).get("input_token_details") or {}
+        with self._lock:
+            stats = self._nodes.setdefault(
+                node, {"calls": 0, "input_tokens": 0, "cache_read_tokens": 0, "cache_write_tokens": 0}
+            )
+            stats["calls"] += 1
+            stats["input_tokens"] += (usage or {}).get("input_tokens", 0)
+            stats["cache_read_tokens"] += details.get("cache_read", 0) or 0
+            stats["cache_write_tokens"] += details.get("cache_creation", 0) or 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Token counts and cache hit rate per node."""
+        with self._lock:
+            nodes = {node: dict(stats) for node, stats in self._nodes.items()}
+        for stats in nodes.values():
+            cached = stats["cache_read_tokens"]
+            total = cached + stats["input_tokens"] + stats["cache_write_tokens"]
+            stats["cache_read_ratio"] = round(cached / total, 3) if total else 0.0
+        return nodes
+
+
+# Global prompt cache metrics
+prompt_cache_stats = PromptCacheStats()
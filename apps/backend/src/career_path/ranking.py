@@ -0,0 +1,123 @@
+"""Batch candidate ranking against target jobs."""
+
+import asyncio
+import logging
+from typing import Dict, List, Optional
+
+from .constants import RANKING_CONCURRENCY
+from .gap_engine import fit_matrix, iter_skill_ids, to_bitset
+from .graph.nodes import job_parser_node, resume_analyzer_node
+from .profile_store import profile_store
+from .skills import SkillTable, skill_vocabulary
+
+logger = logging.getLogger(__name__)
+
+# Profile store owner for ranked applicants, kept apart from users' profiles
+RANKING_USER = "ranking"
+
+
+async def _analyze_resume(
+    resume_text: str,
+    semaphore: asyncio.Semaphore,
+    stats: Dict[str, int]
+) -> dict:
+    """Extract skills from one resume, using a stored profile when possible."""
+    profile = profile_store.get(resume_text, RANKING_USER)
+    if profile is not None:
+        stats["hits"] += 1
+        return profile
+
+    stats["misses"] += 1
+    async with semaphore:
+        # The analyzer stores successful analyses under RANKING_USER
+        return await asyncio.to_thread(
+            resume_analyzer_node, {"resume_text": resume_text, "user_id": RANKING_USER}
+        )
+
+
+async def rank_candidates(
+    candidates: List[dict],
+    target_jobs: List[str],
+    job_description: Optional[str] = None,
+    specialty_info: Optional[str] = None,
+    top_k: int = 5,
+    concurrency: int = RANKING_CONCURRENCY
+) -> Dict:
+    """Score N resumes against M jobs and return the top candidates per job.
+
+    Only resume extraction (once per resume, stored in the profile store
+    under ``RANKING_USER``) and job parsing (once per job) call the LLM;
+    fit scores come from the bitset gap engine.
+
+    Args:
+        candidates: Dicts with ``candidate_id`` and ``resume_text``
+        target_jobs: Job titles to rank against
+        job_description: Optional job posting text
+        specialty_info: Optional focus for job parsing
+        top_k: Candidates to return per job
+        concurrency: Maximum concurrent resume extractions
+
+    Returns:
+        Fit matrix, per-job rankings, extraction errors and cache stats
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    stats = {"hits": 0, "misses": 0}
+
+    jobs_task = asyncio.to_thread(job_parser_node, {
+        "target_jobs": target_jobs,
+        "job_description": job_description,
+        "specialty_info": specialty_info
+    })
+    # Identical resumes within the batch are only extracted once
+    unique_texts = list(dict.fromkeys(c["resume_text"] for c in candidates))
+    resume_tasks = [
+        _analyze_resume(text, semaphore, stats) for text in unique_texts
+    ]
+    jobs, *unique_profiles = await asyncio.gather(jobs_task, *resume_tasks)
+    by_text = dict(zip(unique_texts, unique_profiles))
+    profiles = [by_text[c["resume_text"]] for c in candidates]
+
+    candidate_ids = [c["candidate_id"] for c in candidates]
+    skill_table = SkillTable(skill_vocabulary)  # Overflow IDs scoped to this ranking
+    candidate_bits = [
+        to_bitset(skill_table.intern_many(profile["current_skills"])) for profile in profiles
+    ]
+    job_bits = [
+        to_bitset(skill_table.intern_many(jobs["required_skills"].get(job, [])))
+        for job in target_jobs
+    ]
+    matrix = fit_matrix(candidate_bits, job_bits)
+
+    rankings = {}
+    for j, job in enumerate(target_jobs):
+        order = sorted(range(len(candidates)), key=lambda i: -matrix[i][j])[:top_k]
+        rankings[job] = [
+            {
+                "candidate_id": candidate_ids[i],
+                "fit_score": matrix[i][j],
+                "missing_skills": sorted(
+                    skill_table.materialize(iter_skill_ids(job_bits[j] & ~candidate_bits[i]))
+                )
+            }
+            for i in order
+        ]
+
+    errors = {
+        candidate_ids[i]: profile["error"]
+        for i, profile in enumerate(profiles)
+        if profile.get("error")
+    }
+
+    logger.info(
+        f"Ranked {len(candidates)} candidates for {len(target_jobs)} jobs "
+        f"(cache hits: {stats['hits']}, misses: {stats['misses']})"
+    )
+
+    return {
+        "jobs": target_jobs,
+        "candidates": candidate_ids,
+        "fit_matrix": matrix,
+        "rankings": rankings,
+        "errors": errors,
+        "cache": stats
+    }
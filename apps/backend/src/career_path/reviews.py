@@ -0,0 +1,96 @@
+"""Deferred critical reviews computed off the request path."""
+
+import asyncio
+import logging
+from typing import Any, Dict, Optional
+
+from .cache import ResponseCache
+from .constants import REVIEW_STORE_MAX_ENTRIES, REVIEW_STORE_TTL_MINUTES
+from .graph.nodes import critical_review_node
+from .utils import content_hash
+
+logger = logging.getLogger(__name__)
+
+# Cache namespace for computed reviews
+REVIEW_NAMESPACE = "critical_review"
+
+
+def review_fingerprint(state: Dict[str, Any]) -> str:
+    """Hash of the profile and gap inputs the critical review is based on."""
+    return content_hash({
+        "current_skills": state.get("current_skills", [])[:20],
+        "experience_years": state.get("experience_years", {}),
+        "strengths": state.get("strengths", [])[:5],
+        "target_jobs": state.get("target_jobs", []),
+        "fit_score": state.get("fit_score", 0),
+        "skill_gaps": len(state.get("skill_gaps", [])),
+    })
+
+
+class ReviewStore:
+    """Runs critical reviews in the background and caches them by fingerprint.
+
+    Roadmaps with the same profile and gaps share one review. A review that
+    fails is not cached, so the next request for it starts a new attempt.
+    """
+
+    def __init__(self, cache: ResponseCache):
+        """Initialize the store.
+
+        Args:
+            cache: Cache backend holding completed reviews
+        """
+        self._cache = cache
+        self._in_flight: Dict[str, asyncio.Task] = {}
+
+    def get(self, fingerprint: str) -> Optional[Dict[str, Any]]:
+        """Get a completed review, if any."""
+        return self._cache.get(fingerprint, model=REVIEW_NAMESPACE)
+
+    def pending(self, fingerprint: str) -> bool:
+        """Whether a review is being computed."""
+        return fingerprint in self._in_flight
+
+    def start(self, state: Dict[str, Any]) -> str:
+        """Start computing the review for a workflow state unless known.
+
+        Must be called from the event loop.
+
+        Args:
+            state: Final workflow state (review deferred)
+
+        Returns:
+            Review fingerprint
+        """
+        fingerprint = review_fingerprint(state)
+        if fingerprint in self._in_flight or self.get(fingerprint) is not None:
+            return fingerprint
+
+        logger.info(f"Starting background critical review {fingerprint}")
+        task = asyncio.ensure_future(
+            asyncio.to_thread(critical_review_node, {**state, "defer_review": False})
+        )
+        self._in_flight[fingerprint] = task
+        task.add_done_callback(lambda t: self._finish(fingerprint, t))
+        return fingerprint
+
+    def _finish(self, fingerprint: str, task: asyncio.Task) -> None:
+        self._in_flight.pop(fingerprint, None)
+        if task.cancelled() or task.exception() is not None:
+            return
+        result = task.result()
+        if result.get("error"):
+            logger.warning(f"Background critical review {fingerprint} failed: {result['error']}")
+            return
+        self._cache.set(fingerprint, result["critical_review"], model=REVIEW_NAMESPACE)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics."""
+        return {**self._cache.get_stats(), "in_flight": len(self._in_flight)}
+
+
+# Global review store instance
+review_store = ReviewStore(ResponseCache(
+    ttl_minutes=REVIEW_STORE_TTL_MINUTES,
+    max_entries=REVIEW_STORE_MAX_ENTRIES
+))
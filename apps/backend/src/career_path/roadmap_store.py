@@ -0,0 +1,113 @@
+"""Content-addressed storage for generated roadmaps."""
+
+from typing import Any, Dict, Optional
+
+from .cache import ResponseCache
+from .constants import ROADMAP_STORE_MAX_ENTRIES, ROADMAP_STORE_TTL_MINUTES
+from .utils import content_hash
+
+# Cache namespaces for stored roadmaps and the workflow state behind them
+ROADMAP_NAMESPACE = "roadmap"
+STATE_NAMESPACE = "roadmap_state"
+
+
+# Request inputs (including the user) that a roadmap id is bound to
+INPUT_FIELDS = (
+    "resume_text", "target_jobs", "job_description", "specialty_info", "user_id",
+    "lazy_recommendations", "defer_review", "extraction_mode", "mode",
+)
+
+
+def roadmap_id_for(roadmap: Dict[str, Any], inputs: Optional[Dict[str, Any]] = None) -> str:
+    """Content hash of a roadmap and its inputs, ignoring any id it already carries."""
+    content = {k: v for k, v in roadmap.items() if k != "roadmap_id"}
+    if inputs is None:
+        return content_hash(content)
+    return content_hash({"roadmap": content, "inputs": inputs})
+
+
+class RoadmapStore:
+    """Stores roadmaps under their content hash.
+
+    The id doubles as the ETag: identical roadmaps share an id and a stored
+    roadmap never changes under its id. When the workflow state is stored
+    too, the id also covers the request inputs, so identical roadmaps from
+    different users or inputs never share (or overwrite) each other's state.
+    """
+
+    def __init__(self, cache: ResponseCache):
+        """Initialize the store.
+
+        Args:
+            cache: Cache backend holding roadmaps
+        """
+        self._cache = cache
+
+    def save(self, roadmap: Dict[str, Any], state: Optional[Dict[str, Any]] = None) -> str:
+        """Store a roadmap (and optionally its workflow state) and return its id.
+
+        Args:
+            roadmap: Roadmap response content
+            state: Final workflow state, kept for regeneration
+
+        Returns:
+            Content hash id
+        """
+        inputs = None if state is None else {field: state.get(field) for field in INPUT_FIELDS}
+        roadmap_id = roadmap_id_for(roadmap, inputs)
+        self._cache.set(roadmap_id, {**roadmap, "roadmap_id": roadmap_id}, model=ROADMAP_NAMESPACE)
+        if state is not None:
+            self.save_state(roadmap_id, state)
+        return roadmap_id
+
+    def get(self, roadmap_id: str) -> Optional[Dict[str, Any]]:
+        """Get a stored roadmap by id."""
+        return self._cache.get(roadmap_id, model=ROADMAP_NAMESPACE)
+
+    def save_state(self, roadmap_id: str, state: Dict[str, Any]) -> None:
+        """Keep the final workflow state behind a roadmap for regeneration.
+        
+        Args:
+            roadmap_id: Id returned by ``save``
+            state: Final workflow state
+        """
+        state = {k: v for k, v in state.items() if k != "messages"}
+        self._cache.set(roadmap_id, state, model=STATE_NAMESPACE)
+    
+    def get_state(self, roadmap_id: str) -> Optional[Dict[str, Any]]:
+        """Get the workflow state behind a stored roadmap."""
+        return self._cache.get(roadmap_id, model=STATE_NAMESPACE)
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics."""
+        return self._cache.get_stats()
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header value against an ETag.
+
+    Args:
+        if_none_match: Raw header value (may list several tags or ``*``)
+        etag: Quoted ETag of the current representation
+
+    Returns:
+        True if the client's copy is current
+    """
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*":
+            return True
+        if tag.startswith("W/"):
+            tag = tag[2:]
+        if tag == etag:
+            return True
+    return False
+
+
+# Global roadmap store instance
+roadmap_store = RoadmapStore(ResponseCache(
+    ttl_minutes=ROADMAP_STORE_TTL_MINUTES,
+    max_entries=ROADMAP_STORE_MAX_ENTRIES
+))
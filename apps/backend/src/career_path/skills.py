@@ -0,0 +1,160 @@
+"""Skill interning for compact, normalize-once skill handling."""
+
+import os
+from typing import Iterable
+
+from .extractor import TAXONOMY_PATH, load_taxonomy
+from .utils import content_hash
+
+# ID stored in state for a skill outside the shared vocabulary
+UNKNOWN_SKILL = -1
+
+
+def canonical_skill(skill: str) -> str:
+    """Return the canonical form used to compare skills."""
+    return skill.lower().strip()
+
+
+class SkillVocabulary:
+    """Fixed table of canonical skills shared by every request.
+
+    IDs are assigned once, in sorted order, from a known set of skills (the
+    skill taxonomy), so the table is bounded and every process assigns the
+    same IDs. That makes the IDs safe to carry in workflow state and
+    checkpoints; ``version`` identifies the table a list of IDs came from.
+    """
+
+    def __init__(self, skills: Iterable[str]):
+        """Build the vocabulary.
+
+        Args:
+            skills: Skill names in any casing/spacing
+        """
+        self._names = sorted({canonical_skill(skill) for skill in skills})
+        self._ids = {name: skill_id for skill_id, name in enumerate(self._names)}
+        self.version = content_hash(self._names, length=16)
+
+    @classmethod
+    def from_taxonomy(cls, path=TAXONOMY_PATH) -> "SkillVocabulary":
+        """Vocabulary of every taxonomy skill and alias."""
+        taxonomy = load_taxonomy(path)
+        return cls([*taxonomy, *(alias for aliases in taxonomy.values() for alias in aliases)])
+
+    def encode(self, skills: Iterable[str]) -> list[int]:
+        """Vocabulary IDs for skills, ``UNKNOWN_SKILL`` for the rest.
+
+        Args:
+            skills: Skill names
+
+        Returns:
+            List of IDs, one per input skill
+        """
+        ids = self._ids
+        return [ids.get(canonical_skill(skill), UNKNOWN_SKILL) for skill in skills]
+
+    def get(self, key: str) -> int | None:
+        """Get the ID for an already canonical skill."""
+        return self._ids.get(key)
+
+    def lookup(self, skill_id: int) -> str:
+        """Get the canonical name for a vocabulary ID."""
+        return self._names[skill_id]
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+
+class SkillTable:
+    """Per-analysis table mapping canonical skills to small integer IDs.
+
+    Skills are normalized exactly once, when they are interned. Everything
+    downstream (gap analysis, path comparison) works on the integer IDs and
+    only turns them back into strings when building a response.
+
+    Vocabulary skills keep their shared IDs. Any other skill (skill names
+    come from requests and LLM output) gets an overflow ID after them that
+    only lives as long as this table, so nothing shared grows per request.
+    """
+
+    def __init__(self, vocabulary: SkillVocabulary | None = None):
+        """Initialize a table over a vocabulary.
+
+        Args:
+            vocabulary: Shared vocabulary (empty if not given)
+        """
+        self._vocabulary = vocabulary or SkillVocabulary(())
+        self._base = len(self._vocabulary)
+        self._ids: dict[str, int] = {}
+        self._names: list[str] = []
+
+    def intern(self, skill: str) -> int:
+        """Get the ID for a skill, assigning an overflow ID if needed.
+
+        Args:
+            skill: Skill name in any casing/spacing
+
+        Returns:
+            Integer skill ID
+        """
+        key = canonical_skill(skill)
+        skill_id = self._vocabulary.get(key)
+        if skill_id is None:
+            skill_id = self._ids.get(key)
+        if skill_id is None:
+            skill_id = self._base + len(self._names)
+            self._names.append(key)
+            self._ids[key] = skill_id
+        return skill_id
+
+    def intern_many(self, skills: Iterable[str]) -> list[int]:
+        """Intern a list of skills, preserving order and duplicates.
+
+        Args:
+            skills: Skill names
+
+        Returns:
+            List of skill IDs, one per input skill
+        """
+        return [self.intern(skill) for skill in skills]
+
+    def intern_encoded(self, skills: list[str], skill_ids: list[int]) -> list[int]:
+        """Intern skills already encoded with this table's vocabulary.
+
+        Only skills encoded as ``UNKNOWN_SKILL`` are normalized again.
+
+        Args:
+            skills: Skill names
+            skill_ids: Output of ``SkillVocabulary.encode`` for ``skills``
+
+        Returns:
+            List of skill IDs, one per input skill
+        """
+        if len(skill_ids) != len(skills):
+            return self.intern_many(skills)
+        return [
+            self.intern(skill) if skill_id == UNKNOWN_SKILL else skill_id
+            for skill, skill_id in zip(skills, skill_ids)
+        ]
+
+    def lookup(self, skill_id: int) -> str:
+        """Get the canonical name for a skill ID."""
+        if skill_id < self._base:
+            return self._vocabulary.lookup(skill_id)
+        return self._names[skill_id - self._base]
+
+    def materialize(self, skill_ids: Iterable[int]) -> list[str]:
+        """Convert skill IDs back to canonical names."""
+        return [self.lookup(skill_id) for skill_id in skill_ids]
+
+    def get(self, skill: str) -> int | None:
+        """Get the ID for a skill without interning it."""
+        key = canonical_skill(skill)
+        skill_id = self._vocabulary.get(key)
+        return self._ids.get(key) if skill_id is None else skill_id
+
+    def __len__(self) -> int:
+        return self._base + len(self._names)
+
+
+# Shared vocabulary, built once at import from the skill taxonomy
+skill_vocabulary = SkillVocabulary.from_taxonomy(os.getenv("SKILL_TAXONOMY_PATH", TAXONOMY_PATH))
@@ -1,5 +1,7 @@
 """Utility functions for career path workflow."""
 
+import hashlib
+import json
 from typing import Any
 
 
@@ -35,3 +37,9 @@ def estimate_learning_time(skill: str) -> int:
     elif any(x in skill_lower for x in ["python", "javascript", "java"]):
         return 6
     return 3
+
+
+def content_hash(payload: Any, length: int = 32) -> str:
+    """Stable hash of a JSON-serializable payload (key order independent)."""
+    content = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(content.encode()).hexdigest()[:length]
@@ -0,0 +1,99 @@
+"""Tests for batch roadmap generation."""
+
+import asyncio
+from unittest.mock import Mock, patch
+
+from career_path.batch import JobRequirementsMemo, generate_batch, run_bounded
+from career_path.graph.state import create_initial_state
+
+
+async def _collect(agen):
+    return [item async for item in agen]
+
+
+def test_run_bounded_limits_concurrency():
+    """Test that no more than `concurrency` items run at once."""
+    running = 0
+    peak = 0
+    
+    async def worker(index, item):
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.001 * (item % 3))
+        running -= 1
+        return item * 2
+    
+    results = asyncio.run(_collect(run_bounded(range(20), worker, concurrency=3)))
+    
+    assert peak == 3
+    assert sorted(results) == [(i, i * 2) for i in range(20)]
+
+
+def test_run_bounded_reports_errors():
+    """Test that failures are yielded instead of aborting the batch."""
+    async def worker(index, item):
+        if item == 1:
+            raise ValueError("boom")
+        return item
+    
+    results = dict(asyncio.run(_collect(run_bounded([0, 1, 2], worker, concurrency=2))))
+    
+    assert results[0] == 0
+    assert isinstance(results[1], ValueError)
+    assert results[2] == 2
+
+
+@patch('career_path.batch.job_parser_node')
+def test_memo_parses_each_job_once(mock_parser):
+    """Test shared job titles are parsed once per batch."""
+    mock_parser.side_effect = lambda state: {
+        "required_skills": {state["target_jobs"][0]: ["AWS"]},
+        "nice_to_have_skills": {state["target_jobs"][0]: ["Go"]}
+    }
+    memo = JobRequirementsMemo()
+    
+    async def run():
+        return await asyncio.gather(*(
+            memo.get(job, None, None) for job in ["Architect", "Architect", "SRE", "Architect"]
+        ))
+    
+    results = asyncio.run(run())
+    
+    assert results[0] == (["AWS"], ["Go"])
+    assert mock_parser.call_count == 2
+    assert memo.calls == 2
+
+
+@patch('career_path.batch.job_parser_node')
+def test_generate_batch_prefills_jobs(mock_parser):
+    """Test workflow runs get prefilled job requirements."""
+    mock_parser.side_effect = lambda state: {
+        "required_skills": {state["target_jobs"][0]: ["AWS"]},
+        "nice_to_have_skills": {state["target_jobs"][0]: []}
+    }
+    workflow = Mock()
+    workflow.invoke.side_effect = lambda state: {"required_skills": state["required_skills"]}
+    states = [
+        create_initial_state("resume " * 10, ["Architect", "SRE"]),
+        create_initial_state("resume " * 10, ["Architect"]),
+    ]
+    
+    results = dict(asyncio.run(_collect(generate_batch(states, workflow, concurrency=2))))
+    
+    assert results[0]["required_skills"] == {"Architect": ["AWS"], "SRE": ["AWS"]}
+    assert results[1]["required_skills"] == {"Architect": ["AWS"]}
+    assert mock_parser.call_count == 2
+
+
+@patch('career_path.batch.job_parser_node')
+def test_generate_batch_skips_prefill_in_fast_mode(mock_parser):
+    """Test fast-mode items make no separate job parser calls."""
+    workflow = Mock()
+    workflow.invoke.side_effect = lambda state: {"required_skills": state["required_skills"]}
+    states = [create_initial_state("resume " * 10, ["Architect"], mode="fast")]
+    
+    results = dict(asyncio.run(_collect(generate_batch(states, workflow, concurrency=1))))
+    
+    assert results[0]["required_skills"] == {}
+    mock_parser.assert_not_called()
@@ -0,0 +1,50 @@
+"""Tests for adaptive output budgets."""
+
+from career_path.budgets import OutputBudget
+
+
+def test_default_until_enough_samples():
+    """Test the configured default is used before adapting."""
+    budget = OutputBudget({"job_parser": 500}, min_samples=3, ceiling=2000)
+    budget.record("job_parser", 100)
+    
+    assert budget.max_tokens("job_parser") == 500
+    assert budget.max_tokens("unknown") == 2000
+
+
+def test_budget_follows_p95():
+    """Test the budget adapts to the p95 output length with headroom."""
+    budget = OutputBudget(min_samples=20, headroom=1.25, floor=10, ceiling=2000)
+    for tokens in range(1, 101):
+        budget.record("node", tokens)
+    
+    assert budget.max_tokens("node") == 119  # ceil(95 * 1.25)
+
+
+def test_budget_clamped():
+    """Test the budget stays between floor and ceiling."""
+    budget = OutputBudget(min_samples=1, floor=256, ceiling=1000)
+    budget.record("short", 10)
+    budget.record("long", 5000)
+    
+    assert budget.max_tokens("short") == 256
+    assert budget.max_tokens("long") == 1000
+
+
+def test_window_forgets_old_outputs():
+    """Test only the most recent outputs are considered."""
+    budget = OutputBudget(window=5, min_samples=5, headroom=1.0, floor=1)
+    for _ in range(5):
+        budget.record("node", 1000)
+    for _ in range(5):
+        budget.record("node", 100)
+    
+    assert budget.max_tokens("node") == 100
+
+
+def test_stats():
+    """Test stats report budget, samples and truncations."""
+    budget = OutputBudget({"node": 300}, min_samples=10)
+    budget.record("node", 50, truncated=True)
+    
+    assert budget.get_stats() == {"node": {"max_tokens": 300, "samples": 1, "truncations": 1}}
@@ -1,7 +1,9 @@
 """Tests for response caching."""
 
+from datetime import UTC, datetime, timedelta
+
 import pytest
-from datetime import datetime, timedelta, UTC
+
 from career_path.cache import ResponseCache
 
 
@@ -191,3 +193,26 @@ def test_cache_multiple_operations(cache):
     # Clear and verify
     cache.clear()
     assert cache.get_stats()["total_entries"] == 0
+
+
+def test_cache_max_entries_evicts_lru():
+    """Test bounded cache evicts least recently used entries."""
+    bounded = ResponseCache(ttl_minutes=1, max_entries=2)
+    bounded.set("prompt1", "response1")
+    bounded.set("prompt2", "response2")
+    bounded.get("prompt1")  # prompt2 is now least recently used
+    bounded.set("prompt3", "response3")
+    
+    assert bounded.get("prompt2") is None
+    assert bounded.get("prompt1") == "response1"
+    assert bounded.get("prompt3") == "response3"
+    assert bounded.get_stats()["evictions"] == 1
+
+
+def test_cache_delete(cache):
+    """Test removing a single entry."""
+    cache.set("prompt", {"any": "value"})
+    cache.delete("prompt")
+    cache.delete("missing")
+    
+    assert cache.get("prompt") is None
@@ -0,0 +1,74 @@
+"""Tests for the static learning-resources catalog."""
+
+import json
+from unittest.mock import Mock, patch
+
+import pytest
+
+from career_path.cache import ResponseCache
+from career_path.catalog import LearningCatalog, learning_catalog
+from career_path.graph.nodes import learning_path_node
+
+
+@pytest.fixture
+def catalog():
+    """Create a small catalog."""
+    return LearningCatalog({
+        "Kubernetes": {
+            "aliases": ["K8s"],
+            "courses": [{"name": "Kubernetes Basics"}],
+            "certifications": [{"name": "CKA"}]
+        }
+    })
+
+
+def test_get_by_name_and_alias(catalog):
+    """Test lookups are canonical and cover aliases."""
+    assert catalog.get(" kubernetes")["courses"] == [{"name": "Kubernetes Basics"}]
+    assert catalog.get("k8s") is catalog.get("Kubernetes")
+    assert catalog.get("Kubernetes")["projects"] == []
+    assert catalog.get("COBOL") is None
+
+
+def test_load_missing_file(tmp_path):
+    """Test a missing catalog loads empty."""
+    assert len(LearningCatalog.load(tmp_path / "missing.json")) == 0
+
+
+def test_bundled_catalog_covers_mainstream_skills():
+    """Test the shipped catalog loads with usable entries."""
+    for skill in ("AWS", "Kubernetes", "Python"):
+        entry = learning_catalog.get(skill)
+        assert entry["courses"]
+        assert all(course["url"].startswith("https://") for course in entry["courses"])
+
+
+@patch('career_path.graph.nodes._get_llm')
+def test_learning_path_calls_llm_only_for_uncovered_skills(mock_get_llm, catalog):
+    """Test catalog skills are served locally and only misses reach the LLM."""
+    mock_llm = Mock()
+    mock_llm.invoke.return_value = Mock(content=json.dumps({"COBOL": {"courses": [{"name": "COBOL Course"}]}}))
+    mock_get_llm.return_value = mock_llm
+    state = {"skill_gaps": [
+        {"skill": "K8s", "priority": "high", "time_months": 3},
+        {"skill": "COBOL", "priority": "medium", "time_months": 6}
+    ]}
+    
+    with patch('career_path.graph.nodes.learning_catalog', catalog), \
+         patch('career_path.graph.nodes.response_cache', ResponseCache(ttl_minutes=1)):
+        result = learning_path_node(state)
+    
+    prompt = mock_llm.invoke.call_args.args[0][-1].content
+    assert "COBOL" in prompt
+    assert "K8s" not in prompt
+    assert result["courses"] == [{"name": "Kubernetes Basics"}, {"name": "COBOL Course"}]
+    assert result["certifications"] == [{"name": "CKA"}]
+
+
+@patch('career_path.graph.nodes._get_llm')
+def test_learning_path_catalog_only_skips_llm(mock_get_llm, catalog):
+    """Test no LLM call when the catalog covers every gap."""
+    with patch('career_path.graph.nodes.learning_catalog', catalog):
+        learning_path_node({"skill_gaps": [{"skill": "Kubernetes", "priority": "high", "time_months": 3}]})
+    
+    mock_get_llm.assert_not_called()
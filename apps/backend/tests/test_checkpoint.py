@@ -0,0 +1,150 @@
+"""Tests for workflow checkpointing."""
+
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from langgraph.checkpoint.memory import InMemorySaver
+
+from career_path.cache import ResponseCache
+from career_path.catalog import LearningCatalog
+from career_path.graph.checkpoint import (
+    WorkflowRunError,
+    _FailedRuns,
+    create_checkpointer,
+    run_workflow,
+)
+from career_path.graph.nodes import gap_analysis_node
+from career_path.graph.state import create_initial_state
+from career_path.graph.workflow import create_workflow
+from career_path.profile_store import ProfileStore
+
+
+def test_create_checkpointer_backends(tmp_path):
+    """Test backend selection."""
+    assert create_checkpointer("none") is None
+    assert create_checkpointer("unknown") is None
+    assert isinstance(create_checkpointer("memory"), InMemorySaver)
+    assert create_checkpointer("sqlite", str(tmp_path / "checkpoints.db")) is not None
+
+
+def test_run_workflow_without_checkpointer():
+    """Test a plain invoke when checkpointing is disabled."""
+    workflow = MagicMock()
+    workflow.invoke.return_value = {"nodes": []}
+    
+    assert run_workflow(workflow, {"resume_text": "x"}) == {"nodes": []}
+    workflow.invoke.assert_called_once_with({"resume_text": "x"})
+
+
+@pytest.mark.parametrize("backend", ["memory", "sqlite"])
+def test_retry_resumes_from_failed_node(backend, tmp_path):
+    """Test a retried run skips nodes that already completed and is compacted."""
+    calls = []
+    
+    def get_llm(agent_name, max_tokens=None):
+        calls.append(agent_name)
+        content = '{"skills": ["Python"], "experience": {}, "strengths": []}' \
+            if agent_name == "resume_analyzer" else '{"required": ["Python", "AWS"]}'
+        llm = Mock()
+        llm.invoke.return_value = Mock(content=content)
+        return llm
+    
+    failures = [RuntimeError("Bedrock unavailable")]
+    
+    def flaky_gap_analysis(state):
+        if failures:
+            raise failures.pop()
+        return gap_analysis_node(state)
+    
+    checkpointer = create_checkpointer(backend, str(tmp_path / "checkpoints.db"))
+    with patch('career_path.graph.workflow.gap_analysis_node', flaky_gap_analysis):
+        workflow = create_workflow(checkpointer=checkpointer)
+    state = create_initial_state("Backend engineer with Python experience", ["Cloud Engineer"])
+    
+    with patch('career_path.graph.nodes._get_llm', side_effect=get_llm), \
+         patch('career_path.graph.nodes.profile_store', ProfileStore(ResponseCache(ttl_minutes=1))):
+        with pytest.raises(RuntimeError):
+            run_workflow(workflow, state, run_id="run-1")
+        assert calls == ["resume_analyzer", "job_parser"]
+        
+        calls.clear()
+        result = run_workflow(workflow, state, run_id="run-1")
+    
+    assert "resume_analyzer" not in calls
+    assert "job_parser" not in calls
+    assert result["matched_skills"] == ["Python"]
+    assert result["nodes"]
+    
+    config = {"configurable": {"thread_id": "run-1"}}
+    assert checkpointer.get_tuple(config) is None
+
+
+def _mock_get_llm(calls, outages):
+    """LLM factory whose critical review fails while ``outages`` is non-empty."""
+    def get_llm(agent_name, max_tokens=None):
+        calls.append(agent_name)
+        llm = Mock()
+        if agent_name == "critical_review" and outages:
+            llm.invoke.side_effect = outages.pop()
+            return llm
+        content = {
+            "resume_analyzer": '{"skills": ["Python"], "experience": {}, "strengths": []}',
+            "job_parser": '{"required": ["Python", "AWS"]}',
+            "critical_review": '{"overallRating": 7}'
+        }.get(agent_name, '{}')
+        llm.invoke.return_value = Mock(content=content)
+        return llm
+    return get_llm
+
+
+def test_node_error_keeps_checkpoints_and_retries_node():
+    """Test a node that caught an LLM error can be retried from that node."""
+    calls = []
+    checkpointer = InMemorySaver()
+    workflow = create_workflow(checkpointer=checkpointer)
+    state = create_initial_state("Backend engineer with Python experience", ["Cloud Engineer"])
+    config = {"configurable": {"thread_id": "run-2"}}
+    
+    with patch('career_path.graph.nodes._get_llm', side_effect=_mock_get_llm(calls, [RuntimeError("Bedrock down")])), \
+         patch('career_path.graph.nodes.profile_store', ProfileStore(ResponseCache(ttl_minutes=1))), \
+         patch('career_path.graph.nodes.learning_catalog', LearningCatalog({})):
+        with pytest.raises(WorkflowRunError) as failure:
+            run_workflow(workflow, state, run_id="run-2")
+        assert failure.value.state["error"]
+        assert checkpointer.get_tuple(config) is not None
+        
+        calls.clear()
+        result = run_workflow(workflow, state, run_id="run-2")
+    
+    assert calls == ["critical_review"]
+    assert not result["error"]
+    assert result["critical_review"]["overallRating"] == 7
+    assert checkpointer.get_tuple(config) is None
+
+
+def test_runs_without_id_are_not_kept():
+    """Test failed runs without a run id leave no checkpoints behind."""
+    checkpointer = InMemorySaver()
+    workflow = create_workflow(checkpointer=checkpointer)
+    state = create_initial_state("Backend engineer with Python experience", ["Cloud Engineer"])
+    
+    with patch('career_path.graph.nodes._get_llm', side_effect=_mock_get_llm([], [RuntimeError("Bedrock down")])), \
+         patch('career_path.graph.nodes.profile_store', ProfileStore(ResponseCache(ttl_minutes=1))), \
+         patch('career_path.graph.nodes.learning_catalog', LearningCatalog({})):
+        result = run_workflow(workflow, state)
+    
+    assert result["error"]
+    assert list(checkpointer.list(None)) == []
+
+
+def test_failed_runs_are_bounded():
+    """Test the oldest kept failed run is dropped beyond the limit."""
+    checkpointer = Mock(spec=InMemorySaver)
+    failed_runs = _FailedRuns(max_runs=2)
+    
+    for run_id in ["a", "b", "c"]:
+        failed_runs.keep(checkpointer, run_id)
+    failed_runs.discard(checkpointer, "c")
+    failed_runs.keep(checkpointer, "d")
+    
+    checkpointer.delete_thread.assert_called_once_with("a")
@@ -0,0 +1,139 @@
+"""Tests for the offline batch CLI."""
+
+import json
+from concurrent.futures import ThreadPoolExecutor
+from unittest.mock import Mock, patch
+
+import pytest
+
+from career_path.cli import iter_inputs, load_checkpoint, main, run_batch
+
+RESUME = "Senior Engineer with 5 years of Python and AWS experience."
+
+
+@pytest.fixture
+def fake_workflow():
+    """Patch workflow creation with a fake that fails on demand."""
+    workflow = Mock()
+    
+    def invoke(state):
+        if "FAIL" in state["resume_text"]:
+            raise RuntimeError("Bedrock unavailable")
+        if "EMPTY" in state["resume_text"]:
+            return {"nodes": [], "error": "Resume analysis failed: throttled"}
+        return {"nodes": [], "fit_score": 42, "target_jobs": state["target_jobs"]}
+    workflow.invoke.side_effect = invoke
+    
+    with patch('career_path.cli.create_workflow', return_value=workflow):
+        yield workflow
+
+
+def _read_jsonl(path):
+    return [json.loads(line) for line in path.read_text().splitlines()]
+
+
+def test_iter_inputs_directory(tmp_path):
+    """Test reading resumes from a directory."""
+    (tmp_path / "a.txt").write_text(RESUME)
+    (tmp_path / "nested").mkdir()
+    (tmp_path / "nested" / "b.md").write_text(RESUME)
+    (tmp_path / "ignored.pdf").write_text("binary")
+    
+    items = list(iter_inputs(tmp_path, ["Architect"]))
+    
+    assert [item["id"] for item in items] == ["a.txt", "nested/b.md"]
+    assert items[0]["target_jobs"] == ["Architect"]
+
+
+def test_iter_inputs_jsonl(tmp_path):
+    """Test reading inputs from JSONL with per-item overrides."""
+    source = tmp_path / "inputs.jsonl"
+    source.write_text(
+        json.dumps({"id": 7, "resume_text": RESUME, "target_jobs": ["SRE"]}) + "\n\n"
+        + json.dumps({"resume_text": RESUME}) + "\n"
+    )
+    
+    items = list(iter_inputs(source, ["Architect"]))
+    
+    assert items[0]["id"] == "7"
+    assert items[0]["target_jobs"] == ["SRE"]
+    assert items[1]["id"] == "3"
+    assert items[1]["target_jobs"] == ["Architect"]
+
+
+def test_iter_inputs_reports_malformed_lines(tmp_path):
+    """Test a malformed JSONL line becomes an error item instead of aborting."""
+    source = tmp_path / "inputs.jsonl"
+    source.write_text(
+        '{"resume_text": "truncated\n'
+        + "[1, 2]\n"
+        + json.dumps({"resume_text": RESUME}) + "\n"
+    )
+    
+    items = list(iter_inputs(source, ["Architect"]))
+    
+    assert [item["id"] for item in items] == ["1", "2", "3"]
+    assert "line 1" in items[0]["input_error"]
+    assert "line 2" in items[1]["input_error"]
+    assert items[2]["resume_text"] == RESUME
+
+
+def test_run_batch_writes_results_and_checkpoint(tmp_path, fake_workflow):
+    """Test results and checkpoint are written incrementally."""
+    items = [{"id": str(i), "resume_text": RESUME, "target_jobs": ["SRE"]} for i in range(5)]
+    items.append({"id": "bad", "resume_text": "FAIL " + RESUME, "target_jobs": ["SRE"]})
+    output = tmp_path / "out.jsonl"
+    checkpoint = tmp_path / "out.jsonl.done"
+    
+    stats = run_batch(iter(items), output, checkpoint, workers=2,
+                      executor_factory=ThreadPoolExecutor)
+    
+    assert stats == {"completed": 5, "failed": 1, "skipped": 0}
+    records = {r["id"]: r for r in _read_jsonl(output)}
+    assert records["0"]["roadmap"]["fit_score"] == 42
+    assert records["bad"]["status"] == "error"
+    assert load_checkpoint(checkpoint) == {"0", "1", "2", "3", "4"}
+
+
+def test_run_batch_does_not_checkpoint_workflow_errors(tmp_path, fake_workflow):
+    """Test a run that ends with an error is a failure and is retried later."""
+    items = [
+        {"id": "ok", "resume_text": RESUME, "target_jobs": ["SRE"]},
+        {"id": "empty", "resume_text": "EMPTY " + RESUME, "target_jobs": ["SRE"]},
+        {"id": "7", "input_error": "Invalid input on line 7: Expecting value"},
+    ]
+    output = tmp_path / "out.jsonl"
+    checkpoint = tmp_path / "out.jsonl.done"
+    
+    stats = run_batch(iter(items), output, checkpoint, workers=1,
+                      executor_factory=ThreadPoolExecutor)
+    
+    assert stats == {"completed": 1, "failed": 2, "skipped": 0}
+    records = {r["id"]: r for r in _read_jsonl(output)}
+    assert records["ok"]["roadmap"]["error"] is None
+    assert records["empty"]["status"] == "error"
+    assert records["empty"]["error"] == "Resume analysis failed: throttled"
+    assert records["7"]["status"] == "error"
+    assert fake_workflow.invoke.call_count == 2
+    assert load_checkpoint(checkpoint) == {"ok"}
+
+
+def test_run_batch_resumes_from_checkpoint(tmp_path, fake_workflow):
+    """Test a re-run skips finished inputs and retries failed ones."""
+    output = tmp_path / "out.jsonl"
+    checkpoint = tmp_path / "out.jsonl.done"
+    checkpoint.write_text("0\n1\n")
+    items = [{"id": str(i), "resume_text": RESUME, "target_jobs": ["SRE"]} for i in range(3)]
+    
+    stats = run_batch(iter(items), output, checkpoint, workers=1,
+                      executor_factory=ThreadPoolExecutor)
+    
+    assert stats == {"completed": 1, "failed": 0, "skipped": 2}
+    assert fake_workflow.invoke.call_count == 1
+    assert [r["id"] for r in _read_jsonl(output)] == ["2"]
+
+
+def test_main_requires_jobs_for_directory(tmp_path):
+    """Test the CLI rejects a directory without target jobs."""
+    with pytest.raises(SystemExit):
+        main([str(tmp_path), "--output", str(tmp_path / "out.jsonl")])
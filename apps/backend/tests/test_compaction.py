@@ -0,0 +1,95 @@
+"""Tests for token-budgeted resume compaction."""
+
+from career_path.compaction import compact_resume, estimate_tokens
+from career_path.extractor import skill_extractor
+
+FILLER = "Collaborated with stakeholders across the organization to deliver value and drive outcomes."
+
+LONG_RESUME = "\n".join([
+    "Jane Doe",
+    "jane@example.com | +1 (555) 010-2030 | linkedin.com/in/janedoe",
+    "Summary",
+    "Backend engineer with 8 years of experience building distributed systems.",
+    "Experience",
+    *[f"- {FILLER}" for _ in range(30)],
+    *[f"- {FILLER} Project {i} was well received." for i in range(30)],
+    "- Led migration of 40 services to Kubernetes and Terraform, 2019-2023",
+    "Interests",
+    "Hiking, photography, cooking and travel with family and friends.",
+    "References",
+    "References available upon request.",
+    "Skills",
+    "Python, Go via Golang, PostgreSQL, Kafka, Docker, AWS",
+    "Certifications",
+    "AWS Certified Solutions Architect",
+])
+
+
+def test_short_resume_unchanged():
+    """Test resumes within budget are passed through."""
+    resume = "Python developer with 3 years of Django experience."
+    result = compact_resume(resume)
+    
+    assert result["text"] == resume
+    assert result["tokens_saved"] == 0
+
+
+def test_long_resume_fits_budget_and_keeps_skills():
+    """Test compaction saves tokens without losing any taxonomy skill."""
+    result = compact_resume(LONG_RESUME, budget=150)
+    
+    assert result["original_tokens"] == estimate_tokens(LONG_RESUME)
+    assert result["compacted_tokens"] <= 150
+    assert result["tokens_saved"] > 500
+    assert set(skill_extractor.extract(result["text"])) == set(skill_extractor.extract(LONG_RESUME))
+    # The skills section sits past the old 2000-character cut-off
+    assert LONG_RESUME.index("Python, Go") > 2000
+    assert "Python, Go via Golang" in result["text"]
+
+
+def test_filler_and_duplicates_removed():
+    """Test headings, contact details, filler sections and repeats are dropped."""
+    result = compact_resume(LONG_RESUME, budget=400)
+    lines = result["text"].splitlines()
+    
+    assert len(lines) == len(set(lines))
+    assert "References available upon request." not in result["text"]
+    assert "Hiking" not in result["text"]
+    assert "jane@example.com" not in result["text"]
+    assert "Skills" not in lines
+
+
+def test_uncovered_skills_listed_when_budget_is_tiny():
+    """Test skills whose lines don't fit are still listed."""
+    result = compact_resume(LONG_RESUME, budget=20)
+    
+    assert result["text"].splitlines()[-1].startswith("Additional skills:")
+    assert set(skill_extractor.extract(result["text"])) == set(skill_extractor.extract(LONG_RESUME))
+
+
+def test_single_paragraph_resume_keeps_experience():
+    """Test a resume pasted as one long line is split rather than dropped."""
+    resume = " ".join([
+        "Senior data engineer with 9 years of experience at Acme Corp.",
+        *[f"{FILLER} Initiative {i} shipped on time." for i in range(30)],
+        "Built streaming pipelines in Rust and Snowflake from 2018-2024.",
+        "Mentored a team of six engineers on the Orbital billing platform.",
+    ])
+    assert "\n" not in resume and len(resume) > 3000
+    
+    result = compact_resume(resume, budget=200)
+    
+    assert result["compacted_tokens"] <= 200
+    assert "9 years of experience" in result["text"]
+    assert "Built streaming pipelines in Rust and Snowflake from 2018-2024." in result["text"]
+    assert "Additional skills" not in result["text"]
+    assert set(skill_extractor.extract(result["text"])) == set(skill_extractor.extract(resume))
+
+
+def test_falls_back_to_truncation_when_nothing_fits():
+    """Test a budget too small for any piece keeps the start of the resume."""
+    resume = " ".join(["Platform engineer"] + ["word"] * 400)
+    
+    result = compact_resume(resume, budget=5)
+    
+    assert result["text"] == resume[:20]
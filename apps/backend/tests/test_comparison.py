@@ -1,7 +1,10 @@
 """Tests for career path comparison."""
 
-import pytest
-from career_path.comparison import compare_career_paths, calculate_learning_effort
+from career_path.comparison import (
+    calculate_learning_effort,
+    compare_career_paths,
+    compare_multiple_paths,
+)
 
 
 def test_compare_career_paths_basic():
@@ -168,3 +171,44 @@ def test_compare_career_paths_whitespace_handling():
     
     assert result["paths"]["Path 1"]["current_skills"] == 1
     assert result["paths"]["Path 2"]["current_skills"] == 1
+
+
+def test_compare_multiple_paths_matches_pairwise():
+    """Test N-way comparison agrees with the two-path comparison."""
+    current = ["Python", "Git"]
+    path1 = ["Python", "AWS", "Docker"]
+    path2 = ["Python", "Azure", "Docker", "Kubernetes"]
+    
+    pairwise = compare_career_paths(current, path1, path2, "AWS", "Azure")
+    result = compare_multiple_paths(current, {"AWS": path1, "Azure": path2})
+    
+    for name in ("AWS", "Azure"):
+        assert result["paths"][name] == pairwise["paths"][name]
+    assert result["common_gaps"] == pairwise["common_gaps"]
+    assert result["recommendation"]["easier_path"] == "AWS"
+    assert result["recommendation"]["should_learn_first"] == ["docker"]
+
+
+def test_compare_multiple_paths_matrix():
+    """Test pairwise shared-gap matrix and demand-ordered recommendations."""
+    current = ["Python"]
+    paths = {
+        "A": ["Python", "Docker", "AWS"],
+        "B": ["Docker", "Kubernetes"],
+        "C": ["Docker", "Kubernetes", "Terraform"],
+    }
+    
+    result = compare_multiple_paths(current, paths)
+    
+    assert result["pairwise"]["order"] == ["A", "B", "C"]
+    assert result["pairwise"]["shared_gaps"] == [
+        [2, 1, 1],
+        [1, 2, 2],
+        [1, 2, 3],
+    ]
+    assert result["pairwise"]["gap_difference"][0] == [0, 0, 1]
+    assert result["common_gaps"] == ["docker"]
+    assert result["paths"]["A"]["unique_gaps"] == ["aws"]
+    assert result["paths"]["C"]["unique_gaps"] == ["terraform"]
+    assert result["recommendation"]["should_learn_first"] == ["docker", "kubernetes"]
+    assert result["recommendation"]["easier_path"] == "Equal difficulty"
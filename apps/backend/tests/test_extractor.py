@@ -0,0 +1,63 @@
+"""Tests for the local skill extractor."""
+
+import re
+
+import pytest
+
+from career_path.extractor import TAXONOMY_PATH, SkillExtractor, load_taxonomy, skill_extractor
+
+
+@pytest.fixture
+def extractor():
+    """Create an extractor over a small taxonomy."""
+    return SkillExtractor({
+        "Java": [],
+        "JavaScript": ["JS"],
+        "C++": [],
+        "Kubernetes": ["K8s"],
+        "Spark": ["Apache Spark"],
+        "CI/CD": [],
+        "Node.js": ["NodeJS"],
+    })
+
+
+def test_extract_in_order_of_first_mention(extractor):
+    """Test skills come back once, in the order they are mentioned."""
+    text = "Ran K8s clusters. Wrote Java and C++ services, then more Java."
+    assert extractor.extract(text) == ["Kubernetes", "Java", "C++"]
+
+
+def test_word_boundaries(extractor):
+    """Test partial words don't match."""
+    assert extractor.extract("JavaScript developer") == ["JavaScript"]
+    assert extractor.extract("Javanese jsx") == []
+    assert extractor.extract("C++17 and C++") == ["C++"]
+
+
+def test_aliases_and_punctuation(extractor):
+    """Test aliases map to the skill and punctuation is a boundary."""
+    text = "Built CI/CD with Apache Spark jobs (NodeJS, js)."
+    assert extractor.extract(text) == ["CI/CD", "Spark", "Node.js", "JavaScript"]
+
+
+def test_matches_naive_scan(extractor):
+    """Test the automaton agrees with a regex scan per pattern."""
+    taxonomy = {"Java": [], "JavaScript": ["JS"], "C++": [], "Kubernetes": ["K8s"],
+                "Spark": ["Apache Spark"], "CI/CD": [], "Node.js": ["NodeJS"]}
+    text = ("Senior engineer: Java, javascript, k8s; apache spark/Spark. "
+            "C++ and CI/CD at node.js shop. Javas c++x nodejs.") * 3
+    
+    expected = set()
+    for skill, aliases in taxonomy.items():
+        for pattern in [skill, *aliases]:
+            if re.search(r'(?<![a-zA-Z0-9+#])' + re.escape(pattern.lower()) + r'(?![a-zA-Z0-9+#])', text.lower()):
+                expected.add(skill)
+    
+    assert set(extractor.extract(text)) == expected
+
+
+def test_bundled_taxonomy():
+    """Test the shipped taxonomy loads and finds common skills."""
+    assert len(skill_extractor) == len(load_taxonomy(TAXONOMY_PATH)) > 50
+    skills = skill_extractor.extract("5 years with Python, Docker and Amazon Web Services; the rest of the time on go-to-market.")
+    assert skills == ["Python", "Docker", "AWS"]
@@ -0,0 +1,105 @@
+"""Tests for the bitset gap engine."""
+
+import random
+
+import pytest
+
+from career_path.gap_engine import (
+    analyze_gaps,
+    fit_matrix,
+    fit_percentage,
+    iter_skill_ids,
+    to_bitset,
+)
+from career_path.graph.nodes import gap_analysis_node
+from career_path.utils import calculate_priority, estimate_learning_time
+
+
+def _reference_gap_analysis(state):
+    """Set/list based gap analysis the bitset engine must agree with."""
+    current = set(s.lower() for s in state["current_skills"])
+    gaps = []
+    matched = []
+    seen_skills = set()
+    all_required = []
+    for job_title, required in state["required_skills"].items():
+        all_required.extend(required)
+        for skill in required:
+            if skill.lower() in current:
+                matched.append(skill)
+            elif skill.lower() not in seen_skills:
+                seen_skills.add(skill.lower())
+                gaps.append({
+                    "skill": skill,
+                    "for_job": job_title,
+                    "priority": calculate_priority(len(gaps) + 1, len(required)),
+                    "difficulty": "medium",
+                    "time_months": estimate_learning_time(skill)
+                })
+    total_skills = len(set(s.lower() for s in all_required))
+    matched_count = len(set(s.lower() for s in matched))
+    fit_score = int((matched_count / total_skills * 100)) if total_skills > 0 else 0
+    gaps.sort(key=lambda x: (x["priority"] != "high", x["skill"]))
+    return {"skill_gaps": gaps, "fit_score": fit_score, "matched_skills": matched}
+
+
+def test_to_bitset_and_back():
+    """Test encoding and decoding skill IDs."""
+    bits = to_bitset([3, 0, 9, 3])
+    assert bits == (1 << 0) | (1 << 3) | (1 << 9)
+    assert list(iter_skill_ids(bits)) == [0, 3, 9]
+    assert to_bitset([]) == 0
+
+
+def test_fit_percentage():
+    """Test fit percentage calculation."""
+    assert fit_percentage(to_bitset([1]), to_bitset([1, 2, 3])) == 33
+    assert fit_percentage(0, 0) == 0
+
+
+def test_analyze_gaps():
+    """Test bulk matched/missing/fit computation."""
+    result = analyze_gaps([1, 2], {"A": [1, 3], "B": [2, 4, 5, 1]})
+    
+    assert list(iter_skill_ids(result["matched"])) == [1, 2]
+    assert list(iter_skill_ids(result["missing"])) == [3, 4, 5]
+    assert result["job_fit"] == {"A": 50, "B": 50}
+    assert result["fit_score"] == 40
+
+
+def test_fit_matrix():
+    """Test N x M fit score matrix."""
+    candidates = [to_bitset([1, 2]), to_bitset([]), to_bitset([1, 2, 3])]
+    jobs = [to_bitset([1, 3]), to_bitset([2]), 0]
+    
+    assert fit_matrix(candidates, jobs) == [
+        [50, 100, 0],
+        [0, 0, 0],
+        [100, 100, 0],
+    ]
+
+
+@pytest.mark.parametrize("seed", range(25))
+def test_gap_analysis_matches_reference(seed):
+    """Test the bitset gap node agrees with the set-based implementation."""
+    rng = random.Random(seed)
+    vocabulary = [f"Skill{i}" for i in range(40)]
+    
+    def pick(count):
+        return [rng.choice([s, s.lower(), s.upper()]) for s in rng.sample(vocabulary, count)]
+    
+    state = {
+        "current_skills": pick(rng.randint(0, 20)),
+        "required_skills": {
+            f"Job {j}": pick(rng.randint(0, 15)) for j in range(rng.randint(1, 5))
+        }
+    }
+    
+    expected = _reference_gap_analysis(state)
+    result = gap_analysis_node(state)
+    
+    assert result["skill_gaps"] == expected["skill_gaps"]
+    assert result["fit_score"] == expected["fit_score"]
+    assert {s.lower() for s in result["matched_skills"]} == {
+        s.lower() for s in expected["matched_skills"]
+    }
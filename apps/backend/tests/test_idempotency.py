@@ -0,0 +1,88 @@
+"""Tests for Idempotency-Key handling."""
+
+import asyncio
+
+import pytest
+
+from career_path.cache import ResponseCache
+from career_path.idempotency import IdempotencyConflict, IdempotencyStore
+
+
+@pytest.fixture
+def store():
+    """Create a fresh idempotency store."""
+    return IdempotencyStore(ResponseCache(ttl_minutes=1, max_entries=10))
+
+
+def test_replays_completed_response(store):
+    """Test a retry gets the stored response without rerunning."""
+    calls = []
+    
+    async def work():
+        calls.append(1)
+        return {"fit_score": 80}
+    
+    async def scenario():
+        first = await store.run("key-1", "fp", work)
+        await asyncio.sleep(0)  # let the done callback store the response
+        second = await store.run("key-1", "fp", work)
+        return first, second
+    
+    first, second = asyncio.run(scenario())
+    assert first == ({"fit_score": 80}, False)
+    assert second == ({"fit_score": 80}, True)
+    assert len(calls) == 1
+
+
+def test_concurrent_retry_attaches_to_original(store):
+    """Test a retry during the original run waits for it."""
+    calls = []
+    
+    async def work():
+        calls.append(1)
+        await asyncio.sleep(0.01)
+        return {"fit_score": 80}
+    
+    async def scenario():
+        return await asyncio.gather(
+            store.run("key-1", "fp", work),
+            store.run("key-1", "fp", work),
+        )
+    
+    results = asyncio.run(scenario())
+    assert sorted(replayed for _, replayed in results) == [False, True]
+    assert len(calls) == 1
+
+
+def test_different_body_conflicts(store):
+    """Test reusing a key for another request is rejected."""
+    async def work():
+        return {}
+    
+    async def scenario():
+        await store.run("key-1", "fp-a", work)
+        await asyncio.sleep(0)
+        await store.run("key-1", "fp-b", work)
+    
+    with pytest.raises(IdempotencyConflict):
+        asyncio.run(scenario())
+
+
+def test_failures_are_not_stored(store):
+    """Test a failed run is retried on the next request."""
+    attempts = []
+    
+    async def work():
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("Bedrock throttled")
+        return {"ok": True}
+    
+    async def scenario():
+        with pytest.raises(RuntimeError):
+            await store.run("key-1", "fp", work)
+        await asyncio.sleep(0)
+        return await store.run("key-1", "fp", work)
+    
+    assert asyncio.run(scenario()) == ({"ok": True}, False)
+    assert store.get_stats()["in_flight"] == 0
@@ -0,0 +1,203 @@
+"""Tests for the async job queue."""
+
+import asyncio
+import sqlite3
+from datetime import UTC, datetime, timedelta
+
+from career_path.jobs import (
+    FAILED,
+    QUEUED,
+    RUNNING,
+    SUCCEEDED,
+    Job,
+    JobQueue,
+    JobStore,
+    SQLiteJobStore,
+    create_job_store,
+    job_id_for,
+)
+
+
+async def _wait_for(queue, job_id, status, timeout=2.0):
+    for _ in range(int(timeout / 0.01)):
+        job = queue.get(job_id)
+        if job.status == status:
+            return job
+        await asyncio.sleep(0.01)
+    raise AssertionError(f"Job {job_id} never reached {status}")
+
+
+def test_job_id_is_stable():
+    """Test identical payloads map to the same job id."""
+    assert job_id_for({"a": 1, "b": [1, 2]}) == job_id_for({"b": [1, 2], "a": 1})
+    assert job_id_for({"a": 1}) != job_id_for({"a": 2})
+
+
+def test_queue_runs_job():
+    """Test a submitted job runs and stores its result."""
+    async def scenario():
+        queue = JobQueue(JobStore(), workers=1)
+        queue.start(lambda payload: {"echo": payload["x"]})
+        job, created = queue.submit({"x": 1})
+        assert created
+        assert job.status == QUEUED
+        done = await _wait_for(queue, job.job_id, SUCCEEDED)
+        await queue.stop()
+        return done
+    
+    job = asyncio.run(scenario())
+    assert job.result == {"echo": 1}
+
+
+def test_queue_resubmit_does_not_rerun():
+    """Test retrying a submit attaches to the existing job."""
+    calls = []
+    
+    async def scenario():
+        queue = JobQueue(JobStore(), workers=2)
+        queue.start(lambda payload: calls.append(payload) or {})
+        job, _ = queue.submit({"x": 1})
+        await _wait_for(queue, job.job_id, SUCCEEDED)
+        again, created = queue.submit({"x": 1})
+        await queue.stop()
+        return job, again, created
+    
+    job, again, created = asyncio.run(scenario())
+    assert not created
+    assert again.job_id == job.job_id
+    assert len(calls) == 1
+
+
+def test_queue_failed_job_can_be_retried():
+    """Test failed jobs record the error and are re-queued on resubmit."""
+    attempts = []
+    
+    def runner(payload):
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("Bedrock throttled")
+        return {"ok": True}
+    
+    async def scenario():
+        queue = JobQueue(JobStore(), workers=1)
+        queue.start(runner)
+        job, _ = queue.submit({"x": 1})
+        failed = await _wait_for(queue, job.job_id, FAILED)
+        _, created = queue.submit({"x": 1})
+        done = await _wait_for(queue, job.job_id, SUCCEEDED)
+        await queue.stop()
+        return failed, created, done
+    
+    failed, created, done = asyncio.run(scenario())
+    assert failed.error == "Bedrock throttled"
+    assert created
+    assert done.result == {"ok": True}
+
+
+def test_sqlite_store_survives_restart(tmp_path):
+    """Test unfinished jobs in SQLite are picked up by a new queue."""
+    path = str(tmp_path / "jobs.db")
+    
+    async def submit_only():
+        queue = JobQueue(SQLiteJobStore(path), workers=1)
+        job, _ = queue.submit({"x": 2})  # never started
+        return job.job_id
+    
+    async def restart(job_id):
+        queue = JobQueue(SQLiteJobStore(path), workers=1)
+        queue.start(lambda payload: {"double": payload["x"] * 2})
+        job = await _wait_for(queue, job_id, SUCCEEDED)
+        await queue.stop()
+        return job
+    
+    job_id = asyncio.run(submit_only())
+    job = asyncio.run(restart(job_id))
+    assert job.result == {"double": 4}
+    assert SQLiteJobStore(path).list_unfinished() == []
+
+
+def _job(job_id, status, age_minutes=0):
+    updated = datetime.now(UTC) - timedelta(minutes=age_minutes)
+    return Job(job_id=job_id, status=status, request={}, created_at=updated, updated_at=updated)
+
+
+def _stores(tmp_path, **kwargs):
+    return [JobStore(**kwargs), SQLiteJobStore(str(tmp_path / "jobs.db"), **kwargs)]
+
+
+def test_store_expires_finished_jobs(tmp_path):
+    """Test finished jobs expire after the TTL while unfinished ones stay."""
+    for store in _stores(tmp_path, ttl_minutes=60):
+        store.save(_job("old", SUCCEEDED, age_minutes=90))
+        store.save(_job("old-queued", QUEUED, age_minutes=90))
+        store.save(_job("recent", FAILED, age_minutes=10))
+        
+        assert store.get("old") is None
+        assert store.get("old-queued") is not None
+        assert store.get("recent") is not None
+
+
+def test_store_evicts_oldest_finished_jobs(tmp_path):
+    """Test the oldest finished jobs are evicted beyond max entries."""
+    for store in _stores(tmp_path, max_entries=2):
+        store.save(_job("running", RUNNING, age_minutes=30))
+        store.save(_job("older", SUCCEEDED, age_minutes=20))
+        store.save(_job("newer", SUCCEEDED, age_minutes=10))
+        
+        assert store.get("older") is None
+        assert store.get("running") is not None
+        assert store.get("newer") is not None
+
+
+def test_sqlite_store_deletes_expired_rows(tmp_path):
+    """Test expired jobs are removed from the database file."""
+    path = str(tmp_path / "jobs.db")
+    store = SQLiteJobStore(path, ttl_minutes=60)
+    store.save(_job("old", SUCCEEDED, age_minutes=90))
+    store.save(_job("new", SUCCEEDED))
+    
+    rows = sqlite3.connect(path).execute("SELECT job_id FROM jobs").fetchall()
+    assert rows == [("new",)]
+
+
+def test_sqlite_store_migrates_old_schema(tmp_path):
+    """Test databases without an updated_at column are upgraded."""
+    path = str(tmp_path / "jobs.db")
+    job = _job("legacy", QUEUED)
+    with sqlite3.connect(path) as conn:
+        conn.execute(
+            "CREATE TABLE jobs (job_id TEXT PRIMARY KEY, status TEXT NOT NULL, "
+            "created_at TEXT NOT NULL, data TEXT NOT NULL)"
+        )
+        conn.execute(
+            "INSERT INTO jobs VALUES (?, ?, ?, ?)",
+            (job.job_id, job.status, job.created_at.isoformat(), job.model_dump_json())
+        )
+    
+    store = SQLiteJobStore(path)
+    store.save(_job("new", SUCCEEDED))
+    
+    assert [j.job_id for j in store.list_unfinished()] == ["legacy"]
+
+
+def test_create_job_store(tmp_path):
+    """Test backend selection."""
+    assert type(create_job_store("memory")) is JobStore
+    assert isinstance(create_job_store("sqlite", str(tmp_path / "j.db")), SQLiteJobStore)
+    assert type(create_job_store("redis")) is JobStore
+
+
+def test_queue_run_uses_batch_class():
+    """Test non-persisted calls run through the scheduler."""
+    async def scenario():
+        queue = JobQueue(JobStore(), workers=1)
+        queue.start(lambda payload: {})
+        result = await queue.run(lambda a, b: a + b, 2, 3, user_id="bulk", job_class="batch")
+        stats = queue.get_stats()
+        await queue.stop()
+        return result, stats
+    
+    result, stats = asyncio.run(scenario())
+    assert result == 5
+    assert stats["classes"]["batch"]["dispatched"] == 1
+    assert stats["classes"]["interactive"]["dispatched"] == 0
@@ -0,0 +1,101 @@
+"""Tests for incremental JSON extraction."""
+
+import json
+from unittest.mock import patch
+
+import pytest
+
+from career_path.jsonstream import JSONStreamParser, extract_json
+
+REVIEW = {
+    "overallRating": 7,
+    "readinessLevel": "somewhat ready",
+    "strengths": ["Python"],
+    "details": {"gaps": [{"skill": "AWS", "notes": ['a "quoted" note', {"deep": [1, 2.5, -3e2]}]}]},
+    "ok": True,
+    "missing": None
+}
+
+
+def test_deeply_nested_object():
+    """Test objects nested several levels deep are parsed."""
+    assert extract_json(json.dumps(REVIEW)) == REVIEW
+
+
+def test_markdown_and_prose_skipped():
+    """Test text around the object is ignored."""
+    text = f"Here you go:\n```json\n{json.dumps(REVIEW)}\n```\nHope it helps {{"
+    assert extract_json(text) == REVIEW
+
+
+def test_invalid_braces_before_object():
+    """Test braces in prose do not stop the real object being found."""
+    assert extract_json('Use {curly} braces like {x: 1}: {"a": [1, 2]}') == {"a": [1, 2]}
+
+
+def test_failed_object_restarts_at_brace():
+    """Test a brace that breaks an object can start the next one."""
+    assert extract_json('{"a" {"b": 1}') == {"b": 1}
+
+
+def test_no_object_raises():
+    """Test text without a complete object raises."""
+    with pytest.raises(ValueError, match="No valid JSON found"):
+        extract_json('{"a": [1, 2')
+
+
+def test_fields_reported_as_they_complete():
+    """Test top-level fields are emitted as soon as their value closes."""
+    parser = JSONStreamParser()
+    text = json.dumps({"skills": ["Python", "AWS"], "experience": {"backend": 5}, "years": 12})
+    events = []
+    for i in range(0, len(text), 3):
+        events.append(parser.feed(text[i:i + 3]))
+    
+    flat = [field for chunk in events for field in chunk]
+    assert flat == [("skills", ["Python", "AWS"]), ("experience", {"backend": 5}), ("years", 12)]
+    first = next(i for i, chunk in enumerate(events) if chunk)
+    assert first < len(events) - 1  # Available before the object closed
+    assert parser.done
+
+
+def test_partial_excludes_open_values():
+    """Test partial only holds completed top-level fields."""
+    parser = JSONStreamParser()
+    parser.feed('{"skills": ["Python"], "jobs": {"SRE": ["Go"')
+    
+    assert parser.partial == {"skills": ["Python"]}
+    assert parser.started and not parser.done
+
+
+def test_end_marks_close_in_chunk():
+    """Test the end index points just past the closing brace."""
+    parser = JSONStreamParser()
+    parser.feed('{"a": ')
+    parser.feed('1} trailing')
+    
+    assert parser.result == {"a": 1}
+    assert parser.end == 2
+    assert parser.feed("{}") == []
+
+
+@pytest.mark.parametrize("text", [
+    '{"a": [' * 5000 + "x",
+    '{"a" }' * 5000,
+    "{" * 5000 + "]",
+])
+def test_linear_on_adversarial_input(text):
+    """Test many unclosed or broken objects do not cause backtracking."""
+    steps = 0
+    step = JSONStreamParser._step
+    
+    def counting_step(self, char, fields):
+        nonlocal steps
+        steps += 1
+        step(self, char, fields)
+    
+    with patch.object(JSONStreamParser, "_step", counting_step), pytest.raises(ValueError):
+        extract_json(text)
+    
+    # Each character is stepped once, plus once more if it restarts after an error
+    assert steps <= 2 * len(text)
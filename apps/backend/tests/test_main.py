@@ -1,13 +1,20 @@
 """Tests for FastAPI application."""
 
+from unittest.mock import Mock, patch
+
 import pytest
 from fastapi.testclient import TestClient
-from unittest.mock import Mock, patch
+from langgraph.checkpoint.memory import InMemorySaver
+
+from career_path.cache import ResponseCache, response_cache
+from career_path.catalog import LearningCatalog
+from career_path.graph.workflow import create_workflow
 from career_path.main import app
+from career_path.profile_store import ProfileStore
 from career_path.progress import progress_tracker
-from career_path.cache import response_cache
 from career_path.rate_limit import rate_limiter
-
+from career_path.reviews import ReviewStore, review_fingerprint
+from career_path.roadmap_store import roadmap_store
 
 client = TestClient(app)
 
@@ -33,6 +40,7 @@ def test_health_endpoint():
         data = response.json()
         assert "status" in data
         assert "workflow_initialized" in data
+        assert "hits" in data["profile_store"]
 
 
 def test_health_endpoint_degraded():
@@ -99,6 +107,75 @@ def test_generate_roadmap_success(mock_workflow):
     data = response.json()
     assert "nodes" in data
     assert "edges" in data
+    assert data["cache_status"] == {"profile": "miss"}
+
+
+@patch('career_path.main.workflow')
+def test_generate_roadmap_reports_profile_cache_hit(mock_workflow):
+    """Test a stored-profile run is reported without changing the roadmap id."""
+    result = {
+        "nodes": [], "edges": [], "milestones": [], "skill_gaps": [],
+        "courses": [], "projects": [], "certifications": [], "fit_score": 71
+    }
+    resume = "Senior Engineer with 5 years of Python experience. " * 5
+    payload = {"resume_text": resume, "target_jobs": ["Cloud Architect"]}
+    
+    mock_workflow.invoke.return_value = {**result, "profile_cache_hit": False}
+    miss = client.post("/api/roadmaps/generate", json=payload).json()
+    mock_workflow.invoke.return_value = {**result, "profile_cache_hit": True}
+    hit = client.post("/api/roadmaps/generate", json=payload).json()
+    
+    assert miss["cache_status"] == {"profile": "miss"}
+    assert hit["cache_status"] == {"profile": "hit"}
+    assert hit["roadmap_id"] == miss["roadmap_id"]
+
+
+@patch('career_path.main.fast_workflow')
+@patch('career_path.main.workflow')
+def test_generate_roadmap_fast_mode(mock_workflow, mock_fast_workflow):
+    """Test fast mode runs the fused workflow."""
+    mock_fast_workflow.invoke.return_value = {
+        "nodes": [], "edges": [], "milestones": [], "skill_gaps": [],
+        "courses": [], "projects": [], "certifications": [], "fit_score": 80
+    }
+    resume = "Senior Engineer with 5 years of Python experience. " * 5
+    response = client.post("/api/roadmaps/generate", json={
+        "resume_text": resume, "target_jobs": ["Cloud Architect"], "mode": "fast"
+    })
+    
+    assert response.status_code == 200
+    assert response.json()["fit_score"] == 80
+    assert mock_fast_workflow.invoke.call_args.args[0]["mode"] == "fast"
+    mock_workflow.invoke.assert_not_called()
+
+
+@patch('career_path.main.review_store')
+@patch('career_path.main.fast_workflow')
+def test_generate_roadmap_fast_mode_skips_deferred_review(mock_fast_workflow, mock_review_store):
+    """Test fast mode never starts a background review."""
+    mock_fast_workflow.invoke.return_value = {
+        "nodes": [], "edges": [], "milestones": [], "skill_gaps": [],
+        "courses": [], "projects": [], "certifications": [], "fit_score": 80
+    }
+    resume = "Senior Engineer with 5 years of Python experience. " * 5
+    response = client.post("/api/roadmaps/generate", json={
+        "resume_text": resume, "target_jobs": ["Cloud Architect"],
+        "mode": "fast", "defer_review": True
+    })
+    
+    assert response.status_code == 200
+    mock_review_store.start.assert_not_called()
+
+
+def test_generate_roadmap_fast_mode_requires_llm_extraction():
+    """Test fast mode rejects local skill extraction."""
+    resume = "Senior Engineer with 5 years of Python experience. " * 5
+    response = client.post("/api/roadmaps/generate", json={
+        "resume_text": resume, "target_jobs": ["Cloud Architect"],
+        "mode": "fast", "extraction_mode": "hybrid"
+    })
+    
+    assert response.status_code == 422
 
 
 @patch('career_path.main.workflow')
@@ -115,6 +192,206 @@ def test_generate_roadmap_workflow_error(mock_workflow):
     assert response.status_code == 500
 
 
+@patch('career_path.main.workflow')
+def test_generate_roadmap_idempotency_key(mock_workflow):
+    """Test retries with the same Idempotency-Key replay the stored response."""
+    mock_workflow.invoke.return_value = {
+        "nodes": [], "edges": [], "milestones": [], "skill_gaps": [],
+        "courses": [], "projects": [], "certifications": [], "fit_score": 55
+    }
+    resume = "Senior Engineer with 5 years of Python experience. " * 5
+    body = {"resume_text": resume, "target_jobs": ["Cloud Architect"]}
+    headers = {"Idempotency-Key": "test-key-replay"}
+    
+    first = client.post("/api/roadmaps/generate", json=body, headers=headers)
+    second = client.post("/api/roadmaps/generate", json=body, headers=headers)
+    
+    assert first.status_code == 200
+    assert first.headers["idempotent-replayed"] == "false"
+    assert second.headers["idempotent-replayed"] == "true"
+    assert second.json() == first.json()
+    assert mock_workflow.invoke.call_count == 1
+    
+    # Same key, different body
+    conflict = client.post(
+        "/api/roadmaps/generate",
+        json={**body, "target_jobs": ["SRE"]},
+        headers=headers
+    )
+    assert conflict.status_code == 422
+
+
+@patch('career_path.main.workflow')
+def test_generated_roadmap_can_be_fetched_with_etag(mock_workflow):
+    """Test generated roadmaps are stored and served with ETag/304."""
+    mock_workflow.invoke.return_value = {
+        "nodes": [], "edges": [], "milestones": [], "skill_gaps": [],
+        "courses": [], "projects": [], "certifications": [], "fit_score": 64
+    }
+    resume = "Senior Engineer with 5 years of Python experience. " * 5
+    generated = client.post("/api/roadmaps/generate", json={
+        "resume_text": resume, "target_jobs": ["Cloud Architect"]
+    }).json()
+    roadmap_id = generated["roadmap_id"]
+    assert roadmap_id
+    
+    response = client.get(f"/api/roadmaps/{roadmap_id}")
+    assert response.status_code == 200
+    assert response.json() == {k: v for k, v in generated.items() if k != "cache_status"}
+    etag = response.headers["etag"]
+    assert etag == f'"{roadmap_id}"'
+    
+    cached = client.get(f"/api/roadmaps/{roadmap_id}", headers={"If-None-Match": etag})
+    assert cached.status_code == 304
+    assert cached.content == b""
+    
+    assert client.get("/api/roadmaps/unknown-id").status_code == 404
+
+
+@patch('career_path.main.regenerate')
+@patch('career_path.main.workflow')
+def test_regenerate_roadmap_endpoint(mock_workflow, mock_regenerate):
+    """Test regeneration starts from the stored state with the validated patch."""
+    result = {
+        "resume_text": "Senior Engineer with 5 years of Python experience. " * 5,
+        "target_jobs": ["Cloud Architect"], "user_id": "default",
+        "nodes": [], "edges": [], "milestones": [], "skill_gaps": [],
+        "courses": [], "projects": [], "certifications": [], "fit_score": 58
+    }
+    mock_workflow.invoke.return_value = result
+    roadmap_id = client.post("/api/roadmaps/generate", json={
+        "resume_text": result["resume_text"], "target_jobs": ["Cloud Architect"]
+    }).json()["roadmap_id"]
+    mock_regenerate.return_value = ({**result, "fit_score": 40}, ["job_parser", "gap_analysis"])
+    
+    response = client.post(f"/api/roadmaps/{roadmap_id}/regenerate", json={
+        "target_jobs": ["Cloud Architect", " SRE "]
+    })
+    
+    assert response.status_code == 200
+    assert response.json()["fit_score"] == 40
+    assert response.json()["roadmap_id"] != roadmap_id
+    assert response.headers["x-regenerated-nodes"] == "job_parser,gap_analysis"
+    previous, patch_ = mock_regenerate.call_args.args
+    assert previous["fit_score"] == 58
+    assert patch_ == {"target_jobs": ["Cloud Architect", "SRE"]}
+
+
+@patch('career_path.main.skill_recommendations')
+@patch('career_path.main.workflow')
+def test_skill_recommendations_endpoint(mock_workflow, mock_recommendations):
+    """Test expanding any gap of a lazily generated roadmap."""
+    gaps = [{"skill": f"Skill {i}", "priority": "medium", "time_months": 2} for i in range(7)]
+    mock_workflow.invoke.return_value = {
+        "nodes": [], "edges": [], "milestones": [], "skill_gaps": gaps,
+        "courses": [], "projects": [], "certifications": []
+    }
+    resume = "Senior Engineer with 5 years of Python experience. " * 5
+    roadmap_id = client.post("/api/roadmaps/generate", json={
+        "resume_text": resume, "target_jobs": ["Cloud Architect"], "lazy_recommendations": True
+    }).json()["roadmap_id"]
+    assert mock_workflow.invoke.call_args.args[0]["lazy_recommendations"] is True
+    mock_recommendations.return_value = ({"courses": [{"name": "Course"}], "projects": [], "certifications": []}, True)
+    
+    response = client.get(f"/api/roadmaps/{roadmap_id}/recommendations", params={"skill": "skill 6"})
+    
+    assert response.status_code == 200
+    assert response.json() == {
+        "skill": "Skill 6", "courses": [{"name": "Course"}], "projects": [], "certifications": [], "cached": True
+    }
+    mock_recommendations.assert_called_once_with("Skill 6")
+    
+    missing = client.get(f"/api/roadmaps/{roadmap_id}/recommendations", params={"skill": "COBOL"})
+    assert missing.status_code == 404
+
+
+def test_deferred_review_endpoint():
+    """Test a deferred review is computed in the background and served later."""
+    import time
+    
+    mock_workflow = Mock()
+    mock_workflow.invoke.return_value = {
+        "current_skills": ["Python"], "target_jobs": ["Cloud Architect"], "fit_score": 33,
+        "nodes": [], "edges": [], "milestones": [], "skill_gaps": [],
+        "courses": [], "projects": [], "certifications": [], "critical_review": {}
+    }
+    resume = "Senior Engineer with 5 years of Python experience. " * 5
+    
+    with patch('career_path.main.create_workflow', return_value=mock_workflow), \
+         patch('career_path.reviews.critical_review_node',
+               return_value={"critical_review": {"overallRating": 6}}) as mock_review, \
+         patch('career_path.main.review_store', ReviewStore(ResponseCache(ttl_minutes=1))), \
+         TestClient(app) as lifespan_client:
+        generated = lifespan_client.post("/api/roadmaps/generate", json={
+            "resume_text": resume, "target_jobs": ["Cloud Architect"], "defer_review": True
+        }).json()
+        assert generated["critical_review"] == {}
+        assert mock_workflow.invoke.call_args.args[0]["defer_review"] is True
+        
+        review_url = f"/api/roadmaps/{generated['roadmap_id']}/review"
+        review = lifespan_client.get(review_url)
+        for _ in range(100):
+            if review.status_code == 200:
+                break
+            assert review.status_code == 202
+            time.sleep(0.01)
+            review = lifespan_client.get(review_url)
+    
+    assert review.status_code == 200
+    assert review.json() == {"overallRating": 6}
+    assert mock_review.call_count == 1
+
+
+REVIEW_STATE = {
+    "current_skills": ["Python"], "target_jobs": ["Cloud Architect"], "fit_score": 33,
+    "skill_gaps": [], "critical_review": {}
+}
+
+
+def test_review_endpoint_fast_mode_conflict():
+    """Test fast-mode roadmaps never start a critical review."""
+    roadmap_id = roadmap_store.save({"target_jobs": ["Fast"]}, {**REVIEW_STATE, "mode": "fast"})
+    
+    with patch('career_path.main.review_store') as mock_review_store:
+        response = client.get(f"/api/roadmaps/{roadmap_id}/review")
+    
+    assert response.status_code == 409
+    mock_review_store.start.assert_not_called()
+
+
+def test_review_endpoint_rate_limited():
+    """Test starting a review is rate limited but polling one in flight is not."""
+    roadmap_id = roadmap_store.save({"target_jobs": ["Limited"]}, REVIEW_STATE)
+    mock_review_store = Mock()
+    mock_review_store.get.return_value = None
+    mock_review_store.pending.return_value = False
+    
+    with patch('career_path.main.review_store', mock_review_store), \
+         patch('career_path.main.rate_limiter.is_allowed', return_value=(False, "Rate limit exceeded")):
+        limited = client.get(f"/api/roadmaps/{roadmap_id}/review")
+        mock_review_store.pending.return_value = True
+        polled = client.get(f"/api/roadmaps/{roadmap_id}/review")
+    
+    assert limited.status_code == 429
+    assert polled.status_code == 202
+    mock_review_store.start.assert_not_called()
+    mock_review_store.pending.assert_called_with(review_fingerprint(REVIEW_STATE))
+
+
+def test_regenerate_roadmap_rate_limited():
+    """Test regeneration is rate limited like generation."""
+    with patch('career_path.main.rate_limiter.is_allowed', return_value=(False, "Rate limit exceeded")):
+        response = client.post("/api/roadmaps/any-id/regenerate", json={"specialty_info": "AWS"})
+    
+    assert response.status_code == 429
+
+
+def test_regenerate_roadmap_not_found():
+    """Test regenerating an unknown roadmap."""
+    response = client.post("/api/roadmaps/unknown-id/regenerate", json={"specialty_info": "AWS"})
+    assert response.status_code == 404
+
+
 def test_generate_roadmap_no_workflow():
     """Test roadmap generation when workflow not initialized."""
     with patch('career_path.main.workflow', None):
@@ -127,6 +404,176 @@ def test_generate_roadmap_no_workflow():
         assert response.status_code == 500
 
 
+@patch('career_path.batch.job_parser_node')
+def test_generate_roadmap_batch_streams_ndjson(mock_parser):
+    """Test batch generation streams one NDJSON line per item."""
+    import json
+    
+    mock_parser.return_value = {"required_skills": {}, "nice_to_have_skills": {}}
+    mock_workflow = Mock()
+    
+    def invoke(state):
+        if state["target_jobs"] == ["Broken"]:
+            raise Exception("Workflow failed")
+        result = {
+            "nodes": [], "edges": [], "milestones": [], "skill_gaps": [],
+            "courses": [], "projects": [], "certifications": [], "fit_score": 50
+        }
+        if state["target_jobs"] == ["Degraded"]:
+            result["error"] = "Critical review failed: throttled"
+        return result
+    mock_workflow.invoke.side_effect = invoke
+    
+    resume = "Senior Engineer with 5 years of Python experience. " * 2
+    with patch('career_path.main.create_workflow', return_value=mock_workflow), \
+         TestClient(app) as batch_client:
+        response = batch_client.post("/api/roadmaps/batch", json={
+            "items": [
+                {"resume_text": resume, "target_jobs": ["Cloud Architect"]},
+                {"resume_text": resume, "target_jobs": ["Broken"]},
+                {"resume_text": resume, "target_jobs": ["Degraded"]}
+            ],
+            "concurrency": 2
+        })
+        stats = batch_client.get("/api/queue/stats").json()
+    
+    assert stats["classes"]["batch"]["dispatched"] == 3
+
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("application/x-ndjson")
+    lines = {line["index"]: line for line in map(json.loads, response.text.splitlines())}
+    assert len(lines) == 3
+    assert lines[0]["status"] == "ok"
+    assert lines[0]["roadmap"]["fit_score"] == 50
+    assert lines[1]["status"] == "error"
+    assert lines[2]["status"] == "error"
+    assert lines[2]["error"] == "Critical review failed: throttled"
+    assert lines[2]["roadmap"]["fit_score"] == 50
+
+
+def test_generate_roadmap_async_job():
+    """Test async generation returns 202 and the result can be polled."""
+    import time
+    
+    mock_workflow = Mock()
+    mock_workflow.invoke.return_value = {
+        "nodes": [], "edges": [], "milestones": [], "skill_gaps": [],
+        "courses": [], "projects": [], "certifications": [], "fit_score": 70
+    }
+    payload = {
+        "resume_text": "Senior Engineer with 5 years of Python experience. " * 2,
+        "target_jobs": ["Cloud Architect"]
+    }
+    
+    with patch('career_path.main.create_workflow', return_value=mock_workflow), \
+         TestClient(app) as async_client:
+        response = async_client.post("/api/roadmaps/generate?async=true", json=payload)
+        assert response.status_code == 202
+        job = response.json()
+        assert response.headers["location"] == job["status_url"]
+        
+        for _ in range(200):
+            result = async_client.get(job["result_url"])
+            if result.status_code != 202:
+                break
+            time.sleep(0.01)
+        assert result.status_code == 200
+        assert result.json()["fit_score"] == 70
+        
+        # Retrying the submit does not run the workflow again
+        retry = async_client.post("/api/roadmaps/generate?async=true", json=payload)
+        assert retry.status_code == 202
+        assert retry.json()["job_id"] == job["job_id"]
+        assert retry.json()["status"] == "succeeded"
+        assert mock_workflow.invoke.call_count == 1
+
+
+def _flaky_review_llm(calls, outages):
+    """LLM factory whose critical review fails while ``outages`` is non-empty."""
+    def get_llm(agent_name, max_tokens=None):
+        calls.append(agent_name)
+        llm = Mock()
+        if agent_name == "critical_review" and outages:
+            llm.invoke.side_effect = outages.pop()
+            return llm
+        content = {
+            "resume_analyzer": '{"skills": ["Python"], "experience": {}, "strengths": []}',
+            "job_parser": '{"required": ["Python", "AWS"]}',
+            "critical_review": '{"overallRating": 7}'
+        }.get(agent_name, '{}')
+        llm.invoke.return_value = Mock(content=content)
+        return llm
+    return get_llm
+
+
+def test_idempotent_retry_resumes_after_node_error():
+    """Test a node error is not stored for the key and the retry resumes the run."""
+    calls = []
+    body = {
+        "resume_text": "Backend engineer with Python experience building services. " * 2,
+        "target_jobs": ["Cloud Engineer"]
+    }
+    headers = {"Idempotency-Key": "test-key-node-error"}
+    
+    with patch('career_path.main.workflow', create_workflow(checkpointer=InMemorySaver())), \
+         patch('career_path.graph.nodes._get_llm', side_effect=_flaky_review_llm(calls, [RuntimeError("Bedrock down")])), \
+         patch('career_path.graph.nodes.profile_store', ProfileStore(ResponseCache(ttl_minutes=1))), \
+         patch('career_path.graph.nodes.learning_catalog', LearningCatalog({})):
+        first = client.post("/api/roadmaps/generate", json=body, headers=headers)
+        assert first.status_code == 503
+        
+        calls.clear()
+        retry = client.post("/api/roadmaps/generate", json=body, headers=headers)
+    
+    assert retry.status_code == 200
+    assert retry.headers["idempotent-replayed"] == "false"
+    assert retry.json()["critical_review"]["overallRating"] == 7
+    assert calls == ["critical_review"]
+
+
+def test_async_job_with_node_error_fails_and_resumes():
+    """Test a job whose run ended with a node error is FAILED and resumes on resubmit."""
+    import time
+    
+    calls = []
+    payload = {
+        "resume_text": "Platform engineer with Python experience running services. " * 2,
+        "target_jobs": ["Cloud Engineer"]
+    }
+    
+    def wait_for(job_url, status):
+        for _ in range(200):
+            job = async_client.get(job_url).json()
+            if job["status"] == status:
+                return job
+            time.sleep(0.01)
+        raise AssertionError(f"Job never reached {status}")
+    
+    with patch('career_path.main.create_checkpointer', return_value=InMemorySaver()), \
+         patch('career_path.graph.nodes._get_llm', side_effect=_flaky_review_llm(calls, [RuntimeError("Bedrock down")])), \
+         patch('career_path.graph.nodes.profile_store', ProfileStore(ResponseCache(ttl_minutes=1))), \
+         patch('career_path.graph.nodes.learning_catalog', LearningCatalog({})), \
+         TestClient(app) as async_client:
+        job = async_client.post("/api/roadmaps/generate?async=true", json=payload).json()
+        failed = wait_for(job["status_url"], "failed")
+        assert "Bedrock down" in failed["error"]
+        
+        calls.clear()
+        retry = async_client.post("/api/roadmaps/generate?async=true", json=payload)
+        assert retry.json()["job_id"] == job["job_id"]
+        wait_for(job["status_url"], "succeeded")
+        result = async_client.get(job["result_url"]).json()
+    
+    assert result["critical_review"]["overallRating"] == 7
+    assert calls == ["critical_review"]
+
+
+def test_get_job_not_found():
+    """Test polling an unknown job."""
+    assert client.get("/api/jobs/unknown").status_code == 404
+    assert client.get("/api/jobs/unknown/result").status_code == 404
+
+
 def test_api_docs():
     """Test API documentation endpoint."""
     response = client.get("/docs")
@@ -361,6 +808,52 @@ def test_compare_paths_validation_error():
     assert response.status_code == 422
 
 
+def test_compare_multiple_paths_endpoint():
+    """Test N-way career path comparison endpoint."""
+    response = client.post("/api/compare-paths/multi", json={
+        "current_skills": ["Python"],
+        "paths": {
+            "AWS DevOps": ["Python", "AWS", "Docker"],
+            "Azure DevOps": ["Python", "Azure", "Docker"],
+            "Platform": ["Docker", "Kubernetes"]
+        }
+    })
+    
+    assert response.status_code == 200
+    data = response.json()
+    assert len(data["pairwise"]["shared_gaps"]) == 3
+    assert data["common_gaps"] == ["docker"]
+    assert "learning_effort" in data["paths"]["Platform"]
+
+
+def test_compare_multiple_paths_needs_two_paths():
+    """Test N-way comparison rejects a single path."""
+    response = client.post("/api/compare-paths/multi", json={
+        "current_skills": ["Python"],
+        "paths": {"Only": ["AWS"]}
+    })
+    assert response.status_code == 422
+
+
+@patch('career_path.main.rank_candidates')
+def test_rank_candidates_endpoint(mock_rank):
+    """Test candidate ranking endpoint."""
+    async def fake_rank(**kwargs):
+        return {"jobs": kwargs["target_jobs"], "rankings": {}}
+    mock_rank.side_effect = fake_rank
+    
+    resume = "Senior Engineer with 5 years of Python experience. " * 2
+    response = client.post("/api/candidates/rank", json={
+        "candidates": [{"candidate_id": "c1", "resume_text": resume}],
+        "target_jobs": ["Cloud Architect", " Cloud Architect "],
+        "top_k": 3
+    })
+    
+    assert response.status_code == 200
+    assert response.json()["jobs"] == ["Cloud Architect"]
+    assert mock_rank.call_args.kwargs["top_k"] == 3
+
+
 def test_health_includes_cache_stats():
     """Test health endpoint includes cache stats."""
     with patch('career_path.main.check_aws_credentials') as mock_aws, \
@@ -0,0 +1,105 @@
+"""Tests for cross-request micro-batching."""
+
+import threading
+
+import pytest
+
+from career_path.microbatch import MicroBatcher
+
+
+def _submit_concurrently(batcher, key, items):
+    """Submit each item from its own thread and collect the results."""
+    results = {}
+    
+    def worker(item):
+        results[item] = batcher.submit(key, item)
+    
+    threads = [threading.Thread(target=worker, args=(item,)) for item in items]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return results
+
+
+def test_concurrent_items_share_one_call():
+    """Test items submitted within the window are handled together."""
+    calls = []
+    
+    def handler(key, items):
+        calls.append(list(items))
+        return {item: item.upper() for item in items}
+    
+    batcher = MicroBatcher(handler, window_ms=50)
+    results = _submit_concurrently(batcher, "k", ["a", "b", "c"])
+    
+    assert results == {"a": "A", "b": "B", "c": "C"}
+    assert len(calls) == 1
+    assert batcher.get_stats() == {"batches": 1, "items": 3, "avg_batch_size": 3.0}
+
+
+def test_keys_are_batched_separately():
+    """Test only items with the same key share a handler call."""
+    calls = []
+    
+    def handler(key, items):
+        calls.append(key)
+        return {item: key for item in items}
+    
+    batcher = MicroBatcher(handler, window_ms=20)
+    a = batcher.submit_many("x", ["1"])
+    b = batcher.submit_many("y", ["1"])
+    
+    assert a[0].result(timeout=1) == "x"
+    assert b[0].result(timeout=1) == "y"
+    assert sorted(calls) == ["x", "y"]
+
+
+def test_full_batch_flushes_immediately():
+    """Test a batch is flushed as soon as it reaches max_batch."""
+    calls = []
+    batcher = MicroBatcher(
+        lambda key, items: calls.append(items) or {item: 1 for item in items},
+        window_ms=60000,
+        max_batch=2
+    )
+    
+    futures = batcher.submit_many("k", ["a", "b"])
+    
+    assert [future.result(timeout=1) for future in futures] == [1, 1]
+    assert calls == [["a", "b"]]
+
+
+def test_duplicate_items_share_result():
+    """Test the same item submitted twice is sent to the handler once."""
+    calls = []
+    batcher = MicroBatcher(
+        lambda key, items: calls.append(items) or {item: len(item) for item in items},
+        window_ms=10
+    )
+    
+    futures = batcher.submit_many("k", ["ab", "ab"])
+    
+    assert [future.result(timeout=1) for future in futures] == [2, 2]
+    assert calls == [["ab"]]
+
+
+def test_handler_error_propagates():
+    """Test a handler failure reaches every waiting caller."""
+    def handler(key, items):
+        raise RuntimeError("boom")
+    
+    batcher = MicroBatcher(handler, window_ms=10)
+    
+    with pytest.raises(RuntimeError, match="boom"):
+        batcher.submit("k", "a")
+
+
+def test_missing_result_raises():
+    """Test items the handler did not answer fail individually."""
+    batcher = MicroBatcher(lambda key, items: {"a": 1}, window_ms=10)
+    a, b = batcher.submit_many("k", ["a", "b"])
+    
+    assert a.result(timeout=1) == 1
+    with pytest.raises(ValueError, match="No result"):
+        b.result(timeout=1)
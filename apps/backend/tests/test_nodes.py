@@ -1,15 +1,39 @@
 """Tests for graph nodes."""
 
+import json
+from unittest.mock import Mock, patch
+
 import pytest
-from unittest.mock import Mock, patch, MagicMock
+from langchain_core.language_models import BaseChatModel
+from langchain_core.messages import AIMessageChunk, ToolCallChunk
+from langchain_core.outputs import ChatGenerationChunk
+
+from career_path.budgets import OutputBudget
+from career_path.cache import ResponseCache, response_cache
+from career_path.catalog import LearningCatalog
 from career_path.graph.nodes import (
     _extract_json,
-    resume_analyzer_node,
-    job_parser_node,
+    _invoke_json,
+    fused_analysis_node,
     gap_analysis_node,
+    job_parser_node,
     learning_path_node,
-    roadmap_generator_node
+    learning_recommendations,
+    profile_lookup_node,
+    resume_analyzer_node,
+    roadmap_generator_node,
+    skill_recommendations,
 )
+from career_path.profile_store import ProfileStore
+from career_path.skills import skill_vocabulary
+
+
+@pytest.fixture(autouse=True)
+def clear_response_cache():
+    """Start each test without cached LLM responses or catalog entries."""
+    response_cache.clear()
+    with patch('career_path.graph.nodes.learning_catalog', LearningCatalog({})):
+        yield
 
 
 def test_extract_json_direct():
@@ -33,12 +57,147 @@ def test_extract_json_embedded():
     assert result == {"skills": ["Python"]}
 
 
+def test_extract_json_deeply_nested():
+    """Test JSON extraction of objects nested more than two levels."""
+    text = 'Review: {"review": {"gaps": [{"skill": "AWS", "steps": ["Learn"]}]}}'
+    result = _extract_json(text)
+    assert result["review"]["gaps"][0]["steps"] == ["Learn"]
+
+
 def test_extract_json_invalid():
     """Test JSON extraction with invalid input."""
     with pytest.raises(ValueError, match="No valid JSON found"):
         _extract_json("This is not JSON at all")
 
 
+class StreamingModel(BaseChatModel):
+    """Chat model that streams scripted answers and counts chunks read."""
+    
+    answers: list
+    calls: list = []
+    chunks_read: int = 0
+    
+    tools: list = []
+    
+    @property
+    def _llm_type(self) -> str:
+        return "scripted"
+    
+    def bind_tools(self, tools, **kwargs):
+        self.tools.append((tools, kwargs))
+        return self
+    
+    def _generate(self, messages, stop=None, run_manager=None, **kwargs):
+        raise NotImplementedError
+    
+    def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+        self.calls.append(messages)
+        for piece in self.answers.pop(0):
+            self.chunks_read += 1
+            yield ChatGenerationChunk(message=AIMessageChunk(content=piece))
+
+
+def test_invoke_json_stops_when_object_closes():
+    """Test streaming stops at the end of the top-level JSON object."""
+    model = StreamingModel(answers=[['{"a": {"b": "}"', '}}', ' trailing', ' text']], calls=[], tools=[])
+    with patch('career_path.graph.nodes._get_llm', return_value=model) as get_llm, \
+         patch('career_path.graph.nodes.output_budget', OutputBudget({"job_parser": 300})):
+        result = _invoke_json("job_parser", "prompt")
+    
+    assert result == {"a": {"b": "}"}}
+    assert model.chunks_read == 2
+    get_llm.assert_called_once_with("job_parser", 300)
+
+
+def test_invoke_json_continues_truncated_output():
+    """Test a truncated answer is continued rather than regenerated."""
+    model = StreamingModel(answers=[['{"required": ["Py'], ['thon"]}']], calls=[], tools=[])
+    budget = OutputBudget({"job_parser": 300}, ceiling=2000)
+    with patch('career_path.graph.nodes._get_llm', return_value=model) as get_llm, \
+         patch('career_path.graph.nodes.output_budget', budget):
+        result = _invoke_json("job_parser", "prompt")
+    
+    assert result == {"required": ["Python"]}
+    assert get_llm.call_args_list[1].args == ("job_parser", 2000)
+    continuation = model.calls[1]
+    assert continuation[-1].content == '{"required": ["Py'
+    assert budget.get_stats()["job_parser"]["truncations"] == 1
+
+
+def test_invoke_json_streams_completed_fields():
+    """Test completed top-level fields go to the graph stream writer."""
+    model = StreamingModel(answers=[['{"skills": ["Py', 'thon"], "strengths"', ': ["Ownership"]}']], calls=[], tools=[])
+    events = []
+    with patch('career_path.graph.nodes._get_llm', return_value=model), \
+         patch('career_path.graph.nodes._stream_writer', return_value=events.append):
+        _invoke_json("resume_analyzer", "prompt")
+    
+    assert events == [
+        {"node": "resume_analyzer", "field": "skills", "value": ["Python"]},
+        {"node": "resume_analyzer", "field": "strengths", "value": ["Ownership"]}
+    ]
+
+
+def test_invoke_json_uses_schema_tool():
+    """Test a schema is bound as a forced tool and its arguments are parsed."""
+    from career_path.graph.schemas import JobRequirements
+    
+    def tool_chunks(*pieces):
+        return [ToolCallChunk(name="JobRequirements", args=piece, id=None, index=0) for piece in pieces]
+    
+    class ToolModel(StreamingModel):
+        def _stream(self, messages, stop=None, run_manager=None, **kwargs):
+            for call in tool_chunks('{"required": ["Go"', '], "nice_to_have": []}'):
+                yield ChatGenerationChunk(message=AIMessageChunk(content="", tool_call_chunks=[call]))
+    
+    model = ToolModel(answers=[], calls=[], tools=[])
+    with patch('career_path.graph.nodes._get_llm', return_value=model):
+        result = _invoke_json("job_parser", "prompt", schema=JobRequirements)
+    
+    assert result == {"required": ["Go"], "nice_to_have": []}
+    (tool,), options = model.tools[0]
+    assert tool["name"] == "JobRequirements"
+    assert tool["input_schema"]["properties"]["required"]["type"] == "array"
+    assert options == {"tool_choice": "JobRequirements"}
+
+
+@patch('career_path.graph.nodes._get_llm')
+def test_invoke_json_repairs_invalid_output(mock_get_llm):
+    """Test output failing validation gets a short repair call."""
+    from career_path.graph.schemas import ResumeAnalysis
+    
+    mock_llm = Mock()
+    mock_llm.invoke.side_effect = [
+        Mock(content='{"skills": "Python, AWS", "experience": {}}'),
+        Mock(content='{"skills": ["Python", "AWS"], "experience": {}}')
+    ]
+    mock_get_llm.return_value = mock_llm
+    
+    result = _invoke_json("resume_analyzer", "prompt", schema=ResumeAnalysis)
+    
+    assert result == {"skills": ["Python", "AWS"], "experience": {}}
+    repair_prompt = mock_llm.invoke.call_args_list[1].args[0]
+    assert "Fix this JSON" in repair_prompt
+    assert '"skills": "Python, AWS"' in repair_prompt
+    assert "skills" in repair_prompt.split("Errors:")[1]
+
+
+@patch('career_path.graph.nodes._get_llm')
+def test_invoke_json_repair_failure_raises(mock_get_llm):
+    """Test an answer that cannot be repaired raises."""
+    from pydantic import ValidationError
+
+    from career_path.graph.schemas import ResumeAnalysis
+    
+    mock_llm = Mock()
+    mock_llm.invoke.return_value = Mock(content='{"skills": 5}')
+    mock_get_llm.return_value = mock_llm
+    
+    with pytest.raises(ValidationError):
+        _invoke_json("resume_analyzer", "prompt", schema=ResumeAnalysis)
+    assert mock_llm.invoke.call_count == 2
+
+
 @patch('career_path.graph.nodes.boto3.client')
 def test_get_bedrock_client_cached(mock_boto_client):
     """Test bedrock client caching."""
@@ -53,6 +212,7 @@ def test_get_bedrock_client_cached(mock_boto_client):
     client2 = _get_bedrock_client()
     
     # Should only create client once
+    assert client1 is client2
     assert mock_boto_client.call_count == 1
 
 
@@ -84,6 +244,158 @@ def test_resume_analyzer_success(mock_get_llm):
     assert result["workflow_status"] == "resume_analyzed"
 
 
+@patch('career_path.graph.nodes._get_llm')
+def test_resume_analyzer_saves_profile(mock_get_llm):
+    """Test a successful analysis is stored for the resume and user."""
+    mock_llm = Mock()
+    mock_llm.invoke.return_value = Mock(content='{"skills": ["Python"], "experience": {"Python": 5}, "strengths": ["Ownership"]}')
+    mock_get_llm.return_value = mock_llm
+    store = ProfileStore(ResponseCache(ttl_minutes=1))
+    
+    with patch('career_path.graph.nodes.profile_store', store):
+        resume_analyzer_node({"resume_text": "Python engineer", "user_id": "alice"})
+    
+    assert store.get("Python engineer", "alice") == {
+        "current_skills": ["Python"],
+        "experience_years": {"Python": 5},
+        "strengths": ["Ownership"]
+    }
+
+
+@patch('career_path.graph.nodes._get_llm')
+def test_resume_analyzer_compacts_long_resume(mock_get_llm):
+    """Test a long resume is compacted instead of cut off, keeping late skills."""
+    mock_llm = Mock()
+    mock_llm.invoke.return_value = Mock(content='{"skills": ["Kafka"], "experience": {}, "strengths": []}')
+    mock_get_llm.return_value = mock_llm
+    filler = "\n".join(f"- Delivered initiative {i} with cross-functional partners on schedule." for i in range(60))
+    resume = f"Experience\n{filler}\nSkills\nKafka, Snowflake, Airflow"
+    
+    with patch('career_path.graph.nodes.profile_store', ProfileStore(ResponseCache(ttl_minutes=1))):
+        result = resume_analyzer_node({"resume_text": resume})
+    
+    prompt = mock_llm.invoke.call_args.args[0]
+    assert "Kafka, Snowflake, Airflow" in prompt
+    assert len(prompt) < len(resume)
+    assert result["resume_tokens_saved"] > 0
+
+
+@patch('career_path.graph.nodes._get_llm')
+def test_resume_analyzer_fast_mode_skips_llm(mock_get_llm):
+    """Test fast mode extracts taxonomy skills locally."""
+    state = {"resume_text": "Built Python services on Kubernetes and AWS", "extraction_mode": "fast"}
+    result = resume_analyzer_node(state)
+    
+    assert result["current_skills"] == ["Python", "Kubernetes", "AWS"]
+    assert result["current_skill_ids"] == skill_vocabulary.encode(["python", "kubernetes", "aws"])
+    assert result["skill_vocabulary"] == skill_vocabulary.version
+    assert result["experience_years"] == {}
+    mock_get_llm.assert_not_called()
+
+
+@patch('career_path.graph.nodes._get_llm')
+def test_resume_analyzer_hybrid_mode(mock_get_llm):
+    """Test hybrid mode takes skills locally and only experience/strengths from the LLM."""
+    mock_llm = Mock()
+    mock_llm.invoke.return_value = Mock(content='{"skills": ["Ignored"], "experience": {"Backend": 6}, "strengths": ["Mentoring"]}')
+    mock_get_llm.return_value = mock_llm
+    store = ProfileStore(ResponseCache(ttl_minutes=1))
+    
+    with patch('career_path.graph.nodes.profile_store', store):
+        result = resume_analyzer_node({"resume_text": "Docker and Terraform at scale", "extraction_mode": "hybrid"})
+    
+    assert result["current_skills"] == ["Docker", "Terraform"]
+    assert result["experience_years"] == {"Backend": 6}
+    assert result["strengths"] == ["Mentoring"]
+    assert "Technical skills" not in mock_llm.invoke.call_args.args[0]
+    assert store.get("Docker and Terraform at scale") is None
+
+
+@patch('career_path.graph.nodes._get_llm')
+def test_resume_analyzer_error_not_stored(mock_get_llm):
+    """Test a failed analysis is not stored as a profile."""
+    mock_llm = Mock()
+    mock_llm.invoke.side_effect = Exception("LLM error")
+    mock_get_llm.return_value = mock_llm
+    store = ProfileStore(ResponseCache(ttl_minutes=1))
+    
+    with patch('career_path.graph.nodes.profile_store', store):
+        resume_analyzer_node({"resume_text": "Python engineer", "user_id": "alice"})
+    
+    assert store.get("Python engineer", "alice") is None
+
+
+def test_profile_lookup_miss():
+    """Test lookup without a stored profile."""
+    with patch('career_path.graph.nodes.profile_store', ProfileStore(ResponseCache(ttl_minutes=1))):
+        result = profile_lookup_node({"resume_text": "Python engineer", "user_id": "alice"})
+    
+    assert result == {"profile_cache_hit": False}
+
+
+@patch('career_path.graph.nodes._get_llm')
+def test_fused_analysis_stores_profile(mock_get_llm):
+    """Test fast mode stores the extracted profile like full mode."""
+    mock_llm = Mock()
+    mock_llm.invoke.return_value = Mock(content=json.dumps({
+        "skills": ["Python"], "experience": {"Backend": 4}, "strengths": ["Ownership"],
+        "jobs": {"SRE": {"required": ["Python", "Kubernetes"]}}
+    }))
+    mock_get_llm.return_value = mock_llm
+    store = ProfileStore(ResponseCache(ttl_minutes=1))
+    
+    with patch('career_path.graph.nodes.profile_store', store):
+        result = fused_analysis_node({"resume_text": "Python engineer", "target_jobs": ["SRE"]})
+    
+    assert result["profile_cache_hit"] is False
+    assert result["required_skills"] == {"SRE": ["Python", "Kubernetes"]}
+    assert store.get("Python engineer")["experience_years"] == {"Backend": 4}
+
+
+@patch('career_path.graph.nodes._get_llm')
+def test_fused_analysis_uses_stored_profile(mock_get_llm):
+    """Test a stored profile replaces the resume in the fused prompt."""
+    mock_llm = Mock()
+    mock_llm.invoke.return_value = Mock(content=json.dumps({
+        "skills": ["Ignored"], "jobs": {"SRE": {"required": ["Kubernetes"]}}
+    }))
+    mock_get_llm.return_value = mock_llm
+    store = ProfileStore(ResponseCache(ttl_minutes=1))
+    store.save("Python engineer", "default", {
+        "current_skills": ["Python"],
+        "experience_years": {"Python": 5},
+        "strengths": ["Ownership"]
+    })
+    
+    with patch('career_path.graph.nodes.profile_store', store):
+        result = fused_analysis_node({"resume_text": "Python engineer", "target_jobs": ["SRE"]})
+    
+    prompt = mock_llm.invoke.call_args.args[0]
+    assert "Candidate skills: Python" in prompt
+    assert "Resume:" not in prompt
+    assert result["profile_cache_hit"] is True
+    assert result["current_skills"] == ["Python"]
+    assert result["experience_years"] == {"Python": 5}
+
+
+def test_profile_lookup_hit():
+    """Test lookup loads the stored profile."""
+    store = ProfileStore(ResponseCache(ttl_minutes=1))
+    store.save("Python engineer", "alice", {
+        "current_skills": ["Python"],
+        "experience_years": {"Python": 5},
+        "strengths": ["Ownership"]
+    })
+    
+    with patch('career_path.graph.nodes.profile_store', store):
+        result = profile_lookup_node({"resume_text": "python  engineer", "user_id": "alice"})
+    
+    assert result["profile_cache_hit"] is True
+    assert result["current_skills"] == ["Python"]
+    assert result["experience_years"] == {"Python": 5}
+    assert result["workflow_status"] == "resume_analyzed"
+
+
 @patch('career_path.graph.nodes._get_llm')
 def test_resume_analyzer_error(mock_get_llm):
     """Test resume analysis with error."""
@@ -115,6 +427,27 @@ def test_job_parser_success(mock_get_llm):
     assert result["workflow_status"] == "jobs_parsed"
 
 
+@patch('career_path.graph.nodes._get_llm')
+def test_job_parser_reuses_parsed_jobs(mock_get_llm):
+    """Test job parsing skips titles whose requirements are already known."""
+    mock_llm = Mock()
+    mock_response = Mock()
+    mock_response.content = '{"required": ["Go"], "nice_to_have": []}'
+    mock_llm.invoke.return_value = mock_response
+    mock_get_llm.return_value = mock_llm
+    
+    state = {
+        "target_jobs": ["Architect", "SRE"],
+        "required_skills": {"Architect": ["AWS"]},
+        "nice_to_have_skills": {"Architect": ["Terraform"]}
+    }
+    result = job_parser_node(state)
+    
+    assert result["required_skills"] == {"Architect": ["AWS"], "SRE": ["Go"]}
+    assert result["nice_to_have_skills"]["Architect"] == ["Terraform"]
+    assert mock_llm.invoke.call_count == 1
+
+
 @patch('career_path.graph.nodes._get_llm')
 def test_job_parser_error(mock_get_llm):
     """Test job parsing with error."""
@@ -128,6 +461,53 @@ def test_job_parser_error(mock_get_llm):
     assert result["required_skills"]["Test Job"] == []
 
 
+@patch('career_path.graph.nodes._get_llm')
+def test_job_parser_micro_batches_titles(mock_get_llm):
+    """Test concurrent title-only requests share one job parser call."""
+    from concurrent.futures import ThreadPoolExecutor
+
+    from career_path.graph.nodes import _parse_job_titles
+    from career_path.microbatch import MicroBatcher
+    
+    mock_llm = Mock()
+    mock_response = Mock()
+    mock_response.content = json.dumps({
+        "Cloud Engineer": {"required": ["AWS"], "nice_to_have": ["Go"]},
+        "sre": {"required": ["Kubernetes"], "nice_to_have": []}
+    })
+    mock_llm.invoke.return_value = mock_response
+    mock_get_llm.return_value = mock_llm
+    
+    batcher = MicroBatcher(_parse_job_titles, window_ms=50)
+    with patch('career_path.graph.nodes._job_parser_batcher', batcher), ThreadPoolExecutor(2) as pool:
+        results = list(pool.map(job_parser_node, [
+            {"target_jobs": ["Cloud Engineer"]},
+            {"target_jobs": ["SRE"]}
+        ]))
+    
+    assert mock_llm.invoke.call_count == 1
+    assert results[0]["required_skills"] == {"Cloud Engineer": ["AWS"]}
+    assert results[0]["nice_to_have_skills"] == {"Cloud Engineer": ["Go"]}
+    assert results[1]["required_skills"] == {"SRE": ["Kubernetes"]}
+
+
+@patch('career_path.graph.nodes._get_llm')
+def test_job_parser_batch_skips_job_descriptions(mock_get_llm):
+    """Test requests with a job description are never batched."""
+    mock_llm = Mock()
+    mock_response = Mock()
+    mock_response.content = '{"required": ["Python"], "nice_to_have": []}'
+    mock_llm.invoke.return_value = mock_response
+    mock_get_llm.return_value = mock_llm
+    batcher = Mock()
+    
+    with patch('career_path.graph.nodes._job_parser_batcher', batcher):
+        result = job_parser_node({"target_jobs": ["Dev"], "job_description": "Python role"})
+    
+    batcher.submit_many.assert_not_called()
+    assert result["required_skills"] == {"Dev": ["Python"]}
+
+
 def test_gap_analysis():
     """Test gap analysis."""
     state = {
@@ -181,6 +561,82 @@ def test_learning_path_no_gaps():
     assert result["projects"] == []
 
 
+@patch('career_path.graph.nodes._get_llm')
+def test_learning_path_only_requests_uncached_skills(mock_get_llm):
+    """Test overlapping skill sets reuse per-skill cache entries."""
+    def recommendations(*skills):
+        return {skill: {"courses": [{"name": f"{skill} Course"}], "projects": [], "certifications": []} for skill in skills}
+    
+    mock_llm = Mock()
+    mock_llm.invoke.side_effect = [
+        Mock(content=json.dumps(recommendations("Docker", "Kubernetes", "Terraform"))),
+        Mock(content=json.dumps(recommendations("aws"))),
+    ]
+    mock_get_llm.return_value = mock_llm
+    
+    def gaps(*skills):
+        return {"skill_gaps": [{"skill": skill, "priority": "high", "time_months": 2} for skill in skills]}
+    
+    learning_path_node(gaps("Docker", "Kubernetes", "Terraform"))
+    result = learning_path_node(gaps("Kubernetes", "Terraform", "AWS"))
+    
+    second_prompt = mock_llm.invoke.call_args_list[1].args[0][-1].content
+    assert "AWS" in second_prompt
+    assert "Kubernetes" not in second_prompt
+    assert [course["name"] for course in result["courses"]] == ["Kubernetes Course", "Terraform Course", "aws Course"]
+
+
+@patch('career_path.graph.nodes._get_llm')
+def test_learning_recommendations_missing_skill_not_cached(mock_get_llm):
+    """Test a skill left out of the response is empty and retried next time."""
+    mock_llm = Mock()
+    mock_llm.invoke.return_value = Mock(content='{"Docker": {"courses": [{"name": "Docker Course"}]}}')
+    mock_get_llm.return_value = mock_llm
+    
+    recommendations, hits = learning_recommendations(["Docker", "Rust"])
+    
+    assert hits == 0
+    assert recommendations["Docker"]["courses"] == [{"name": "Docker Course"}]
+    assert recommendations["Rust"] == {"courses": [], "projects": [], "certifications": []}
+    
+    learning_recommendations(["Docker", "Rust"])
+    prompt = mock_llm.invoke.call_args.args[0][-1].content
+    assert "Docker" not in prompt
+    assert "Rust" in prompt
+
+
+@patch('career_path.graph.nodes._get_llm')
+def test_learning_path_lazy(mock_get_llm):
+    """Test lazy mode returns gaps only without an LLM call."""
+    state = {
+        "skill_gaps": [{"skill": "AWS", "priority": "high", "time_months": 3}],
+        "lazy_recommendations": True
+    }
+    result = learning_path_node(state)
+    
+    assert result["courses"] == []
+    assert result["workflow_status"] == "learning_path_deferred"
+    mock_get_llm.assert_not_called()
+
+
+@patch('career_path.graph.nodes._get_llm')
+def test_skill_recommendations_cached_per_skill(mock_get_llm):
+    """Test one skill is fetched once and shared across casing."""
+    mock_llm = Mock()
+    mock_llm.invoke.return_value = Mock(content='{"courses": [{"name": "K8s Course"}], "projects": []}')
+    mock_get_llm.return_value = mock_llm
+    
+    with patch('career_path.graph.nodes.response_cache', ResponseCache(ttl_minutes=1)):
+        first, first_cached = skill_recommendations("Kubernetes")
+        second, second_cached = skill_recommendations("kubernetes ")
+    
+    assert first == {"courses": [{"name": "K8s Course"}], "projects": [], "certifications": []}
+    assert second == first
+    assert (first_cached, second_cached) == (False, True)
+    assert mock_llm.invoke.call_count == 1
+    assert "Kubernetes" in mock_llm.invoke.call_args.args[0][-1].content
+
+
 @patch('career_path.graph.nodes._get_llm')
 def test_learning_path_error(mock_get_llm):
     """Test learning path with error."""
@@ -195,6 +651,17 @@ def test_learning_path_error(mock_get_llm):
     assert "error" in result
 
 
+@patch('career_path.graph.nodes._get_llm')
+def test_critical_review_deferred(mock_get_llm):
+    """Test a deferred review skips the LLM call."""
+    from career_path.graph.nodes import critical_review_node
+    
+    result = critical_review_node({"current_skills": ["Python"], "target_jobs": ["SRE"], "defer_review": True})
+    
+    assert result == {"critical_review": {}, "workflow_status": "review_deferred"}
+    mock_get_llm.assert_not_called()
+
+
 def test_roadmap_generator():
     """Test roadmap generation."""
     state = {
@@ -223,3 +690,56 @@ def test_roadmap_generator_no_gaps():
     result = roadmap_generator_node(state)
     
     assert len(result["nodes"]) == 2  # current and target only
+
+
+def test_gap_analysis_uses_skill_ids_from_state():
+    """Test vocabulary IDs in state are used without re-normalizing."""
+    python, aws = skill_vocabulary.get("python"), skill_vocabulary.get("aws")
+    state = {
+        "current_skills": ["Python"],
+        "current_skill_ids": [python],
+        "required_skills": {"Engineer": ["Python 3", "AWS"]},
+        # Encoded as Python: the IDs, not the names, are matched
+        "required_skill_ids": {"Engineer": [python, aws]},
+        "skill_vocabulary": skill_vocabulary.version
+    }
+    result = gap_analysis_node(state)
+    
+    assert result["matched_skills"] == ["Python 3"]
+    assert [gap["skill"] for gap in result["skill_gaps"]] == ["AWS"]
+    
+    # IDs from another vocabulary version are ignored
+    result = gap_analysis_node({**state, "skill_vocabulary": "old"})
+    assert result["matched_skills"] == []
+
+
+def test_job_parser_reencodes_stale_resume_ids():
+    """Test IDs left by an older vocabulary are re-encoded with the new ones."""
+    state = {
+        "target_jobs": ["Engineer"],
+        "required_skills": {"Engineer": ["AWS"]},
+        "current_skills": ["Python"],
+        "current_skill_ids": [12345],
+        "skill_vocabulary": "old"
+    }
+    result = job_parser_node(state)
+    
+    assert result["current_skill_ids"] == [skill_vocabulary.get("python")]
+    assert result["required_skill_ids"] == {"Engineer": [skill_vocabulary.get("aws")]}
+    assert result["skill_vocabulary"] == skill_vocabulary.version
+
+
+def test_gap_analysis_matches_across_jobs():
+    """Test skills are matched by canonical name across jobs."""
+    state = {
+        "current_skills": ["Python"],
+        "required_skills": {
+            "Engineer": ["python", "AWS"],
+            "Architect": ["AWS ", "Terraform"]
+        }
+    }
+    result = gap_analysis_node(state)
+    
+    assert [gap["skill"] for gap in result["skill_gaps"]] == ["AWS", "Terraform"]
+    assert result["matched_skills"] == ["python"]
+    assert result["fit_score"] == 33
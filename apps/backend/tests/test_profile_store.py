@@ -0,0 +1,45 @@
+"""Tests for the resume profile store."""
+
+import pytest
+
+from career_path.cache import ResponseCache
+from career_path.profile_store import ProfileStore, normalize_resume, profile_key
+
+PROFILE = {"current_skills": ["Python"], "experience_years": {"Python": 5}, "strengths": ["Ownership"]}
+
+
+@pytest.fixture
+def store():
+    """Create a fresh profile store."""
+    return ProfileStore(ResponseCache(ttl_minutes=1, max_entries=10))
+
+
+def test_normalize_resume_ignores_whitespace_and_case():
+    """Test cosmetic edits normalize to the same text."""
+    assert normalize_resume("  Senior  Engineer\n\nPython ") == normalize_resume("senior engineer python")
+
+
+def test_profile_key_scoped_by_user():
+    """Test the same resume has different keys per user."""
+    assert profile_key("resume", "alice") != profile_key("resume", "bob")
+    assert profile_key("Resume ", "alice") == profile_key("resume", "alice")
+
+
+def test_save_and_get(store):
+    """Test a saved profile is returned for the same resume."""
+    store.save("Senior Engineer, Python", "alice", {**PROFILE, "workflow_status": "resume_analyzed"})
+    
+    assert store.get("senior engineer,  python", "alice") == PROFILE
+    assert store.get("Senior Engineer, Python", "bob") is None
+
+
+def test_stats_count_hits_and_misses(store):
+    """Test hit/miss counters."""
+    store.get("resume", "alice")
+    store.save("resume", "alice", PROFILE)
+    store.get("resume", "alice")
+    
+    stats = store.get_stats()
+    assert stats["hits"] == 1
+    assert stats["misses"] == 1
+    assert stats["total_entries"] == 1
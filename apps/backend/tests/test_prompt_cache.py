@@ -0,0 +1,152 @@
+"""Tests for prompt-prefix caching."""
+
+import json
+from unittest.mock import patch
+
+import boto3
+import pytest
+from langchain_aws import ChatBedrock
+
+from career_path.budgets import OutputBudget
+from career_path.graph.nodes import (
+    CRITICAL_REVIEW_SYSTEM,
+    LEARNING_PATH_SYSTEM,
+    _use_prompt_cache,
+    critical_review_node,
+)
+from career_path.graph.schemas import CriticalReview, LearningRecommendations
+from career_path.model_config import get_model_config
+from career_path.prompt_cache import PromptCacheStats, prompt_cache_min_tokens, system_prompt
+
+SONNET = "us.anthropic.claude-sonnet-4-5-20250929-v1:0"
+OPUS_4_5 = "global.anthropic.claude-opus-4-5-20251101-v1:0"
+HAIKU_3 = "anthropic.claude-3-haiku-20240307-v1:0"
+
+STATE = {
+    "current_skills": ["Python"],
+    "experience_years": {"Backend": 5},
+    "strengths": ["Ownership"],
+    "target_jobs": ["Cloud Engineer"],
+    "fit_score": 40,
+    "skill_gaps": [{"skill": "AWS"}],
+}
+
+
+def _events(review):
+    """Bedrock stream events for a forced tool call with cache usage."""
+    args = json.dumps(review)
+    return [
+        {"type": "message_start", "message": {"usage": {"input_tokens": 80}}},
+        {"type": "content_block_start", "index": 0,
+         "content_block": {"type": "tool_use", "id": "t1", "name": "CriticalReview", "input": {}}},
+        {"type": "content_block_delta", "index": 0, "delta": {"type": "input_json_delta", "partial_json": args[:10]}},
+        {"type": "content_block_delta", "index": 0, "delta": {"type": "input_json_delta", "partial_json": args[10:]}},
+        {"type": "content_block_stop", "index": 0},
+        {"type": "message_delta", "delta": {"stop_reason": "tool_use"}, "usage": {"output_tokens": 40}},
+        {"type": "message_stop", "amazon-bedrock-invocationMetrics": {
+            "inputTokenCount": 80, "outputTokenCount": 40,
+            "cacheReadInputTokenCount": 1500, "cacheWriteInputTokenCount": 0
+        }},
+    ]
+
+
+@pytest.fixture
+def stub_bedrock(monkeypatch):
+    """ChatBedrock factory whose client records requests and consumed events."""
+    monkeypatch.setenv("AWS_ACCESS_KEY_ID", "test")
+    monkeypatch.setenv("AWS_SECRET_ACCESS_KEY", "test")
+    requests = []
+    consumed = []
+    client = boto3.client("bedrock-runtime", region_name="us-east-1")
+    
+    def invoke_stream(**kwargs):
+        requests.append(json.loads(kwargs["body"]))
+        events = _events({"overallRating": 6, "summary": "Close"})
+        
+        def body():
+            for event in events:
+                consumed.append(event["type"])
+                yield {"chunk": {"bytes": json.dumps(event).encode()}}
+        return {"body": body()}
+    
+    client.invoke_model_with_response_stream = invoke_stream
+    
+    def get_llm(model_id):
+        return lambda agent_name, max_tokens: ChatBedrock(
+            model_id=model_id, client=client, model_kwargs={"max_tokens": max_tokens}
+        )
+    
+    return get_llm, requests, consumed
+
+
+def test_prompt_cache_min_tokens():
+    """Test cache minimums per model family."""
+    assert prompt_cache_min_tokens(SONNET) == 1024
+    assert prompt_cache_min_tokens(OPUS_4_5) == 4096
+    assert prompt_cache_min_tokens(HAIKU_3) is None
+
+
+def test_system_prompt_marks_system_block():
+    """Test the checkpoint sits on the system block only."""
+    system, human = system_prompt("static", "dynamic", cache=True)
+    
+    assert system.content == [{"type": "text", "text": "static", "cache_control": {"type": "ephemeral"}}]
+    assert human.content == "dynamic"
+    assert "cache_control" not in system_prompt("static", "dynamic")[0].content[0]
+
+
+def test_stats_ratio():
+    """Test cache reads are summed and reported as a share of input."""
+    stats = PromptCacheStats()
+    stats.record("review", {"input_tokens": 100, "input_token_details": {"cache_read": 900}})
+    stats.record("review", None)
+    
+    assert stats.get_stats() == {"review": {
+        "calls": 2, "input_tokens": 100, "cache_read_tokens": 900,
+        "cache_write_tokens": 0, "cache_read_ratio": 0.9
+    }}
+
+
+@pytest.mark.parametrize("mode", ["OPTIMIZED", "PREMIUM"])
+def test_system_prompt_is_cached_on_configured_models(stub_bedrock, mode):
+    """Test the real system prompt is cached on the models each mode uses."""
+    get_llm, requests, consumed = stub_bedrock
+    stats = PromptCacheStats()
+    with patch('career_path.graph.nodes._get_llm', side_effect=get_llm(get_model_config(mode).critical_review)), \
+         patch('career_path.graph.nodes.prompt_cache_stats', stats), \
+         patch('career_path.graph.nodes.output_budget', OutputBudget({"critical_review": 700})):
+        result = critical_review_node(STATE)
+    
+    assert result["critical_review"] == {"overallRating": 6.0, "summary": "Close"}
+    (body,) = requests
+    assert body["system"] == [
+        {"type": "text", "text": CRITICAL_REVIEW_SYSTEM, "cache_control": {"type": "ephemeral"}}
+    ]
+    (message,) = body["messages"]
+    assert "Python" in str(message["content"]) and "cache_control" not in str(message["content"])
+    assert body["tools"][0]["name"] == "CriticalReview"
+    assert body["tool_choice"] == {"type": "tool", "name": "CriticalReview"}
+    assert body["max_tokens"] == 700
+    assert stats.get_stats()["critical_review"]["cache_read_tokens"] == 1500
+    assert consumed[-1] == "message_stop"
+
+
+def test_system_prompts_are_cacheable():
+    """Test both system prompts reach the Opus 4.5 minimum with their tool schemas."""
+    llm = ChatBedrock(model_id=OPUS_4_5, region_name="us-east-1")
+    
+    assert _use_prompt_cache(llm, LEARNING_PATH_SYSTEM, LearningRecommendations)
+    assert _use_prompt_cache(llm, CRITICAL_REVIEW_SYSTEM, CriticalReview)
+
+
+def test_request_shape_without_cache_support(stub_bedrock):
+    """Test models without prompt caching get the system prompt without a checkpoint."""
+    get_llm, requests, consumed = stub_bedrock
+    stats = PromptCacheStats()
+    with patch('career_path.graph.nodes._get_llm', side_effect=get_llm(HAIKU_3)), \
+         patch('career_path.graph.nodes.prompt_cache_stats', stats):
+        critical_review_node(STATE)
+    
+    assert requests[0]["system"] == [{"type": "text", "text": CRITICAL_REVIEW_SYSTEM}]
+    assert "message_stop" not in consumed
+    assert stats.get_stats() == {}
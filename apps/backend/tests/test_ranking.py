@@ -0,0 +1,99 @@
+"""Tests for candidate ranking."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from career_path.cache import ResponseCache
+from career_path.profile_store import ProfileStore
+from career_path.ranking import RANKING_USER, rank_candidates
+
+RESUMES = {
+    "alice": "Alice resume: Python, AWS, Docker",
+    "bob": "Bob resume: Python",
+    "carol": "Carol resume: Kubernetes, Docker, AWS, Terraform",
+}
+SKILLS = {
+    RESUMES["alice"]: ["Python", "AWS", "Docker"],
+    RESUMES["bob"]: ["Python"],
+    RESUMES["carol"]: ["Kubernetes", "Docker", "AWS", "Terraform"],
+}
+
+
+def _fake_resume_analysis(agent_name, prompt, **kwargs):
+    (text,) = [text for text in SKILLS if text in prompt]
+    return {"skills": SKILLS[text]}
+
+
+def _fake_job_parser(state):
+    required = {
+        "Backend Engineer": ["Python", "AWS"],
+        "Platform Engineer": ["Kubernetes", "Docker", "Terraform"],
+    }
+    return {"required_skills": {job: required[job] for job in state["target_jobs"]}}
+
+
+@pytest.fixture
+def store():
+    """Empty profile store shared by ranking and the resume analyzer."""
+    store = ProfileStore(ResponseCache())
+    with patch('career_path.ranking.profile_store', store), \
+         patch('career_path.graph.nodes.profile_store', store):
+        yield store
+
+
+@pytest.fixture
+def candidates():
+    return [{"candidate_id": cid, "resume_text": text} for cid, text in RESUMES.items()]
+
+
+@patch('career_path.ranking.job_parser_node', side_effect=_fake_job_parser)
+@patch('career_path.graph.nodes._invoke_json', side_effect=_fake_resume_analysis)
+def test_rank_candidates(mock_resume, mock_jobs, store, candidates):
+    """Test N x M fit matrix and top-k rankings."""
+    result = asyncio.run(rank_candidates(
+        candidates,
+        ["Backend Engineer", "Platform Engineer"],
+        top_k=2
+    ))
+    
+    assert result["fit_matrix"] == [[100, 33], [50, 0], [50, 100]]
+    backend = result["rankings"]["Backend Engineer"]
+    assert [r["candidate_id"] for r in backend] == ["alice", "bob"]
+    platform = result["rankings"]["Platform Engineer"]
+    assert platform[0] == {"candidate_id": "carol", "fit_score": 100, "missing_skills": []}
+    assert platform[1]["missing_skills"] == ["kubernetes", "terraform"]
+    
+    # Job parsing happens once for all jobs; one extraction per resume
+    assert mock_jobs.call_count == 1
+    assert mock_resume.call_count == 3
+
+
+@patch('career_path.ranking.job_parser_node', side_effect=_fake_job_parser)
+@patch('career_path.graph.nodes._invoke_json', side_effect=_fake_resume_analysis)
+def test_rank_candidates_uses_profile_store(mock_resume, mock_jobs, store, candidates):
+    """Test analyses are stored under the ranking owner and reused across batches."""
+    asyncio.run(rank_candidates(candidates, ["Backend Engineer"]))
+    result = asyncio.run(rank_candidates(candidates, ["Backend Engineer"]))
+    
+    assert mock_resume.call_count == 3
+    assert result["cache"] == {"hits": 3, "misses": 0}
+    assert store.get(RESUMES["alice"], RANKING_USER)["current_skills"] == SKILLS[RESUMES["alice"]]
+    assert store.get(RESUMES["alice"]) is None  # Not visible as a user's profile
+
+
+@patch('career_path.ranking.job_parser_node', side_effect=_fake_job_parser)
+@patch('career_path.graph.nodes._invoke_json', side_effect=ValueError("LLM error"))
+def test_rank_candidates_extraction_error(mock_resume, mock_jobs, store):
+    """Test failed extractions are reported and not stored."""
+    candidates = [
+        {"candidate_id": "a", "resume_text": "same resume"},
+        {"candidate_id": "b", "resume_text": "same resume"},
+    ]
+    
+    result = asyncio.run(rank_candidates(candidates, ["Backend Engineer"]))
+    
+    assert mock_resume.call_count == 1  # duplicate resumes extracted once
+    assert result["errors"] == {"a": "LLM error", "b": "LLM error"}
+    assert store.get("same resume", RANKING_USER) is None
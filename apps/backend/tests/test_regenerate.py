@@ -0,0 +1,94 @@
+"""Tests for partial roadmap regeneration."""
+
+from unittest.mock import Mock, patch
+
+import pytest
+
+from career_path.cache import ResponseCache
+from career_path.graph.regenerate import plan_regeneration, regenerate
+from career_path.graph.state import create_initial_state
+from career_path.graph.workflow import create_workflow
+from career_path.profile_store import ProfileStore
+
+DOWNSTREAM = ["gap_analysis", "learning_path", "critical_review", "roadmap_generator"]
+
+
+def test_plan_target_jobs_change():
+    """Test a job change skips resume analysis."""
+    assert plan_regeneration({"target_jobs"}) == ["job_parser", *DOWNSTREAM]
+
+
+def test_plan_resume_change():
+    """Test a resume change skips job parsing."""
+    assert plan_regeneration({"resume_text"}) == ["resume_analyzer", *DOWNSTREAM]
+
+
+def test_plan_nothing_changed():
+    """Test an empty patch re-runs nothing."""
+    assert plan_regeneration(set()) == []
+
+
+@pytest.fixture
+def llm_calls():
+    """Patch the LLM with canned responses and record prompts per agent."""
+    calls = []
+    
+    def get_llm(agent_name, max_tokens=None):
+        def invoke(prompt):
+            calls.append((agent_name, prompt))
+            if agent_name == "resume_analyzer":
+                return Mock(content='{"skills": ["Python"], "experience": {}, "strengths": []}')
+            if agent_name == "job_parser":
+                return Mock(content='{"required": ["Python", "Kubernetes"]}')
+            return Mock(content='{}')
+        return Mock(invoke=invoke)
+    
+    with patch('career_path.graph.nodes._get_llm', side_effect=get_llm), \
+         patch('career_path.graph.nodes.profile_store', ProfileStore(ResponseCache(ttl_minutes=1))):
+        yield calls
+
+
+def _finished_run(target_jobs):
+    state = create_initial_state("Backend engineer with Python experience", target_jobs)
+    return create_workflow().invoke(state)
+
+
+def test_adding_one_job_parses_only_that_job(llm_calls):
+    """Test a one-job addition costs one job_parser call plus downstream nodes."""
+    previous = _finished_run(["Cloud Engineer"])
+    llm_calls.clear()
+    
+    state, plan = regenerate(previous, {"target_jobs": ["Cloud Engineer", "Platform Engineer"]})
+    
+    agents = [agent for agent, _ in llm_calls]
+    assert plan == ["job_parser", *DOWNSTREAM]
+    assert agents.count("job_parser") == 1
+    assert "Platform Engineer" in llm_calls[agents.index("job_parser")][1]
+    assert "resume_analyzer" not in agents
+    assert list(state["required_skills"]) == ["Cloud Engineer", "Platform Engineer"]
+    assert set(state["job_fit_scores"]) == {"Cloud Engineer", "Platform Engineer"}
+    assert state["profile_cache_hit"] is True
+
+
+def test_specialty_change_reparses_all_jobs(llm_calls):
+    """Test specialty_info invalidates every parsed job."""
+    previous = _finished_run(["Cloud Engineer", "Platform Engineer"])
+    llm_calls.clear()
+    
+    state, plan = regenerate(previous, {"specialty_info": "Focus on AWS"})
+    
+    agents = [agent for agent, _ in llm_calls]
+    assert agents.count("job_parser") == 2
+    assert "resume_analyzer" not in agents
+
+
+def test_unchanged_patch_reuses_everything(llm_calls):
+    """Test a patch with the same values re-runs nothing."""
+    previous = _finished_run(["Cloud Engineer"])
+    llm_calls.clear()
+    
+    state, plan = regenerate(previous, {"target_jobs": ["Cloud Engineer"]})
+    
+    assert plan == []
+    assert llm_calls == []
+    assert state["nodes"] == previous["nodes"]
@@ -0,0 +1,70 @@
+"""Tests for deferred critical reviews."""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+from career_path.cache import ResponseCache
+from career_path.reviews import ReviewStore, review_fingerprint
+
+STATE = {
+    "current_skills": ["Python"],
+    "experience_years": {"Python": 5},
+    "strengths": ["Ownership"],
+    "target_jobs": ["Cloud Engineer"],
+    "fit_score": 50,
+    "skill_gaps": [{"skill": "AWS"}],
+    "defer_review": True,
+}
+
+
+@pytest.fixture
+def store():
+    """Create a fresh review store."""
+    return ReviewStore(ResponseCache(ttl_minutes=1))
+
+
+def test_fingerprint_ignores_unrelated_fields():
+    """Test roadmaps with the same profile and gaps share a review."""
+    assert review_fingerprint(STATE) == review_fingerprint({**STATE, "courses": [{"name": "x"}]})
+    assert review_fingerprint(STATE) != review_fingerprint({**STATE, "fit_score": 60})
+
+
+def test_start_computes_and_caches(store):
+    """Test the review runs once in the background and is cached."""
+    calls = []
+    
+    def review(state):
+        calls.append(state)
+        return {"critical_review": {"overallRating": 7}}
+    
+    async def run():
+        with patch('career_path.reviews.critical_review_node', side_effect=review):
+            fingerprint = store.start(STATE)
+            assert store.start(STATE) == fingerprint  # Attaches to the in-flight run
+            assert store.get(fingerprint) is None
+            await asyncio.sleep(0.05)
+            return fingerprint
+    
+    fingerprint = asyncio.run(run())
+    
+    assert store.get(fingerprint) == {"overallRating": 7}
+    assert len(calls) == 1
+    assert calls[0]["defer_review"] is False
+    assert store.get_stats()["in_flight"] == 0
+
+
+def test_failed_review_not_cached(store):
+    """Test a failed review can be retried."""
+    async def run():
+        with patch('career_path.reviews.critical_review_node',
+                   return_value={"critical_review": {"summary": "Review unavailable"}, "error": "timeout"}):
+            fingerprint = store.start(STATE)
+            await asyncio.sleep(0.05)
+            return fingerprint
+    
+    fingerprint = asyncio.run(run())
+    
+    assert store.get(fingerprint) is None
+    assert store.get_stats()["in_flight"] == 0
@@ -0,0 +1,56 @@
+"""Tests for the content-addressed roadmap store."""
+
+import pytest
+
+from career_path.cache import ResponseCache
+from career_path.roadmap_store import RoadmapStore, etag_matches, roadmap_id_for
+
+
+@pytest.fixture
+def store():
+    """Create a fresh roadmap store."""
+    return RoadmapStore(ResponseCache(ttl_minutes=1, max_entries=10))
+
+
+def test_save_is_content_addressed(store):
+    """Test identical roadmaps share an id and different ones don't."""
+    id1 = store.save({"fit_score": 50, "nodes": []})
+    id2 = store.save({"nodes": [], "fit_score": 50})
+    id3 = store.save({"fit_score": 51, "nodes": []})
+    
+    assert id1 == id2
+    assert id1 != id3
+
+
+def test_get_returns_roadmap_with_id(store):
+    """Test stored roadmaps carry their id."""
+    roadmap_id = store.save({"fit_score": 50})
+    
+    assert store.get(roadmap_id) == {"fit_score": 50, "roadmap_id": roadmap_id}
+    assert store.get("missing") is None
+
+
+def test_roadmap_id_ignores_existing_id():
+    """Test the id is computed over content only."""
+    assert roadmap_id_for({"a": 1}) == roadmap_id_for({"a": 1, "roadmap_id": "x"})
+
+
+def test_state_is_bound_to_inputs(store):
+    """Test identical roadmaps from different users keep separate state."""
+    roadmap = {"fit_score": 50, "nodes": []}
+    alice = store.save(roadmap, {"resume_text": "Alice resume", "user_id": "alice", "fit_score": 50})
+    bob = store.save(roadmap, {"resume_text": "Bob resume", "user_id": "bob", "fit_score": 50})
+    
+    assert alice != bob
+    assert store.get_state(alice)["resume_text"] == "Alice resume"
+    assert store.get_state(bob)["resume_text"] == "Bob resume"
+    assert store.get(alice) == {**roadmap, "roadmap_id": alice}
+
+
+def test_etag_matches():
+    """Test If-None-Match parsing."""
+    assert etag_matches('"abc"', '"abc"')
+    assert etag_matches('"x", W/"abc"', '"abc"')
+    assert etag_matches("*", '"abc"')
+    assert not etag_matches('"x"', '"abc"')
+    assert not etag_matches(None, '"abc"')
@@ -0,0 +1,85 @@
+"""Tests for priority and weighted-fair scheduling."""
+
+import asyncio
+
+import pytest
+
+from career_path.scheduler import BATCH, INTERACTIVE, FairScheduler
+
+
+def _drain(scheduler):
+    async def run():
+        return [await scheduler.get() for _ in range(scheduler.qsize())]
+    return asyncio.run(run())
+
+
+def test_interactive_before_batch():
+    """Test interactive jobs are dispatched ahead of queued batch jobs."""
+    scheduler = FairScheduler()
+    for i in range(3):
+        scheduler.put_nowait(f"b{i}", "bulk", BATCH)
+    scheduler.put_nowait("i0", "alice", INTERACTIVE)
+    
+    assert _drain(scheduler) == ["i0", "b0", "b1", "b2"]
+
+
+def test_fair_share_across_users():
+    """Test one user's backlog interleaves with other users' jobs."""
+    scheduler = FairScheduler()
+    for i in range(5):
+        scheduler.put_nowait(f"big{i}", "big", BATCH)
+    scheduler.put_nowait("small0", "small", BATCH)
+    scheduler.put_nowait("small1", "small", BATCH)
+    
+    order = _drain(scheduler)
+    
+    assert order.index("small0") <= 1
+    assert order.index("small1") <= 3
+
+
+def test_weights():
+    """Test a heavier user gets proportionally more dispatches."""
+    scheduler = FairScheduler(weights={"gold": 2.0})
+    for i in range(6):
+        scheduler.put_nowait(("gold", i), "gold", BATCH)
+        scheduler.put_nowait(("free", i), "free", BATCH)
+    
+    first_six = _drain(scheduler)[:6]
+    
+    assert sum(1 for user, _ in first_six if user == "gold") == 4
+
+
+def test_batch_not_starved():
+    """Test a waiting batch job gets through after an interactive burst."""
+    scheduler = FairScheduler(max_interactive_burst=2)
+    scheduler.put_nowait("b0", "bulk", BATCH)
+    for i in range(4):
+        scheduler.put_nowait(f"i{i}", f"user{i}", INTERACTIVE)
+    
+    assert _drain(scheduler) == ["i0", "i1", "b0", "i2", "i3"]
+
+
+def test_stats():
+    """Test per-class depth and wait metrics."""
+    scheduler = FairScheduler()
+    scheduler.put_nowait("a", "u1", INTERACTIVE)
+    scheduler.put_nowait("b", "u2", BATCH)
+    scheduler.put_nowait("c", "u3", BATCH)
+    
+    stats = scheduler.get_stats()
+    assert stats[INTERACTIVE]["depth"] == 1
+    assert stats[BATCH]["users_waiting"] == 2
+    
+    _drain(scheduler)
+    stats = scheduler.get_stats()
+    assert stats[BATCH]["dispatched"] == 2
+    assert stats[BATCH]["wait_seconds"]["max"] >= 0
+
+
+def test_unknown_class_rejected():
+    """Test invalid job classes and weights."""
+    scheduler = FairScheduler()
+    with pytest.raises(ValueError):
+        scheduler.put_nowait("x", "u", "urgent")
+    with pytest.raises(ValueError):
+        scheduler.set_weight("u", 0)
@@ -0,0 +1,43 @@
+"""Tests for node output schemas."""
+
+import pytest
+from pydantic import ValidationError
+
+from career_path.graph.schemas import CriticalReview, LearningRecommendations, ResumeAnalysis
+
+
+def test_resume_analysis_coerces_years():
+    """Test numeric strings are accepted as years of experience."""
+    result = ResumeAnalysis.model_validate({"skills": ["Python"], "experience": {"Backend": "5"}})
+    assert result.experience == {"Backend": 5.0}
+
+
+def test_resume_analysis_rejects_wrong_types():
+    """Test a mis-shaped answer fails validation."""
+    with pytest.raises(ValidationError):
+        ResumeAnalysis.model_validate({"skills": "Python, AWS"})
+
+
+def test_learning_recommendations_keys_single_skill():
+    """Test an unwrapped answer is keyed under the only requested skill."""
+    data = {"courses": [{"name": "K8s Course"}]}
+    result = LearningRecommendations.model_validate(data, context={"skills": ["Kubernetes"]})
+    
+    assert result.model_dump(exclude_unset=True) == {"Kubernetes": {"courses": [{"name": "K8s Course"}]}}
+
+
+def test_learning_recommendations_keyed():
+    """Test keyed answers validate each skill's resources."""
+    data = {"AWS": {"courses": [{"name": "AWS Course"}]}, "Go": {"projects": [{"name": "CLI"}]}}
+    result = LearningRecommendations.model_validate(data, context={"skills": ["AWS", "Go"]})
+    
+    assert set(result.root) == {"AWS", "Go"}
+    with pytest.raises(ValidationError):
+        LearningRecommendations.model_validate({"AWS": {"courses": [{"provider": "x"}]}})
+
+
+def test_critical_review_defaults():
+    """Test missing review fields get defaults."""
+    review = CriticalReview.model_validate({"overallRating": 8})
+    assert review.summary == ""
+    assert review.actionableSteps == []
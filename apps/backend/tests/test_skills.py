@@ -0,0 +1,90 @@
+"""Tests for skill interning."""
+
+import pytest
+
+from career_path.skills import (
+    UNKNOWN_SKILL,
+    SkillTable,
+    SkillVocabulary,
+    canonical_skill,
+    skill_vocabulary,
+)
+
+
+@pytest.fixture
+def table():
+    """Create a fresh skill table."""
+    return SkillTable()
+
+
+def test_canonical_skill():
+    """Test canonical skill normalization."""
+    assert canonical_skill("  Python ") == "python"
+    assert canonical_skill("AWS") == "aws"
+
+
+def test_intern_same_skill_same_id(table):
+    """Test that casing and whitespace variants share an ID."""
+    assert table.intern("Python") == table.intern("  python ")
+    assert table.intern("Python") != table.intern("AWS")
+    assert len(table) == 2
+
+
+def test_intern_ids_are_dense(table):
+    """Test that IDs are small consecutive integers."""
+    ids = table.intern_many(["Python", "AWS", "Docker", "aws"])
+    assert ids == [0, 1, 2, 1]
+
+
+def test_materialize(table):
+    """Test converting IDs back to canonical names."""
+    ids = table.intern_many(["Python", "AWS"])
+    assert table.materialize(ids) == ["python", "aws"]
+    assert table.lookup(ids[1]) == "aws"
+
+
+def test_get_does_not_intern(table):
+    """Test lookup without interning."""
+    assert table.get("Kubernetes") is None
+    assert len(table) == 0
+    
+    skill_id = table.intern("Kubernetes")
+    assert table.get("KUBERNETES") == skill_id
+
+
+def test_vocabulary_ids_are_stable():
+    """Test every process assigns the same IDs to the same skills."""
+    first = SkillVocabulary(["Python", "AWS", "Docker"])
+    second = SkillVocabulary(["docker", " aws", "PYTHON"])
+    
+    assert first.encode(["Docker", "Go"]) == [1, UNKNOWN_SKILL]
+    assert first.version == second.version
+    assert first.version != SkillVocabulary(["Python"]).version
+
+
+def test_vocabulary_covers_taxonomy_aliases():
+    """Test the shared vocabulary is seeded with taxonomy names and aliases."""
+    assert skill_vocabulary.get("python") is not None
+    assert skill_vocabulary.get("apache airflow") is not None
+
+
+def test_table_overflow_ids_follow_vocabulary():
+    """Test skills outside the vocabulary get per-table IDs without growing it."""
+    vocabulary = SkillVocabulary(["Python", "AWS"])
+    table = SkillTable(vocabulary)
+    
+    assert table.intern_many(["aws", "Rust", "rust"]) == [0, 2, 2]
+    assert table.lookup(2) == "rust"
+    assert len(table) == 3
+    assert len(vocabulary) == 2
+    assert SkillTable(vocabulary).get("Rust") is None
+
+
+def test_intern_encoded_keeps_vocabulary_ids():
+    """Test encoded IDs are used as-is and only unknown skills are interned."""
+    vocabulary = SkillVocabulary(["Python", "AWS"])
+    table = SkillTable(vocabulary)
+    skills = ["AWS", "Rust"]
+    
+    assert table.intern_encoded(skills, vocabulary.encode(skills)) == [0, 2]
+    assert table.intern_encoded(skills, []) == [0, 2]  # Missing IDs are re-interned
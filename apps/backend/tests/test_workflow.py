@@ -1,7 +1,14 @@
 """Tests for workflow."""
 
+import json
+from unittest.mock import Mock, patch
+
 import pytest
+
+from career_path.cache import ResponseCache
+from career_path.graph.state import create_initial_state
 from career_path.graph.workflow import create_workflow
+from career_path.profile_store import ProfileStore
 
 
 def test_create_workflow():
@@ -19,3 +26,67 @@ def test_workflow_has_nodes():
     
     # The workflow should be a compiled graph
     assert workflow is not None
+
+
+def test_workflow_skips_resume_analysis_for_stored_profile():
+    """Test an unchanged resume goes straight to job parsing on the next run."""
+    calls = []
+    
+    def get_llm(agent_name, max_tokens=None):
+        calls.append(agent_name)
+        content = '{"skills": ["Python"], "experience": {}, "strengths": []}' \
+            if agent_name == "resume_analyzer" else '{"required": ["Python", "AWS"]}'
+        llm = Mock()
+        llm.invoke.return_value = Mock(content=content)
+        return llm
+    
+    workflow = create_workflow()
+    resume = "Backend engineer with five years of Python experience"
+    with patch('career_path.graph.nodes._get_llm', side_effect=get_llm), \
+         patch('career_path.graph.nodes.profile_store', ProfileStore(ResponseCache(ttl_minutes=1))):
+        first = workflow.invoke(create_initial_state(resume, ["Cloud Engineer"], user_id="alice"))
+        calls.clear()
+        second = workflow.invoke(create_initial_state(resume, ["Platform Engineer"], user_id="alice"))
+    
+    assert first["profile_cache_hit"] is False
+    assert second["profile_cache_hit"] is True
+    assert "resume_analyzer" not in calls
+    assert second["current_skills"] == ["Python"]
+    assert second["matched_skills"] == ["Python"]
+
+
+def test_fast_workflow_makes_one_llm_call():
+    """Test the fused workflow runs one LLM call and computes gaps locally."""
+    fused = {
+        "skills": ["Python", "Docker"],
+        "experience": {"Backend": 5},
+        "strengths": ["Ownership"],
+        "jobs": {"platform engineer": {"required": ["Python", "Kubernetes", "COBOL"], "nice_to_have": ["Go"]}},
+        "learning": {"COBOL": {"courses": [{"name": "COBOL Basics"}]}}
+    }
+    llm = Mock()
+    llm.invoke.return_value = Mock(content=json.dumps(fused))
+    
+    workflow = create_workflow(mode="fast")
+    with patch('career_path.graph.nodes._get_llm', return_value=llm) as mock_get_llm:
+        result = workflow.invoke(create_initial_state(
+            "Backend engineer with Python and Docker", ["Platform Engineer"], mode="fast"
+        ))
+    
+    assert mock_get_llm.call_count == 1
+    assert llm.invoke.call_count == 1
+    assert result["required_skills"] == {"Platform Engineer": ["Python", "Kubernetes", "COBOL"]}
+    assert result["matched_skills"] == ["Python"]
+    assert {gap["skill"] for gap in result["skill_gaps"]} == {"Kubernetes", "COBOL"}
+    # Catalog entry for Kubernetes, drafted suggestion for COBOL
+    course_names = [course["name"] for course in result["courses"]]
+    assert "COBOL Basics" in course_names
+    assert "Kubernetes Basics" in course_names
+    assert result["critical_review"] == {}
+    assert result["nodes"]
+
+
+def test_create_workflow_unknown_mode():
+    """Test an unknown mode is rejected."""
+    with pytest.raises(ValueError):
+        create_workflow(mode="turbo")